@@ -1,13 +1,26 @@
-import time      
+import os
+import sys
 import json     
+import logging
 from datetime import datetime
 import hashlib 
+import functools
+import itertools
+import threading
+from dataclasses import dataclass, asdict
+from typing import List, Optional
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 import requests # type: ignore
+from requests.adapters import HTTPAdapter # type: ignore
+from urllib.parse import urljoin, urldefrag, urlparse
 from selenium import webdriver # type: ignore
 from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
 from selenium.webdriver.support import expected_conditions as EC # type: ignore
 from selenium.webdriver.common.action_chains import ActionChains # type: ignore
+from selenium.webdriver.common.keys import Keys # type: ignore
 from selenium.common.exceptions import ( # type: ignore
     TimeoutException, 
     ElementClickInterceptedException,
@@ -18,18 +31,917 @@ from selenium.common.exceptions import ( # type: ignore
 from selenium.webdriver.chrome.options import Options # type: ignore
 from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException # type: ignore
 
+logger = logging.getLogger(__name__)
+
+# CSS selectors for potentially clickable elements
+CLICKABLE_SELECTORS = (
+    # Basic clickable elements
+    'a', 'button', 
+    'input[type="button"]', 'input[type="submit"]', 'input[type="reset"]',
+    
+    # Elements with interactive attributes
+    '[onclick]', '[onmousedown]', '[onmouseup]', '[ondblclick]',
+    
+    # ARIA roles
+    '[role="button"]', '[role="link"]', '[role="tab"]', '[role="menuitem"]',
+    '[role="option"]', '[role="treeitem"]', '[role="gridcell"]',
+    
+    # Focusable elements (potential clickables)
+    '[tabindex="0"]', '[tabindex="-1"]', 'div[tabindex]', 'span[tabindex]',
+    'li[tabindex]', 'td[tabindex]', 'th[tabindex]',
+    
+    # Common clickable classes and patterns
+    '.btn', '.button', '.link', '.clickable', '.click',
+    '.cta', '.call-to-action', '.action', '.trigger',
+    '.menu-item', '.nav-item', '.tab', '.accordion',
+    '.dropdown', '.select', '.picker', '.toggle',
+    '.card', '.tile', '.item', '.option',
+    '.close', '.cancel', '.submit', '.save', '.edit', '.delete',
+    '.expand', '.collapse', '.show', '.hide',
+    '.play', '.pause', '.stop', '.next', '.prev', '.previous',
+    '.like', '.share', '.favorite', '.bookmark',
+    '.download', '.upload', '.search', '.filter', '.sort',
+    
+    # Data attributes (modern web patterns)
+    '[data-action]', '[data-click]', '[data-href]', '[data-url]',
+    '[data-toggle]', '[data-target]', '[data-dismiss]',
+    '[data-testid*="button"]', '[data-testid*="link"]', '[data-testid*="click"]',
+    '[data-cy*="button"]', '[data-cy*="link"]', '[data-cy*="click"]',
+    
+    # Form controls that might be styled as buttons
+    'select', 'input[type="checkbox"]', 'input[type="radio"]',
+    'input[type="file"]', 'input[type="image"]',
+    
+    # Modern web components and custom elements
+    '[class*="btn"]', '[class*="button"]', '[class*="link"]',
+    '[class*="click"]', '[class*="action"]', '[class*="cta"]',
+    '[id*="btn"]', '[id*="button"]', '[id*="link"]', '[class="calculator-button active"]',
+    
+    # Media controls
+    'video[controls]', 'audio[controls]',
+    
+    # Interactive list items and table cells
+    'li[onclick]', 'td[onclick]', 'tr[onclick]',
+    'li[role="button"]', 'td[role="button"]', 'tr[role="button"]',
+    
+    # SVG elements that might be clickable
+    'svg[onclick]', 'svg[role="button"]',
+    
+    # Image maps and clickable images
+    'area', 'img[onclick]', 'img[role="button"]',
+    
+    # Custom interactive elements
+    'div[role="button"]', 'span[role="button"]',
+    'p[role="button"]', 'section[role="button"]',
+    
+    # Thumbnail overlay specifically
+    '.thumbnail__overlay'
+)
+
+# Header and footer exclusion selectors
+HEADER_FOOTER_SELECTORS = (
+    'header', 'nav', 'footer',
+    '.header', '.nav', '.footer', '.navigation',
+    '#header', '#nav', '#footer', '#navigation',
+    '[role="banner"]', '[role="navigation"]', '[role="contentinfo"]',
+    '.site-header', '.site-footer', '.page-header', '.page-footer',
+    '.main-header', '.main-footer', '.top-nav', '.bottom-nav',
+    '.navbar', '.nav-bar', '.site-nav', '.primary-nav'
+)
+
+# Containers that hold auto-scrolling carousels and banners
+CAROUSEL_SELECTORS = (
+    '.carousel', '.slider', '.banner-slider', '.swiper', '.slick',
+    '[data-ride="carousel"]', '.owl-carousel', '.hero-banner',
+    '.banner-container', '.slideshow', '.image-slider',
+    '.swiper-container', '.swiper-wrapper', '.glide', '.splide',
+    '.flickity', '.keen-slider', '.embla', '.tiny-slider',
+    '[data-carousel]', '[data-slider]', '[data-swiper]',
+    '.slide-container', '.carousel-container', '.slider-wrapper',
+    '.hero-slider', '.product-slider', '.testimonial-slider',
+    '.gallery-slider', '.content-slider', '.banner-carousel',
+    '.thumbnail__overlay'  # Added thumbnail overlay to carousel selectors
+)
+
+# Common slide selectors
+SLIDE_SELECTORS = (
+    '.carousel-item', '.slide', '.slider-item', '.swiper-slide',
+    '.slick-slide', '.banner-slide', '.owl-item', '[data-slide]',
+    '.glide__slide', '.splide__slide', '.flickity-cell',
+    '.keen-slider__slide', '.embla__slide', '.tns-item',
+    '.carousel-cell', '.slider-slide', '.slide-item',
+    # Generic selectors for custom implementations
+    '[class*="slide"]', '[data-slide-index]', '[data-slide-id]'
+)
+
+# Clickable elements inside a single slide
+SLIDE_CLICKABLE_SELECTORS = (
+    'a', 'button', '[onclick]', '[role="button"]', 'input[type="button"]',
+    'input[type="submit"]', '.btn', '.button', '.link', '.cta', '.call-to-action',
+    '[data-action]', '[data-click]', '[data-href]',
+    '.carousel-control', '.slider-nav', '.slide-nav',
+    '.prev', '.next', '.slide-btn', '.carousel-btn'
+)
+
+# Common action words found in the text of clickable slide elements
+ACTION_WORDS = (
+    'WATCH VIDEO', 'PLAY', 'SUBMIT', 'APPLY', 'START', 'LEARN MORE', 'READ MORE',
+    'VIEW', 'SEE MORE', 'CLICK HERE', 'DOWNLOAD', 'UPLOAD', 'NEXT', 'PREV', 'PREVIOUS'
+)
+# One XPath matching any action word, so a slide needs a single lookup
+ACTION_XPATH_UNION = ".//*[" + " or ".join(
+    f"contains(translate(text(), 'abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'), '{word}')"
+    for word in ACTION_WORDS
+) + "]"
+
+# Common selectors for main content areas
+MAIN_CONTENT_SELECTORS = (
+    'main',
+    '[role="main"]',
+    '#main',
+    '#content',
+    '#main-content',
+    '.main-content',
+    '.content',
+    '.page-content',
+    '.site-content'
+)
+
+# Header/footer indicators in class names and IDs
+HEADER_FOOTER_KEYWORDS = (
+    'header', 'nav', 'navigation', 'navbar', 'nav-bar', 'footer',
+    'site-header', 'site-footer', 'page-header', 'page-footer',
+    'main-header', 'main-footer', 'top-nav', 'bottom-nav',
+    'primary-nav', 'secondary-nav', 'breadcrumb'
+)
+
+# Class-name fragments that mark an element as part of a carousel
+CAROUSEL_KEYWORDS = (
+    'carousel', 'slider', 'banner-slider', 'swiper', 'slick',
+    'owl-carousel', 'hero-banner', 'banner-container', 'slideshow'
+)
+
+# Number of concurrent HEAD requests used to fill in link status codes
+STATUS_CHECK_WORKERS = 32
+# Number of distinct absolute URLs whose status chain is remembered
+STATUS_CACHE_SIZE = 2048
+
+# Quiet period with no finished network requests before a page counts as settled
+NETWORK_IDLE_MS = 500
+
+# Seconds to wait for a click to navigate, retitle the page or open UI
+CLICK_EFFECT_TIMEOUT = 2
+
+# UI that a click on an otherwise inert element may reveal
+MODAL_CSS = '.modal, .popup, .overlay, .dialog, [role="dialog"], [role="alertdialog"]'
+DROPDOWN_CSS = '.dropdown-menu, .menu-open, [aria-expanded="true"]'
+
+# Number of (url, page content) scans kept for repeat runs on unchanged pages
+PAGE_CACHE_SIZE = 64
+# Number of distinct class attribute strings whose split tokens are remembered
+CLASS_TOKEN_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=1)
+def _get_orjson():
+    """orjson, imported on first save so workers that never write files skip it; None if missing"""
+    try:
+        import orjson # type: ignore
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dump_json(data, compact=False):
+    """Encode results as UTF-8 JSON bytes, indented unless compact"""
+    orjson = _get_orjson()
+    if orjson is not None:
+        # Native encoder, serialises ElementInfo dataclasses directly
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=asdict).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False, default=asdict).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=CLASS_TOKEN_CACHE_SIZE)
+def _class_tokens(class_names):
+    """Interned class tokens of a class attribute; elements sharing a class list split it once"""
+    return tuple(map(sys.intern, class_names.split()))
+
+
+def _substring_fragments(keywords):
+    """Keywords not containing a shorter keyword, which already matches them as a substring"""
+    return tuple(keyword for keyword in keywords
+                 if not any(other != keyword and other in keyword for other in keywords))
+
+
+CLICKABLE_CSS = ', '.join(CLICKABLE_SELECTORS)
+# Inline handler and data attributes that mark an element as having listeners
+EVENT_LISTENER_CSS = '[onclick], [onmousedown], [onmouseup], [data-action], [data-click], [data-href]'
+HEADER_FOOTER_CSS = ', '.join(HEADER_FOOTER_SELECTORS)
+CAROUSEL_MEMBER_CSS = ', '.join(f'[class*="{keyword}"]' for keyword in _substring_fragments(CAROUSEL_KEYWORDS))
+# Header/footer membership: header/footer tags, landmark roles and
+# keyword fragments in class names or IDs. Only the fragments that are not
+# supersets of another are tested ('nav' already covers 'top-nav' and 'navbar')
+HEADER_FOOTER_MEMBER_CSS = ', '.join(
+    ['header', 'nav', 'footer']
+    + [f'[role="{role}"]' for role in ('banner', 'navigation', 'contentinfo')]
+    + [f'[class*="{keyword}" i], [id*="{keyword}" i]' for keyword in _substring_fragments(HEADER_FOOTER_KEYWORDS)]
+)
+# Any ancestor whose class contains a carousel keyword, or a Bootstrap carousel
+CAROUSEL_CONTAINER_CSS = CAROUSEL_MEMBER_CSS + ', [data-ride="carousel"]'
+CANDIDATE_EXCLUDED_CSS = ', '.join((HEADER_FOOTER_CSS, HEADER_FOOTER_MEMBER_CSS, CAROUSEL_MEMBER_CSS))
+
+# Selectors JS_SCAN_PAGE works from
+PAGE_SCAN_OPTIONS = {
+    'main_content': list(MAIN_CONTENT_SELECTORS),
+    'carousels': list(CAROUSEL_SELECTORS),
+    'header_footer': HEADER_FOOTER_MEMBER_CSS,
+    'clickable': CLICKABLE_CSS,
+    'excluded': CANDIDATE_EXCLUDED_CSS,
+    'listeners': EVENT_LISTENER_CSS,
+}
+
+# JavaScript sent to the browser, kept here so each call reuses the same string
+# Memo of computed styles and class names for one script call, so overlapping
+# traversals within it do not recompute them. It starts empty on every call:
+# carousels and page scripts toggle classes between scans of the same document
+JS_STYLE_CACHE = """
+    var styleCache = new WeakMap();
+    function cs(element) {
+        var cached = styleCache.get(element);
+        if (!cached) {
+            cached = {
+                style: window.getComputedStyle(element),
+                cls: element.getAttribute('class') || ''
+            };
+            styleCache.set(element, cached);
+        }
+        return cached;
+    }
+"""
+
+# Native ancestor match against CAROUSEL_CONTAINER_CSS, stopping below body
+JS_FIND_CAROUSEL_CONTAINER = """
+    var container = arguments[0].closest(arguments[1]);
+    return container && container !== document.body && container !== document.documentElement
+        ? container
+        : null;
+"""
+
+JS_PAUSE_CAROUSEL_PLUGIN = """
+    var carousel = arguments[0];
+    if (typeof jQuery !== 'undefined' && jQuery(carousel).carousel) {
+        jQuery(carousel).carousel('pause');
+    }
+    if (carousel.carousel && typeof carousel.carousel === 'function') {
+        carousel.carousel('pause');
+    }
+"""
+
+JS_PAUSE_CAROUSEL_ANIMATIONS = """
+    var carousel = arguments[0];
+    carousel.style.animationPlayState = 'paused';
+    carousel.style.webkitAnimationPlayState = 'paused';
+
+    // Pause all child animations
+    var children = carousel.querySelectorAll('*');
+    for (var i = 0; i < children.length; i++) {
+        children[i].style.animationPlayState = 'paused';
+        children[i].style.webkitAnimationPlayState = 'paused';
+    }
+"""
+
+JS_STOP_CAROUSEL_TIMERS = """
+    // Clear common slider intervals
+    if (window.sliderIntervals) {
+        window.sliderIntervals.forEach(clearInterval);
+    }
+
+    // Stop common slider libraries
+    var carousel = arguments[0];
+    if (carousel.swiper) {
+        carousel.swiper.autoplay.stop();
+    }
+    if (carousel.slick) {
+        jQuery(carousel).slick('slickPause');
+    }
+"""
+
+JS_LOOKS_LIKE_SLIDE = """
+    function looksLikeSlide(element) {
+        // Cheapest checks first, so innerText (which forces layout) is read last
+        var classNames = cs(element).cls.toLowerCase();
+        if (['slide', 'item', 'cell', 'panel', 'tab'].some(function(keyword) {
+                return classNames.includes(keyword);
+            })) {
+            return true;
+        }
+
+        // Typical slide content; querySelector stops at the first match
+        if (element.querySelector('img, a, button') !== null) {
+            return true;
+        }
+
+        // Slide-like dimensions or positioning
+        var inlineStyle = (element.getAttribute('style') || '').toLowerCase();
+        if (inlineStyle.includes('width:')) {
+            return true;
+        }
+        var style = cs(element).style;
+        if (['absolute', 'relative'].includes(style.position) ||
+            ['left', 'right'].includes(style.float) ||
+            ['flex', 'inline-block'].includes(style.display)) {
+            return true;
+        }
+
+        return (element.innerText || '').trim().length > 20;
+    }
+"""
+
+# Slide lookup for a carousel container in a single call: the first slide
+# selector (in priority order) with matches wins, then generic children that
+# look like slides, then the same check inside nested slide wrappers
+JS_FIND_SLIDES = JS_STYLE_CACHE + JS_LOOKS_LIKE_SLIDE + """
+    var container = arguments[0];
+    var slideSelectors = arguments[1];
+
+    function filterSlides(roots, selector) {
+        var seen = new Set();
+        var slides = [];
+        roots.forEach(function(root) {
+            root.querySelectorAll(selector).forEach(function(element) {
+                if (!seen.has(element) && looksLikeSlide(element)) {
+                    seen.add(element);
+                    slides.push(element);
+                }
+            });
+        });
+        return slides;
+    }
+
+    for (var i = 0; i < slideSelectors.length; i++) {
+        var found = container.querySelectorAll(slideSelectors[i]);
+        if (found.length) {
+            return Array.from(found);
+        }
+    }
+
+    var slides = filterSlides([container], 'div, section, article, li');
+    if (!slides.length) {
+        var nested = container.querySelectorAll('.swiper-wrapper, .slider-wrapper, .carousel-inner, .slides');
+        slides = filterSlides(Array.from(nested), 'div, li');
+    }
+    return slides;
+"""
+
+JS_SHOW_SLIDE = """
+    var slide = arguments[0];
+    var originalDisplay = slide.style.display;
+    var originalVisibility = slide.style.visibility;
+    var originalOpacity = slide.style.opacity;
+    var originalTransform = slide.style.transform;
+    var originalPosition = slide.style.position;
+
+    slide.style.display = 'block';
+    slide.style.visibility = 'visible';
+    slide.style.opacity = '1';
+    slide.style.transform = 'translateX(0px)';
+    slide.style.position = 'relative';
+    slide.style.zIndex = '1000';
+
+    // Store original values for restoration
+    slide.setAttribute('data-original-display', originalDisplay);
+    slide.setAttribute('data-original-visibility', originalVisibility);
+    slide.setAttribute('data-original-opacity', originalOpacity);
+    slide.setAttribute('data-original-transform', originalTransform);
+    slide.setAttribute('data-original-position', originalPosition);
+"""
+
+JS_SLIDE_LAID_OUT = "return arguments[0].getBoundingClientRect().width > 0;"
+
+# Path builders shared by the standalone lookups and the element info scripts
+JS_CSS_SELECTOR_FUNCTION = """
+    function getCssSelector(el) {
+        if (!(el instanceof Element)) return '';
+        var path = [];
+        while (el.nodeType === Node.ELEMENT_NODE) {
+            var selector = el.nodeName.toLowerCase();
+            if (el.id) {
+                selector += '#' + el.id;
+                path.unshift(selector);
+                break;
+            } else {
+                var sib = el, nth = 1;
+                while (sib = sib.previousElementSibling) {
+                    if (sib.nodeName.toLowerCase() == selector)
+                        nth++;
+                }
+                if (nth != 1)
+                    selector += ":nth-of-type(" + nth + ")";
+            }
+            path.unshift(selector);
+            el = el.parentNode;
+        }
+        return path.join(" > ");
+    }
+"""
+
+JS_XPATH_FUNCTION = """
+    function getXPath(element) {
+        if (element.id !== '') return '//*[@id="' + element.id + '"]';
+        if (element === document.body) return '/html/body';
+        var ix = 0;
+        var siblings = element.parentNode.childNodes;
+        for (var i = 0; i < siblings.length; i++) {
+            var sibling = siblings[i];
+            if (sibling === element) return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
+            if (sibling.nodeType === 1 && sibling.tagName === element.tagName) ix++;
+        }
+    }
+"""
+
+JS_HIDDEN_ELEMENT_INFO = JS_XPATH_FUNCTION + """
+    // The enclosing slide is already forced visible by JS_SHOW_SLIDE, and
+    // innerText falls back to the text content for anything still unrendered
+    var el = arguments[0];
+
+    // Mirror WebElement.get_attribute: prefer the DOM property when it is a string
+    var attr = function(name) {
+        var value = el[name];
+        return (typeof value === 'string' ? value : el.getAttribute(name)) || '';
+    };
+    var rect = el.getBoundingClientRect();
+    return {
+        tag_name: el.tagName.toLowerCase(),
+        text: (el.innerText || '').trim().slice(0, 100),
+        class_names: attr('class'),
+        id: attr('id'),
+        href: attr('href'),
+        onclick: attr('onclick'),
+        role: attr('role'),
+        type: attr('type'),
+        data_testid: attr('data-testid'),
+        aria_label: attr('aria-label'),
+        xpath: getXPath(el),
+        location: {
+            x: Math.round(rect.left + window.pageXOffset),
+            y: Math.round(rect.top + window.pageYOffset)
+        },
+        size: {
+            height: Math.round(rect.height),
+            width: Math.round(rect.width)
+        },
+        is_enabled: !el.disabled
+    };
+"""
+
+JS_DOCUMENT_COMPLETE = "return document.readyState === 'complete';"
+
+# Network idle, as Chrome's networkIdle lifecycle event defines it: the
+# document is complete and no resource has finished for arguments[0] ms.
+# Resource timing entries only appear once a request completes, so the
+# quiet window is what catches post-load XHRs in single-page apps
+JS_PAGE_SETTLED = """
+    if (document.readyState !== 'complete') {
+        return false;
+    }
+    var lastResponseEnd = performance.getEntriesByType('resource').reduce(function(latest, entry) {
+        return Math.max(latest, entry.responseEnd);
+    }, 0);
+    return performance.now() - lastResponseEnd >= arguments[0];
+"""
+
+# Number of elements matching the selector in arguments[0] that are showing
+JS_COUNT_DISPLAYED = """
+    return Array.prototype.filter.call(document.querySelectorAll(arguments[0]), function(element) {
+        var rect = element.getBoundingClientRect();
+        var style = window.getComputedStyle(element);
+        return rect.width > 0 && rect.height > 0 &&
+               style.visibility !== 'hidden' && style.display !== 'none';
+    }).length;
+"""
+
+# One sweep over the page: the main content area, the carousels inside it
+# and every clickable candidate, returned together so the page is scanned
+# in a single round-trip. Options are the PAGE_SCAN_OPTIONS selectors
+JS_SCAN_PAGE = JS_STYLE_CACHE + """
+    var options = arguments[0];
+
+    function isDisplayed(element) {
+        var rect = element.getBoundingClientRect();
+        var style = cs(element).style;
+        return rect.width > 0 && rect.height > 0 &&
+               style.visibility !== 'hidden' && style.display !== 'none';
+    }
+
+    function within(element, selector) {
+        var match = element.closest(selector);
+        return !!match && match !== document.body && match !== document.documentElement;
+    }
+
+    // First displayed main content area; plain tag, id and class selectors
+    // go through the DOM's fast lookups
+    function findMainContent(selectors) {
+        function first(selector) {
+            if (/^[a-z]+$/.test(selector)) return document.getElementsByTagName(selector)[0];
+            if (/^#[\\w-]+$/.test(selector)) return document.getElementById(selector.slice(1));
+            if (/^\\.[\\w-]+$/.test(selector)) return document.getElementsByClassName(selector.slice(1))[0];
+            return document.querySelector(selector);
+        }
+        for (var i = 0; i < selectors.length; i++) {
+            var element = first(selectors[i]);
+            if (element && isDisplayed(element)) {
+                return [element, selectors[i]];
+            }
+        }
+        return null;
+    }
+
+    // Displayed carousels outside headers and footers, with the selector that found them
+    function findCarousels(root, selectors, headerFooterSelector) {
+        var seen = new Set();
+        var carousels = [];
+        selectors.forEach(function(selector) {
+            root.querySelectorAll(selector).forEach(function(carousel) {
+                if (!seen.has(carousel) && isDisplayed(carousel) &&
+                    !within(carousel, headerFooterSelector)) {
+                    seen.add(carousel);
+                    carousels.push([carousel, selector]);
+                }
+            });
+        });
+        return carousels;
+    }
+
+    // Selectors of every stylesheet rule that sets cursor: pointer, with
+    // interaction pseudo-classes removed so they match at rest; null when a
+    // sheet is cross-origin and its rules cannot be read
+    function pointerRuleSelectors() {
+        var selectors = [];
+        function visit(rules) {
+            for (var i = 0; i < rules.length; i++) {
+                var rule = rules[i];
+                if (rule.selectorText && rule.style && rule.style.cursor === 'pointer') {
+                    selectors.push(rule.selectorText.replace(/:(hover|focus-visible|focus-within|focus|active)\\b/g, ''));
+                }
+                // Grouping rules such as @media, @supports and nested rules
+                if (rule.cssRules) {
+                    visit(rule.cssRules);
+                }
+            }
+        }
+        for (var i = 0; i < document.styleSheets.length; i++) {
+            try {
+                visit(document.styleSheets[i].cssRules);
+            } catch (e) {
+                return null;
+            }
+        }
+        return selectors;
+    }
+
+    // Every element inside a region matching the selector, gathered once so
+    // candidates are checked by set lookup instead of an ancestor match each.
+    // Regions come in document order, so nested ones are already covered
+    function excludedElements(selector) {
+        var excluded = new Set();
+        document.querySelectorAll(selector).forEach(function(region) {
+            if (region === document.body || region === document.documentElement || excluded.has(region)) {
+                return;
+            }
+            excluded.add(region);
+            region.querySelectorAll('*').forEach(function(element) {
+                excluded.add(element);
+            });
+        });
+        return excluded;
+    }
+
+    // Selector, pointer-cursor and event-listener candidates outside
+    // headers, footers and carousels, which are handled elsewhere
+    function collectCandidates(root, clickableSelector, excludedSelector, listenerSelector) {
+        var seen = new Set();
+        var candidates = [];
+        var excluded = excludedElements(excludedSelector);
+
+        function add(element, method) {
+            if (seen.has(element) || excluded.has(element)) {
+                return;
+            }
+            seen.add(element);
+            candidates.push([element, method]);
+        }
+
+        var matches = root.querySelectorAll(clickableSelector);
+        for (var i = 0; i < matches.length; i++) {
+            add(matches[i], 'selector');
+        }
+
+        function isSized(element) {
+            return element.offsetWidth > 0 && element.offsetHeight > 0;
+        }
+
+        // Pointer cursors normally come from stylesheet rules, so those rules'
+        // selectors find the pointer elements without reading every node's
+        // computed style. A cross-origin sheet cannot be read, in which case
+        // the walk below falls back to getComputedStyle
+        var ruleSelectors = pointerRuleSelectors();
+        if (ruleSelectors) {
+            var pointerMatches = new Set();
+            var addMatches = function(selector) {
+                root.querySelectorAll(selector).forEach(function(element) {
+                    pointerMatches.add(element);
+                });
+            };
+            ruleSelectors.forEach(function(selector) {
+                try {
+                    addMatches(selector);
+                } catch (e) {
+                    // Stripping a pseudo-class can leave an empty entry in a
+                    // selector list, so retry the entries one by one
+                    selector.split(',').forEach(function(part) {
+                        try {
+                            addMatches(part);
+                        } catch (e) {}
+                    });
+                }
+            });
+            root.querySelectorAll('[style*="cursor"]').forEach(function(element) {
+                if (element.style.cursor === 'pointer') {
+                    pointerMatches.add(element);
+                }
+            });
+            pointerMatches.forEach(function(element) {
+                // A child of a pointer element only inherits its cursor
+                if (!pointerMatches.has(element.parentElement) && isSized(element)) {
+                    add(element, 'pointer_cursor');
+                }
+            });
+        }
+
+        // Links and buttons were matched above, so their subtrees are skipped
+        var walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT, {
+            acceptNode: function(node) {
+                return (node.tagName === 'A' || node.tagName === 'BUTTON')
+                    ? NodeFilter.FILTER_REJECT
+                    : NodeFilter.FILTER_ACCEPT;
+            }
+        });
+        var pointerElements = new Set();
+        var element;
+        while ((element = walker.nextNode())) {
+            if (!isSized(element)) {
+                continue;
+            }
+
+            // Without readable stylesheets, fall back to computed styles. A pointer
+            // cursor inherited from a matched parent adds nothing new, so the
+            // computed style is only read outside pointer regions
+            if (!ruleSelectors) {
+                if (pointerElements.has(element.parentElement)) {
+                    pointerElements.add(element);
+                } else if (cs(element).style.cursor === 'pointer') {
+                    pointerElements.add(element);
+                    add(element, 'pointer_cursor');
+                }
+            }
+
+            // Handlers assigned as DOM properties leave no attribute to select on
+            if (element.onclick || element.onmousedown || element.onmouseup) {
+                add(element, 'event_listener');
+            }
+        }
+
+        // Attribute-based listener patterns are matched natively in one query
+        var listeners = root.querySelectorAll(listenerSelector);
+        for (var i = 0; i < listeners.length; i++) {
+            if (isSized(listeners[i])) {
+                add(listeners[i], 'event_listener');
+            }
+        }
+
+        return candidates;
+    }
+
+    var main = findMainContent(options.main_content);
+    var root = main ? main[0] : document;
+    return {
+        main: main,
+        carousels: findCarousels(root, options.carousels, options.header_footer),
+        candidates: collectCandidates(root, options.clickable, options.excluded, options.listeners)
+    };
+"""
+
+# Reads every field _extract_element_info needs from one element
+JS_ELEMENT_INFO_FUNCTION = JS_STYLE_CACHE + JS_XPATH_FUNCTION + JS_CSS_SELECTOR_FUNCTION + """
+    function elementInfo(el) {
+        // Mirror WebElement.get_attribute: prefer the DOM property when it is a string
+        var attr = function(name) {
+            var value = el[name];
+            return (typeof value === 'string' ? value : el.getAttribute(name)) || '';
+        };
+        var rect = el.getBoundingClientRect();
+        var style = cs(el).style;
+        return {
+            tag_name: el.tagName.toLowerCase(),
+            text: (el.innerText || '').trim().slice(0, 100),
+            class_names: attr('class'),
+            id: attr('id'),
+            href: attr('href'),
+            onclick: attr('onclick'),
+            role: attr('role'),
+            type: attr('type'),
+            data_testid: attr('data-testid'),
+            aria_label: attr('aria-label'),
+            title: attr('title'),
+            name: attr('name'),
+            value: attr('value'),
+            src: attr('src'),
+            alt: attr('alt'),
+            xpath: getXPath(el),
+            css_selector: getCssSelector(el),
+            location: {
+                x: Math.round(rect.left + window.pageXOffset),
+                y: Math.round(rect.top + window.pageYOffset)
+            },
+            size: {
+                height: Math.round(rect.height),
+                width: Math.round(rect.width)
+            },
+            is_displayed: rect.width > 0 && rect.height > 0 &&
+                          style.visibility !== 'hidden' && style.display !== 'none',
+            is_enabled: !el.disabled
+        };
+    }
+"""
+
+JS_ELEMENT_INFO = JS_ELEMENT_INFO_FUNCTION + """
+    return elementInfo(arguments[0]);
+"""
+
+JS_ELEMENT_INFO_BATCH = JS_ELEMENT_INFO_FUNCTION + """
+    return arguments[0].map(elementInfo);
+"""
+
+# Re-locate a previously extracted element by id, then xpath, then class names,
+# keeping the first match with the same tag and text under the given root
+JS_FIND_BY_INFO = """
+    var root = arguments[0] || document;
+    var info = arguments[1];
+    var requireDisplayed = arguments[2];
+
+    function matches(element) {
+        if (!root.contains(element) ||
+            element.tagName.toLowerCase() !== info.tag_name ||
+            (element.innerText || '').trim().slice(0, 100) !== info.text) {
+            return false;
+        }
+        if (!requireDisplayed) return true;
+        var rect = element.getBoundingClientRect();
+        var style = window.getComputedStyle(element);
+        return rect.width > 0 && rect.height > 0 &&
+               style.visibility !== 'hidden' && style.display !== 'none';
+    }
+
+    var candidates = [];
+    if (info.id) {
+        candidates.push(document.getElementById(info.id));
+    }
+    if (info.xpath && info.xpath !== 'xpath_unavailable') {
+        try {
+            var result = document.evaluate(info.xpath, document, null,
+                                           XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var i = 0; i < result.snapshotLength; i++) {
+                candidates.push(result.snapshotItem(i));
+            }
+        } catch (e) {}
+    }
+    if (info.class_names) {
+        candidates.push.apply(candidates, root.getElementsByClassName(info.class_names));
+    }
+
+    for (var i = 0; i < candidates.length; i++) {
+        if (candidates[i] && candidates[i].nodeType === 1 && matches(candidates[i])) {
+            return candidates[i];
+        }
+    }
+    return null;
+"""
+
+# Forces an element and its ancestors visible through one injected stylesheet rule,
+# so the browser restyles them in a single pass instead of per inline style write
+JS_SHOW_CAROUSEL_ANCESTORS = """
+    if (!document.getElementById('__clk-force-style')) {
+        var style = document.createElement('style');
+        style.id = '__clk-force-style';
+        style.textContent = '.__clk-force-visible {' +
+            'display: block !important; visibility: visible !important; opacity: 1 !important;' +
+            'position: relative !important; z-index: auto !important;' +
+            // Remove transforms that might hide the element
+            'transform: none !important; -webkit-transform: none !important; }';
+        (document.head || document.documentElement).appendChild(style);
+    }
+
+    var current = arguments[0];
+    while (current && current !== document.body) {
+        current.classList.add('__clk-force-visible');
+        current = current.parentElement;
+    }
+"""
+
+
+# dataclass(slots=True) needs Python 3.10; earlier versions get a plain dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ElementInfo:
+    """Everything recorded about one clickable element; slots keep thousands of them compact"""
+    tag_name: str
+    text: str
+    class_names: str
+    id: str
+    href: str
+    onclick: str
+    role: str
+    type: str
+    data_testid: str
+    aria_label: str
+    xpath: str
+    location: dict
+    size: dict
+    is_displayed: bool
+    is_enabled: bool
+    unique_id: Optional[str] = None
+    status_code: Optional[List[int]] = None  # Redirect chain, filled in by _fill_status_codes
+    title: Optional[str] = None
+    name: Optional[str] = None
+    value: Optional[str] = None
+    src: Optional[str] = None
+    alt: Optional[str] = None
+    css_selector: Optional[str] = None
+    is_carousel_element: bool = False
+    detection_method: Optional[str] = None
+
+
 class ClickableElementTester:
-    def __init__(self, headless=False, timeout=10):
+    def __init__(self, headless=False, timeout=10, cache_file=None):
         """
         Initialize the clickable element tester
         
         Args:
             headless (bool): Run browser in headless mode
             timeout (int): Default timeout for operations
+            cache_file (str): Optional shelve file that keeps page scans across runs
         """
         self.timeout = timeout
+        self.headless = headless
         self.results = []
-        self.driver = self._setup_driver(headless)
+        # Each thread drives its own browser; the calling thread's one is started now
+        self._local = threading.local()
+        self._drivers_lock = threading.Lock()
+        self._local.driver = self._setup_driver(headless)
+        self._drivers = [self._local.driver]
+        # Pooled HTTP session for link status checks, shared by all threads
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=STATUS_CHECK_WORKERS,
+                              pool_maxsize=STATUS_CHECK_WORKERS, max_retries=1)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+        # Status chains memoised per absolute URL; lru_cache is safe across threads,
+        # and a lookup that raised is not cached, so failures are retried
+        self._head_status = functools.lru_cache(maxsize=STATUS_CACHE_SIZE)(self._fetch_status_chain)
+        # Scan results keyed on (url, content hash), least recently used first
+        self._page_cache = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        self._disk_cache = None
+        if cache_file:
+            import shelve
+            self._disk_cache = shelve.open(cache_file)
+
+    @property
+    def driver(self):
+        """WebDriver for the current thread, started on first use"""
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            driver = self._setup_driver(self.headless)
+            self._local.driver = driver
+            with self._drivers_lock:
+                self._drivers.append(driver)
+        return driver
+
+    @property
+    def url(self):
+        """URL currently being processed by this thread"""
+        return getattr(self._local, 'url', None)
+
+    @url.setter
+    def url(self, value):
+        self._local.url = value
+        # Last path segment names the results file; a trailing slash or bare domain gives 'root'
+        self._local.url_slug = urlparse(value or '').path.strip('/').rsplit('/', 1)[-1] or 'root'
             
     def _setup_driver(self, headless):
         """Setup Chrome WebDriver with appropriate options"""
@@ -53,10 +965,33 @@ class ClickableElementTester:
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             return driver
         except Exception as e:
-            print(f"Error setting up Chrome driver: {e}")
-            print("Make sure ChromeDriver is installed and in PATH")
+            logger.error(f"Error setting up Chrome driver: {e}")
+            logger.error("Make sure ChromeDriver is installed and in PATH")
             raise
 
+    def _wait_ready(self, predicate_js, *args, timeout=None):
+        """
+        Poll a JavaScript predicate in the browser until it returns true
+        
+        Args:
+            predicate_js (str): Script whose return value is the readiness condition
+            *args: Arguments passed to the script
+            timeout (float): Seconds to wait before giving up (defaults to self.timeout)
+            
+        Returns:
+            bool: True if the predicate passed before the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout or self.timeout).until(
+                lambda driver: driver.execute_script(predicate_js, *args)
+            )
+            return True
+        except TimeoutException:
+            return False
+        except WebDriverException as e:
+            logger.error(f"Error waiting for page state: {e}")
+            return False
+
     def _handle_carousel_banner(self, element):
         """
         Handle auto-scrolling carousels and banners by pausing them and collecting all slides
@@ -71,32 +1006,11 @@ class ClickableElementTester:
         
         try:
             # Find parent carousel container
-            carousel_container = self.driver.execute_script("""
-                var element = arguments[0];
-                var current = element;
-                var carouselSelectors = [
-                    '.carousel', '.slider', '.banner-slider', '.swiper', '.slick',
-                    '[data-ride="carousel"]', '.owl-carousel', '.hero-banner',
-                    '.banner-container', '.slideshow', '.image-slider'
-                ];
-                
-                while (current && current !== document.body) {
-                    var className = current.className || '';
-                    var dataRide = current.getAttribute('data-ride') || '';
-                    
-                    for (var i = 0; i < carouselSelectors.length; i++) {
-                        var selector = carouselSelectors[i].replace('.', '');
-                        if (className.includes(selector) || dataRide === 'carousel') {
-                            return current;
-                        }
-                    }
-                    current = current.parentElement;
-                }
-                return null;
-            """, element)
+            carousel_container = self.driver.execute_script(JS_FIND_CAROUSEL_CONTAINER, element,
+                                                            CAROUSEL_CONTAINER_CSS)
             
             if carousel_container:
-                print(f"Found carousel container, attempting to pause auto-scroll")
+                logger.info(f"Found carousel container, attempting to pause auto-scroll")
                 
                 # Pause carousel auto-scrolling
                 self._pause_carousel(carousel_container)
@@ -112,186 +1026,53 @@ class ClickableElementTester:
             return carousel_elements
             
         except Exception as e:
-            print(f"Error handling carousel: {e}")
+            logger.error(f"Error handling carousel: {e}")
             return []
 
     def _pause_carousel(self, carousel_container):
         """Pause carousel auto-scrolling using various methods"""
         try:
             # Method 1: Bootstrap carousel pause
-            self.driver.execute_script("""
-                var carousel = arguments[0];
-                if (typeof jQuery !== 'undefined' && jQuery(carousel).carousel) {
-                    jQuery(carousel).carousel('pause');
-                }
-                if (carousel.carousel && typeof carousel.carousel === 'function') {
-                    carousel.carousel('pause');
-                }
-            """, carousel_container)
+            self.driver.execute_script(JS_PAUSE_CAROUSEL_PLUGIN, carousel_container)
             
             # Method 2: Pause CSS animations
-            self.driver.execute_script("""
-                var carousel = arguments[0];
-                carousel.style.animationPlayState = 'paused';
-                carousel.style.webkitAnimationPlayState = 'paused';
-                
-                // Pause all child animations
-                var children = carousel.querySelectorAll('*');
-                for (var i = 0; i < children.length; i++) {
-                    children[i].style.animationPlayState = 'paused';
-                    children[i].style.webkitAnimationPlayState = 'paused';
-                }
-            """, carousel_container)
+            self.driver.execute_script(JS_PAUSE_CAROUSEL_ANIMATIONS, carousel_container)
             
             # Method 3: Clear intervals (common for custom sliders)
-            self.driver.execute_script("""
-                // Clear common slider intervals
-                if (window.sliderIntervals) {
-                    window.sliderIntervals.forEach(clearInterval);
-                }
-                
-                // Stop common slider libraries
-                var carousel = arguments[0];
-                if (carousel.swiper) {
-                    carousel.swiper.autoplay.stop();
-                }
-                if (carousel.slick) {
-                    jQuery(carousel).slick('slickPause');
-                }
-            """, carousel_container)
+            self.driver.execute_script(JS_STOP_CAROUSEL_TIMERS, carousel_container)
             
-            time.sleep(1)  # Allow pause to take effect
+            # The pause calls above take effect synchronously, so there is
+            # nothing to wait for before reading the slides
             
         except Exception as e:
-            print(f"Could not pause carousel: {e}")
+            logger.warning(f"Could not pause carousel: {e}")
 
     def _get_all_carousel_slides(self, carousel_container):
         """Get all slides from a carousel, including hidden ones"""
-        slides = []
-        
         try:
-            # Common slide selectors
-            slide_selectors = [
-                '.carousel-item', '.slide', '.slider-item', '.swiper-slide',
-                '.slick-slide', '.banner-slide', '.owl-item', '[data-slide]',
-                '.glide__slide', '.splide__slide', '.flickity-cell',
-                '.keen-slider__slide', '.embla__slide', '.tns-item',
-                '.carousel-cell', '.slider-slide', '.slide-item',
-                # Generic selectors for custom implementations
-                '[class*="slide"]', '[data-slide-index]', '[data-slide-id]'
-            ]
-            
-            for selector in slide_selectors:
-                found_slides = carousel_container.find_elements(By.CSS_SELECTOR, selector)
-                if found_slides:
-                    slides.extend(found_slides)
-                    break
+            # Known slide markup first, falling back to generic children that look like slides
+            slides = self.driver.execute_script(JS_FIND_SLIDES, carousel_container, list(SLIDE_SELECTORS))
             
-            # If no specific slides found, look for direct children with images/content
-            if not slides:
-                potential_slides = carousel_container.find_elements(By.CSS_SELECTOR, 'div, section, article, li')
-                slides = [slide for slide in potential_slides if self._looks_like_slide(slide)]
-
-            if not slides:
-                nested_containers = carousel_container.find_elements(By.CSS_SELECTOR, 
-                    '.swiper-wrapper, .slider-wrapper, .carousel-inner, .slides')
-                for container in nested_containers:
-                    nested_slides = container.find_elements(By.CSS_SELECTOR, 'div, li')
-                    for slide in nested_slides:
-                        if self._looks_like_slide(slide):
-                            slides.append(slide)
-            
-            print(f"Found {len(slides)} carousel slides")
+            logger.info(f"Found {len(slides)} carousel slides")
             return slides
             
         except Exception as e:
-            print(f"Error getting carousel slides: {e}")
+            logger.error(f"Error getting carousel slides: {e}")
             return []
 
-    def _looks_like_slide(self, element):
-        """Check if an element looks like a carousel slide"""
-        try:
-            # Check for typical slide content
-            has_image = len(element.find_elements(By.TAG_NAME, 'img')) > 0
-            has_text_content = len(element.text.strip()) > 20
-            has_links = len(element.find_elements(By.TAG_NAME, 'a')) > 0
-            
-            # return has_image or has_text_content or has_links
-            has_buttons = len(element.find_elements(By.TAG_NAME, 'button')) > 0
-        
-            # Check for slide-like styling
-            style = element.get_attribute('style') or ''
-            computed_style = self.driver.execute_script("""
-                var element = arguments[0];
-                var style = window.getComputedStyle(element);
-                return {
-                    display: style.display,
-                    position: style.position,
-                    width: style.width,
-                    float: style.float,
-                    flexBasis: style.flexBasis
-                };
-            """, element)
-            
-            # Check if element has slide-like dimensions or positioning
-            has_slide_styling = (
-                'width:' in style.lower() or 
-                computed_style.get('position') in ['absolute', 'relative'] or
-                computed_style.get('float') in ['left', 'right'] or
-                computed_style.get('display') in ['flex', 'inline-block']
-            )
-            
-            # Check class names for slide indicators
-            class_names = element.get_attribute('class') or ''
-            has_slide_class = any(keyword in class_names.lower() for keyword in 
-                                ['slide', 'item', 'cell', 'panel', 'tab'])
-            
-            return (has_image or has_text_content or has_links or has_buttons or 
-                    has_slide_styling or has_slide_class)
-        except:
-            return False
-
     def _extract_clickables_from_slide(self, slide):
         """Extract clickable elements from a single slide"""
         clickables = []
         
         try:
             # Make slide visible if hidden
-            self.driver.execute_script("""
-                var slide = arguments[0];
-                var originalDisplay = slide.style.display;
-                var originalVisibility = slide.style.visibility;
-                var originalOpacity = slide.style.opacity;
-                var originalTransform = slide.style.transform;
-                var originalPosition = slide.style.position;
-                
-                slide.style.display = 'block';
-                slide.style.visibility = 'visible';
-                slide.style.opacity = '1';
-                slide.style.transform = 'translateX(0px)';
-                slide.style.position = 'relative';
-                slide.style.zIndex = '1000';
-                
-                // Store original values for restoration
-                slide.setAttribute('data-original-display', originalDisplay);
-                slide.setAttribute('data-original-visibility', originalVisibility);
-                slide.setAttribute('data-original-opacity', originalOpacity);
-                slide.setAttribute('data-original-transform', originalTransform);
-                slide.setAttribute('data-original-position', originalPosition);
-            """, slide)
+            self.driver.execute_script(JS_SHOW_SLIDE, slide)
             
-            time.sleep(1)
+            # Wait until the forced styles have produced a laid-out slide
+            self._wait_ready(JS_SLIDE_LAID_OUT, slide, timeout=1)
 
             # Find clickable elements in this slide
-            clickable_selectors = [
-                'a', 'button', '[onclick]', '[role="button"]','input[type="button"]',
-                'input[type="submit"]', '.btn', '.button', '.link', '.cta', '.call-to-action',
-                '[data-action]', '[data-click]', '[data-href]',
-                '.carousel-control', '.slider-nav', '.slide-nav',
-                '.prev', '.next', '.slide-btn', '.carousel-btn',
-
-            ]
-            for selector in clickable_selectors:
+            for selector in SLIDE_CLICKABLE_SELECTORS:
                 try:
                     elements = slide.find_elements(By.CSS_SELECTOR, selector)
                     for element in elements:
@@ -300,91 +1081,59 @@ class ClickableElementTester:
                             if element_info:
                                 clickables.append(element_info)
                 except Exception as e:
-                    print(f"Error finding elements with selector '{selector}': {e}")
+                    logger.error(f"Error finding elements with selector '{selector}': {e}")
 
             # Additionally, find elements by common action words in their text (XPath)
-            action_words = [
-                'WATCH VIDEO', 'PLAY', 'SUBMIT', 'APPLY', 'START', 'LEARN MORE', 'READ MORE',
-                'VIEW', 'SEE MORE', 'CLICK HERE', 'DOWNLOAD', 'UPLOAD', 'NEXT', 'PREV', 'PREVIOUS'
-            ]
-            for word in action_words:
-                try:
-                    xpath = f".//*[contains(translate(text(), 'abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'), '{word}')]"
-                    elements = slide.find_elements(By.XPATH, xpath)
-                    for element in elements:
-                        if element.is_enabled():
-                            element_info = self._extract_element_info_for_hidden(element)
-                            if element_info:
-                                clickables.append(element_info)
-                except Exception as e:
-                    print(f"Error finding elements with text '{word}': {e}")
+            try:
+                elements = slide.find_elements(By.XPATH, ACTION_XPATH_UNION)
+                for element in elements:
+                    if element.is_enabled():
+                        element_info = self._extract_element_info_for_hidden(element)
+                        if element_info:
+                            clickables.append(element_info)
+            except Exception as e:
+                logger.error(f"Error finding elements by action words: {e}")
 
         except Exception as e:
-            print(f"Error extracting clickables from slide: {e}")
+            logger.error(f"Error extracting clickables from slide: {e}")
 
         return clickables
     def _extract_element_info_for_hidden(self, element):
         """Extract element info even if element is not currently displayed"""
         try:
-            # Temporarily make element visible for info extraction
-            original_style = self.driver.execute_script("""
-                var el = arguments[0];
-                var style = {
-                    display: el.style.display,
-                    visibility: el.style.visibility,
-                    opacity: el.style.opacity
-                };
-                el.style.display = 'block';
-                el.style.visibility = 'visible';
-                el.style.opacity = '1';
-                return style;
-            """, element)
-            
-            element_info = {
-                'tag_name': element.tag_name,
-                'text': element.text.strip()[:100] if element.text else '',
-                'class_names': element.get_attribute('class') or '',
-                'id': element.get_attribute('id') or '',
-                'href': element.get_attribute('href') or '',
-                'status_code': self.get_status_code(href) if href else None, # type: ignore
-                'onclick': element.get_attribute('onclick') or '',
-                'role': element.get_attribute('role') or '',
-                'type': element.get_attribute('type') or '',
-                'data_testid': element.get_attribute('data-testid') or '',
-                'aria_label': element.get_attribute('aria-label') or '',
-                'xpath': self._get_element_xpath(element),
-                'location': element.location,
-                'size': element.size,
-                'is_displayed': True,  # We're forcing it to be displayed
-                'is_enabled': element.is_enabled(),
-                'is_carousel_element': True  # Mark as carousel element
-            }
-            
-            # Restore original styles
-            self.driver.execute_script("""
-                var el = arguments[0];
-                var style = arguments[1];
-                el.style.display = style.display;
-                el.style.visibility = style.visibility;
-                el.style.opacity = style.opacity;
-            """, element, original_style)
+            # Read every field in a single round-trip
+            info = self.driver.execute_script(JS_HIDDEN_ELEMENT_INFO, element)
+            
+            element_info = ElementInfo(
+                tag_name=info['tag_name'],
+                text=info['text'],
+                class_names=sys.intern(info['class_names']),
+                id=info['id'],
+                href=info['href'],
+                onclick=info['onclick'],
+                role=info['role'],
+                type=info['type'],
+                data_testid=info['data_testid'],
+                aria_label=info['aria_label'],
+                xpath=info['xpath'],
+                location=info['location'],
+                size=info['size'],
+                is_displayed=True,  # We're forcing it to be displayed
+                is_enabled=info['is_enabled'],
+                is_carousel_element=True  # Mark as carousel element
+            )
             
-            element_info['unique_id'] = self._create_unique_id(element_info)
+            element_info.unique_id = self._create_unique_id(element_info)
             return element_info
             
         except Exception as e:
-            print(f"Error extracting hidden element info: {e}")
+            logger.error(f"Error extracting hidden element info: {e}")
             return None
 
-    def _is_duplicate_element(self, element_info, existing_elements):
-        """Check for duplicate elements more accurately"""
-        for existing in existing_elements:
-            if (existing['xpath'] == element_info['xpath'] or
-                (existing['unique_id'] == element_info['unique_id'] and
-                existing['tag_name'] == element_info['tag_name'] and
-                existing['text'] == element_info['text'])):
-                return True
-        return False
+    def _is_duplicate_element(self, element_info, existing_unique_ids, existing_xpaths):
+        """Check for duplicate elements with set lookups on unique_id and xpath"""
+        return (element_info.unique_id in existing_unique_ids or
+                element_info.xpath in existing_xpaths)
 
     def find_clickable_elements(self, url):
     #    """
@@ -397,7 +1146,7 @@ class ClickableElementTester:
     #         list: List of clickable elements with their properties
     #     """
         self.url = url
-        print(f"Loading URL: {url}")
+        logger.info(f"Loading URL: {url}")
         self.driver.get(url)
         
         # Wait for page to load
@@ -406,219 +1155,156 @@ class ClickableElementTester:
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
         except TimeoutException:
-            print("⚠️ Page load timeout - proceeding with available elements")
+            logger.warning("⚠️ Page load timeout - proceeding with available elements")
+        
+        # Wait for the document to load and the network to go idle
+        if not self._wait_ready(JS_PAGE_SETTLED, NETWORK_IDLE_MS):
+            logger.warning("⚠️ Page did not settle in time - proceeding with available elements")
         
-        # Allow additional time for dynamic content
-        time.sleep(5)
-
-        # Define header and footer exclusion selectors
-        header_footer_selectors = [
-            'header', 'nav', 'footer',
-            '.header', '.nav', '.footer', '.navigation',
-            '#header', '#nav', '#footer', '#navigation',
-            '[role="banner"]', '[role="navigation"]', '[role="contentinfo"]',
-            '.site-header', '.site-footer', '.page-header', '.page-footer',
-            '.main-header', '.main-footer', '.top-nav', '.bottom-nav',
-            '.navbar', '.nav-bar', '.site-nav', '.primary-nav'
-        ]
+        # Reuse the previous scan if this page has not changed since
+        cache_key = self._page_cache_key(url)
+        if cache_key:
+            cached = self._get_cached_scan(cache_key)
+            if cached is not None:
+                logger.info(f"Page unchanged since last scan - reusing {len(cached)} clickable elements")
+                return cached
         
-        # Get main content area (exclude header/footer)
-        main_content_area = self._get_main_content_area()
+        # Find the main content area (exclude header/footer), its carousels and
+        # the clickable candidates outside headers, footers and carousels in one sweep
+        carousels, candidates = self._scan_page()
 
         # First, identify and handle carousels/banners
         carousel_elements = []
-        carousel_selectors = [
-            '.carousel', '.slider', '.banner-slider', '.swiper', '.slick',
-            '[data-ride="carousel"]', '.owl-carousel', '.hero-banner',
-            '.banner-container', '.slideshow', '.image-slider',
-            '.swiper-container', '.swiper-wrapper', '.glide', '.splide',
-            '.flickity', '.keen-slider', '.embla', '.tiny-slider',
-            '[data-carousel]', '[data-slider]', '[data-swiper]',
-            '.slide-container', '.carousel-container', '.slider-wrapper',
-            '.hero-slider', '.product-slider', '.testimonial-slider',
-            '.gallery-slider', '.content-slider', '.banner-carousel',
-            '.thumbnail__overlay'  # Added thumbnail overlay to carousel selectors
-        ]
-        
         unique_ids = set()
+        xpaths = set()
         clickable_elements = []
         
-        for carousel_selector in carousel_selectors:
+        for carousel, carousel_selector in carousels:
             try:
-                if main_content_area:
-                    carousels = main_content_area.find_elements(By.CSS_SELECTOR, carousel_selector)
-                else:
-                    carousels = self.driver.find_elements(By.CSS_SELECTOR, carousel_selector)
-                    
-                for carousel in carousels:
-                    try:
-                        if carousel.is_displayed():
-                            # Skip if carousel is in header/footer
-                            if self._is_in_header_or_footer(carousel, header_footer_selectors):
-                                continue
-                            
-                            print(f"Processing carousel with selector: {carousel_selector}")
-                            carousel_clickables = self._handle_carousel_banner(carousel)
-                            carousel_elements.extend(carousel_clickables)
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception as e:
-                        print(f"Error processing carousel element: {e}")
-                        continue
+                logger.info(f"Processing carousel with selector: {carousel_selector}")
+                carousel_clickables = self._handle_carousel_banner(carousel)
+                carousel_elements.extend(carousel_clickables)
+            except StaleElementReferenceException:
+                continue
             except Exception as e:
-                print(f"Error processing carousel selector '{carousel_selector}': {e}")
+                logger.error(f"Error processing carousel element: {e}")
+                continue
         
-        # CSS selectors for potentially clickable elements
-        clickable_selectors = [
-            # Basic clickable elements
-            'a', 'button', 
-            'input[type="button"]', 'input[type="submit"]', 'input[type="reset"]',
-            
-            # Elements with interactive attributes
-            '[onclick]', '[onmousedown]', '[onmouseup]', '[ondblclick]',
-            
-            # ARIA roles
-            '[role="button"]', '[role="link"]', '[role="tab"]', '[role="menuitem"]',
-            '[role="option"]', '[role="treeitem"]', '[role="gridcell"]',
-            
-            # Focusable elements (potential clickables)
-            '[tabindex="0"]', '[tabindex="-1"]', 'div[tabindex]', 'span[tabindex]',
-            'li[tabindex]', 'td[tabindex]', 'th[tabindex]',
-            
-            # Common clickable classes and patterns
-            '.btn', '.button', '.link', '.clickable', '.click',
-            '.cta', '.call-to-action', '.action', '.trigger',
-            '.menu-item', '.nav-item', '.tab', '.accordion',
-            '.dropdown', '.select', '.picker', '.toggle',
-            '.card', '.tile', '.item', '.option',
-            '.close', '.cancel', '.submit', '.save', '.edit', '.delete',
-            '.expand', '.collapse', '.show', '.hide',
-            '.play', '.pause', '.stop', '.next', '.prev', '.previous',
-            '.like', '.share', '.favorite', '.bookmark',
-            '.download', '.upload', '.search', '.filter', '.sort',
-            
-            # Data attributes (modern web patterns)
-            '[data-action]', '[data-click]', '[data-href]', '[data-url]',
-            '[data-toggle]', '[data-target]', '[data-dismiss]',
-            '[data-testid*="button"]', '[data-testid*="link"]', '[data-testid*="click"]',
-            '[data-cy*="button"]', '[data-cy*="link"]', '[data-cy*="click"]',
-            
-            # Form controls that might be styled as buttons
-            'select', 'input[type="checkbox"]', 'input[type="radio"]',
-            'input[type="file"]', 'input[type="image"]',
-            
-            # Modern web components and custom elements
-            '[class*="btn"]', '[class*="button"]', '[class*="link"]',
-            '[class*="click"]', '[class*="action"]', '[class*="cta"]',
-            '[id*="btn"]', '[id*="button"]', '[id*="link"]','[class="calculator-button active"]'
-            # class="calculator-button active"
-            
-            # Media controls
-            'video[controls]', 'audio[controls]',
-            
-            # Interactive list items and table cells
-            'li[onclick]', 'td[onclick]', 'tr[onclick]',
-            'li[role="button"]', 'td[role="button"]', 'tr[role="button"]',
-            
-            # SVG elements that might be clickable
-            'svg[onclick]', 'svg[role="button"]',
-            
-            # Image maps and clickable images
-            'area', 'img[onclick]', 'img[role="button"]',
-            
-            # Custom interactive elements
-            'div[role="button"]', 'span[role="button"]',
-            'p[role="button"]', 'section[role="button"]',
-            
-            # Thumbnail overlay specifically
-            '.thumbnail__overlay'
-        ]
-
-        for selector in clickable_selectors:
+        # Read every candidate's info in a single round-trip
+        infos = self._batch_extract_element_info([element for element, _ in candidates])
+        # Keep displayed and enabled elements, first occurrence of each content signature only
+        for (element, detection_method), info, dedup_key in self._drop_duplicate_infos(candidates, infos):
             try:
-                if main_content_area:
-                    # Search within main content area only
-                    elements = main_content_area.find_elements(By.CSS_SELECTOR, selector)
-                else:
-                    # Fallback: search entire page but exclude header/footer elements
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                for element in elements:
-                    try:
-                        # Check if element is displayed and enabled
-                        if element.is_displayed() and element.is_enabled():
-                            # Skip if element is within header or footer
-                            if self._is_in_header_or_footer(element, header_footer_selectors):
-                                continue
-
-                            # Skip if element is already captured as part of carousel
-                            if self._is_carousel_element(element):
-                                continue
-                                
-                            element_info = self._extract_element_info(element)
-                            if element_info and element_info['unique_id'] not in unique_ids:
-                                unique_ids.add(element_info['unique_id'])
-                                clickable_elements.append(element_info)
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception as e:
-                        print(f"Error processing element: {e}")
-                        continue
+                element_info = self._extract_element_info(element, info, dedup_key)
+                if element_info and not self._is_duplicate_element(element_info, unique_ids, xpaths):
+                    unique_ids.add(element_info.unique_id)
+                    xpaths.add(element_info.xpath)
+                    if detection_method != 'selector':
+                        element_info.detection_method = detection_method
+                    clickable_elements.append(element_info)
+            except StaleElementReferenceException:
+                continue
             except Exception as e:
-                print(f"Error finding elements with selector '{selector}': {e}")
+                logger.error(f"Error processing element: {e}")
                 continue
+
+        # The same slide element can match several slide selectors
+        for element_info in carousel_elements:
+            if not self._is_duplicate_element(element_info, unique_ids, xpaths):
+                unique_ids.add(element_info.unique_id)
+                xpaths.add(element_info.xpath)
+                clickable_elements.append(element_info)
+
+        self._fill_status_codes(clickable_elements)
+        logger.info(f"Found {len(clickable_elements)} potentially clickable elements (excluding header/footer)")
         
-        # Find elements with pointer cursor
-        try:
-            pointer_elements = self._find_elements_with_pointer_cursor()
-            for element in pointer_elements:
+        if cache_key:
+            self._store_cached_scan(cache_key, clickable_elements)
+        return clickable_elements
+
+    def _get_cached_scan(self, cache_key):
+        """Scan stored for this (url, content hash), from memory first and then the cache file"""
+        with self._page_cache_lock:
+            cached = self._page_cache.get(cache_key)
+            if cached is not None:
+                self._page_cache.move_to_end(cache_key)
+                return list(cached)
+            if self._disk_cache is None:
+                return None
+            cached = self._disk_cache.get('|'.join(cache_key))
+            if cached is None:
+                return None
+            self._page_cache[cache_key] = cached
+            if len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        
+        # Link targets may have changed since an earlier run, so check them again
+        cached = list(cached)
+        self._fill_status_codes(cached)
+        return cached
+
+    def _store_cached_scan(self, cache_key, clickable_elements):
+        """Remember a scan in memory and, when configured, in the cache file"""
+        with self._page_cache_lock:
+            self._page_cache[cache_key] = list(clickable_elements)
+            if len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+            if self._disk_cache is not None:
                 try:
-                    if element.is_displayed() and element.is_enabled():
-                        if self._is_in_header_or_footer(element, header_footer_selectors):
-                            continue
-                            
-                        if self._is_carousel_element(element):
-                            continue
-                            
-                        element_info = self._extract_element_info(element)
-                        if element_info and element_info['unique_id'] not in unique_ids:
-                            unique_ids.add(element_info['unique_id'])
-                            element_info['detection_method'] = 'pointer_cursor'
-                            clickable_elements.append(element_info)
-                except StaleElementReferenceException:
-                    continue
-                except Exception:
-                    continue
-        except Exception as e:
-            print(f"Error finding pointer cursor elements: {e}")
+                    self._disk_cache['|'.join(cache_key)] = list(clickable_elements)
+                    self._disk_cache.sync()
+                except Exception as e:
+                    logger.warning(f"Could not write scan to cache file: {e}")
 
-        # Find elements with event listeners
+    def _page_cache_key(self, url):
+        """Key the loaded page on its URL and a hash of its current markup"""
         try:
-            listener_elements = self._find_elements_with_event_listeners()
-            for element in listener_elements:
+            html = self.driver.execute_script("return document.documentElement.outerHTML;")
+            return (url, hashlib.blake2b(html.encode(), digest_size=16).hexdigest())
+        except Exception as e:
+            logger.warning(f"Could not hash page content: {e}")
+            return None
+    def find_clickable_elements_batch(self, urls, workers=4):
+        """
+        Find clickable elements on several pages in parallel
+        
+        Args:
+            urls (list): URLs to scan
+            workers (int): Number of browsers to run at once
+            
+        Returns:
+            dict: Clickable elements found for each URL
+        """
+        with self._drivers_lock:
+            existing_drivers = len(self._drivers)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return dict(zip(urls, executor.map(self._process_url, urls)))
+        finally:
+            # Worker threads are gone once the pool exits, so close their browsers
+            with self._drivers_lock:
+                worker_drivers = self._drivers[existing_drivers:]
+                del self._drivers[existing_drivers:]
+            for driver in worker_drivers:
                 try:
-                    if element.is_displayed() and element.is_enabled():
-                        if self._is_in_header_or_footer(element, header_footer_selectors):
-                            continue
-                            
-                        if self._is_carousel_element(element):
-                            continue
-                            
-                        element_info = self._extract_element_info(element)
-                        if element_info and element_info['unique_id'] not in unique_ids:
-                            unique_ids.add(element_info['unique_id'])
-                            element_info['detection_method'] = 'event_listener'
-                            clickable_elements.append(element_info)
-                except StaleElementReferenceException:
-                    continue
-                except Exception:
-                    continue
+                    driver.quit()
+                except Exception as e:
+                    logger.error(f"Error closing worker browser: {e}")
+
+    def _process_url(self, url):
+        """Scan one URL on the current thread's browser, which is reused for the next URL"""
+        try:
+            return self.find_clickable_elements(url)
         except Exception as e:
-            print(f"Error finding event listener elements: {e}")
+            logger.error(f"Error finding clickable elements on {url}: {e}")
+            return []
+        finally:
+            try:
+                self.driver.delete_all_cookies()
+            except Exception as e:
+                logger.warning(f"Could not clear cookies after {url}: {e}")
 
-        clickable_elements.extend(carousel_elements)
-        print(f"Found {len(clickable_elements)} potentially clickable elements (excluding header/footer)")
-        return clickable_elements
     def safe_get_attribute(self, element, attribute, default=''):
             """Safely get element attribute with error handling"""
             try:
@@ -634,356 +1320,203 @@ class ClickableElementTester:
             return ''
   
     
-    def _find_elements_with_pointer_cursor(self):
-        """Find elements that have cursor: pointer styling (likely clickable)"""
+    def _scan_page(self):
+        """
+        Sweep the page once for its main content area, carousels and clickable candidates
+        
+        Returns:
+            tuple: Carousels as (element, selector) pairs and candidates as
+                   (element, detection_method) pairs, both within the main content area
+        """
         try:
-            pointer_elements = self.driver.execute_script("""
-                var elements = [];
-                var allElements = document.querySelectorAll('*');
-                
-                for (var i = 0; i < allElements.length; i++) {
-                    var element = allElements[i];
-                    var computedStyle = window.getComputedStyle(element);
-                    
-                    if (computedStyle.cursor === 'pointer' && 
-                        element.offsetWidth > 0 && element.offsetHeight > 0) {
-                        elements.push(element);
-                    }
-                }
-                
-                return elements;
-            """)
-            
-            print(f"Found {len(pointer_elements)} elements with pointer cursor")
-            return pointer_elements
+            scan = self.driver.execute_script(JS_SCAN_PAGE, PAGE_SCAN_OPTIONS)
         except Exception as e:
-            print(f"Error finding pointer cursor elements: {e}")
-            return []
+            logger.error(f"Error scanning page: {e}")
+            return [], []
+        
+        if scan['main']:
+            logger.info(f"Found main content area using selector: {scan['main'][1]}")
+        else:
+            logger.info("No specific main content area found, will use exclusion method")
+        logger.info(f"Found {len(scan['candidates'])} candidate clickable elements")
+        return scan['carousels'], scan['candidates']
+
+    def get_status_code(self, href):
+        """Return HTTP status code for the given href, or None if not applicable."""
+        if not href or href.startswith('#') or href.startswith('javascript:'):
+            return None
+        # Handle relative URLs
+        if href.startswith('/'):
+            href = urljoin(self.url, href)
+        return self._status_chain(self._normalize_url(href))
 
-    def _find_elements_with_event_listeners(self):
-        """Find elements that have click event listeners attached"""
+    def _normalize_url(self, url):
+        """Drop the fragment, which is never sent to the server, so such links share one lookup"""
+        return urldefrag(url)[0]
+
+    def _status_chain(self, url):
+        """Cached status chain of an absolute URL, or None if the request failed"""
         try:
-            listener_elements = self.driver.execute_script("""
-                var elements = [];
-                var allElements = document.querySelectorAll('*');
-                
-                for (var i = 0; i < allElements.length; i++) {
-                    var element = allElements[i];
-                    
-                    // Check for common event listener patterns
-                    if (element.onclick || 
-                        element.onmousedown || 
-                        element.onmouseup ||
-                        element.getAttribute('onclick') ||
-                        element.hasAttribute('data-action') ||
-                        element.hasAttribute('data-click') ||
-                        element.hasAttribute('data-href')) {
-                        
-                        if (element.offsetWidth > 0 && element.offsetHeight > 0) {
-                            elements.push(element);
-                        }
-                    }
-                }
-                
-                return elements;
-            """)
-            
-            print(f"Found {len(listener_elements)} elements with event listeners")
-            return listener_elements
-        except Exception as e:
-            print(f"Error finding event listener elements: {e}")
-            return []
+            return self._head_status(url)
+        except Exception:
+            return None
 
-    def _get_main_content_area(self):
+    def _fetch_status_chain(self, url):
+        """HEAD an absolute URL and return the status codes along its redirect chain"""
+        response = self._http.head(url, allow_redirects=True, timeout=5)
+        return [r.status_code for r in response.history] + [response.status_code]
+        
+    def _fill_status_codes(self, elements):
         """
-        Identify and return the main content area of the page
+        Look up the status codes of all element hrefs concurrently
         
-        Returns:
-            WebElement: Main content area element or None
+        Args:
+            elements (list): ElementInfo objects whose status_code is filled in place
         """
-        # Common selectors for main content areas
-        main_content_selectors = [
-            'main',
-            '[role="main"]',
-            '#main',
-            '#content',
-            '#main-content',
-            '.main-content',
-            '.content',
-            '.page-content',
-            '.site-content'
-        ]
+        # Resolve relative links here, since worker threads have no current URL
+        hrefs = {}
+        for element_info in elements:
+            href = element_info.href
+            if href and not href.startswith('#') and not href.startswith('javascript:'):
+                hrefs[href] = self._normalize_url(urljoin(self.url, href))
+        if not hrefs:
+            return
         
-        for selector in main_content_selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if element.is_displayed():
-                    print(f"Found main content area using selector: {selector}")
-                    return element
-            except NoSuchElementException:
-                continue
-            except Exception as e:
-                print(f"Error checking selector '{selector}': {e}")
-                continue
+        # Repeated URLs, across slides or pages, come straight from the cache
+        urls = set(hrefs.values())
+        logger.info(f"Checking status codes for {len(urls)} links")
+        with ThreadPoolExecutor(max_workers=STATUS_CHECK_WORKERS) as executor:
+            status_codes = dict(zip(urls, executor.map(self._status_chain, urls)))
         
-        print("No specific main content area found, will use exclusion method")
-        return None
-    
-    def _is_in_header_or_footer(self, element, header_footer_selectors):
+        for element_info in elements:
+            href = element_info.href
+            if href in hrefs:
+                element_info.status_code = status_codes[hrefs[href]]
+
+    def _batch_extract_element_info(self, elements):
         """
-        Check if an element is within header or footer sections
+        Read the raw info of many elements in a single round-trip
         
         Args:
-            element: WebElement to check
-            header_footer_selectors: List of CSS selectors for header/footer elements
+            elements (list): WebElements to read
             
         Returns:
-            bool: True if element is in header or footer
+            list: Raw info dict per element, None where it could not be read
         """
+        if not elements:
+            return []
         try:
-            # Check if element itself is a header/footer
-            element_tag = element.tag_name.lower()
-            if element_tag in ['header', 'nav', 'footer']:
-                return True
-            
-            # Check element classes and IDs
-            element_class = element.get_attribute('class') or ''
-            element_id = element.get_attribute('id') or ''
-            element_role = element.get_attribute('role') or ''
-            
-            # Check for header/footer indicators in class or ID
-            header_footer_keywords = [
-                'header', 'nav', 'navigation', 'navbar', 'nav-bar', 'footer',
-                'site-header', 'site-footer', 'page-header', 'page-footer',
-                'main-header', 'main-footer', 'top-nav', 'bottom-nav',
-                'primary-nav', 'secondary-nav', 'breadcrumb'
-            ]
-            
-            element_attributes = f"{element_class} {element_id}".lower()
-            for keyword in header_footer_keywords:
-                if keyword in element_attributes:
-                    return True
-            
-            # Check ARIA roles
-            if element_role in ['banner', 'navigation', 'contentinfo']:
-                return True
-            
-            # Check if element is within a header/footer parent
-            try:
-                # Use JavaScript to check if element is within header/footer
-                is_in_header_footer = self.driver.execute_script("""
-                    var element = arguments[0];
-                    var current = element;
-                    
-                    while (current && current !== document.body) {
-                        var tagName = current.tagName ? current.tagName.toLowerCase() : '';
-                        var className = current.className || '';
-                        var id = current.id || '';
-                        var role = current.getAttribute('role') || '';
-                        
-                        // Check tag names
-                        if (['header', 'nav', 'footer'].includes(tagName)) {
-                            return true;
-                        }
-                        
-                        // Check roles
-                        if (['banner', 'navigation', 'contentinfo'].includes(role)) {
-                            return true;
-                        }
-                        
-                        // Check class names and IDs
-                        var attributes = (className + ' ' + id).toLowerCase();
-                        var keywords = ['header', 'nav', 'navigation', 'navbar', 'nav-belt', 
-                                       'footer', 'navfooter', 'site-header', 'site-footer',
-                                       'page-header', 'page-footer', 'main-header', 'main-footer'];
-                        
-                        for (var i = 0; i < keywords.length; i++) {
-                            if (attributes.includes(keywords[i])) {
-                                return true;
-                            }
-                        }
-                        
-                        current = current.parentElement;
-                    }
-                    
-                    return false;
-                """, element)
-                
-                return is_in_header_footer
-                
-            except Exception as e:
-                print(f"Error checking parent elements: {e}")
-                return False
-                
-        except Exception as e:
-            print(f"Error checking if element is in header/footer: {e}")
-            return False
-    
-    def _is_carousel_element(self, element):
-        """Check if element is part of a carousel that we've already processed"""
-        try:
-            return self.driver.execute_script("""
-                var element = arguments[0];
-                var current = element;
-                var carouselSelectors = [
-                    'carousel', 'slider', 'banner-slider', 'swiper', 'slick',
-                    'owl-carousel', 'hero-banner', 'banner-container', 'slideshow'
-                ];
-                
-                while (current && current !== document.body) {
-                    var className = current.className || '';
-                    for (var i = 0; i < carouselSelectors.length; i++) {
-                        if (className.includes(carouselSelectors[i])) {
-                            return true;
-                        }
-                    }
-                    current = current.parentElement;
-                }
-                return false;
-            """, element)
-        except:
-            return False
-
-    def _get_element_css_selector(self, element):
-            """Generate a CSS selector for the element"""
-            try:
-                return self.driver.execute_script("""
-                    function getCssSelector(el) {
-                        if (!(el instanceof Element)) return '';
-                        var path = [];
-                        while (el.nodeType === Node.ELEMENT_NODE) {
-                            var selector = el.nodeName.toLowerCase();
-                            if (el.id) {
-                                selector += '#' + el.id;
-                                path.unshift(selector);
-                                break;
-                            } else {
-                                var sib = el, nth = 1;
-                                while (sib = sib.previousElementSibling) {
-                                    if (sib.nodeName.toLowerCase() == selector)
-                                        nth++;
-                                }
-                                if (nth != 1)
-                                    selector += ":nth-of-type(" + nth + ")";
-                            }
-                            path.unshift(selector);
-                            el = el.parentNode;
-                        }
-                        return path.join(" > ");
-                    }
-                    return getCssSelector(arguments[0]);
-                """, element)
-            except Exception:
-                return "css_selector_unavailable"
+            return self.driver.execute_script(JS_ELEMENT_INFO_BATCH, elements)
+        except WebDriverException as e:
+            # One stale element fails the whole batch, so fall back to reading them one by one
+            logger.error(f"Batch element read failed, reading elements individually: {e}")
+            infos = []
+            for element in elements:
+                try:
+                    infos.append(self.driver.execute_script(JS_ELEMENT_INFO, element))
+                except WebDriverException:
+                    infos.append(None)
+            return infos
 
-    def get_status_code(self, href):
-        """Return HTTP status code for the given href, or None if not applicable."""
-        try:
-            if not href or href.startswith('#') or href.startswith('javascript:'):
-                return None
-            # Handle relative URLs
-            if href.startswith('/'):
-                from urllib.parse import urljoin
-                href = urljoin(self.url, href)
-            response = requests.head(href, allow_redirects=True, timeout=5)
-            status_chain = [r.status_code for r in response.history] + [response.status_code]
-            return status_chain  # Return final status code
-            # return response.status_code
-        except Exception:
-            return None
+    def _drop_duplicate_infos(self, candidates, infos):
+        """
+        Filter a batch of raw infos down to displayed, enabled, content-unique elements
         
-    def _extract_element_info(self, element):
+        Args:
+            candidates (list): (element, detection_method) pairs
+            infos (list): Raw info per candidate from _batch_extract_element_info
+            
+        Returns:
+            list: (candidate, info, dedup_key) triples, first occurrence of each signature
         """
-        Extract and deduplicate element info based on unique content signature.
+        unique = {}
+        for candidate, info in zip(candidates, infos):
+            if not (info and info['is_displayed'] and info['is_enabled']):
+                continue
+            dedup_key = (info['tag_name'], info['text'], info['href'], info['class_names'], info['id'])
+            if dedup_key not in unique:
+                unique[dedup_key] = (candidate, info, dedup_key)
+        return list(unique.values())
+
+    def _extract_element_info(self, element, info=None, dedup_key=None):
+        """
+        Build the element info for an element based on its content signature.
+        
+        Args:
+            element: WebElement to extract
+            info (dict): Raw info already read by _batch_extract_element_info
+            dedup_key (tuple): Content signature already computed by _drop_duplicate_infos
         """
         try:
             # Skip hidden/invisible elements
             # if not element.is_displayed():
             #     return None
 
+            # Read every attribute in a single round-trip unless already batched
+            if info is None:
+                info = self.driver.execute_script(JS_ELEMENT_INFO, element)
+            
             # Extract key info
-            tag_name = element.tag_name
-            text = element.text.strip()[:100] if element.text else ''
-            class_names = element.get_attribute('class') or ''
-            href = element.get_attribute('href') or ''
-            status_code = self.get_status_code(href) if href else None, 
-            onclick = element.get_attribute('onclick') or ''
-            element_id = element.get_attribute('id') or ''
-
-            # Create deduplication hash (more robust and minimalistic)
-            dedup_key = f"{tag_name}|{text}|{href}|{class_names}|{element_id}"
-            unique_id = hashlib.md5(dedup_key.encode()).hexdigest()
-
-            # Deduplication set
-            if not hasattr(self, 'seen_elements'):
-                self.seen_elements = set()
-            if unique_id in self.seen_elements:
-                return None  # Already processed
-            self.seen_elements.add(unique_id)
+            tag_name = info['tag_name']
+            text = info['text']
+            # Class strings repeat across a page, so every copy shares one object
+            class_names = sys.intern(info['class_names'])
+            href = info['href']
+            onclick = info['onclick']
+            element_id = info['id']
+
+            # Content signature; duplicates were already dropped for the whole batch
+            if dedup_key is None:
+                dedup_key = (tag_name, text, href, class_names, element_id)
+
+            # Stable hex id for the results
+            unique_id = self._hash_key(dedup_key)
 
             # Final full element info
-            element_info = {
-                'tag_name': tag_name,
-                'text': text,
-                'class_names': class_names,
-                'id': element_id,
-                'href': href,
-                'onclick': onclick,
-                'status_code': status_code,  # type: ignore
-                'role': element.get_attribute('role') or '',
-                'type': element.get_attribute('type') or '',
-                'data_testid': element.get_attribute('data-testid') or '',
-                'aria_label': element.get_attribute('aria-label') or '',
-                'title': element.get_attribute('title') or '',
-                'name': element.get_attribute('name') or '',
-                'value': element.get_attribute('value') or '',
-                'src': element.get_attribute('src') or '',
-                'alt': element.get_attribute('alt') or '',
-                'xpath': self._get_element_xpath(element),
-                'css_selector': self._get_element_css_selector(element),
-                'location': element.location,
-                'size': element.size,
-                'is_displayed': element.is_displayed(),
-                'is_enabled': element.is_enabled(),
-                'unique_id': unique_id
-            }
+            element_info = ElementInfo(
+                tag_name=tag_name,
+                text=text,
+                class_names=class_names,
+                id=element_id,
+                href=href,
+                onclick=onclick,
+                role=info['role'],
+                type=info['type'],
+                data_testid=info['data_testid'],
+                aria_label=info['aria_label'],
+                title=info['title'],
+                name=info['name'],
+                value=info['value'],
+                src=info['src'],
+                alt=info['alt'],
+                xpath=info['xpath'],
+                css_selector=info['css_selector'],
+                location=info['location'],
+                size=info['size'],
+                is_displayed=info['is_displayed'],
+                is_enabled=info['is_enabled'],
+                unique_id=unique_id
+            )
 
             return element_info
 
         except Exception as e:
-            print(f"Error extracting element info: {e}")
+            logger.error(f"Error extracting element info: {e}")
             return None
         
-    def _get_element_xpath(self, element):
-        """Generate XPath for an element"""
-        try:
-            return self.driver.execute_script(
-                "function getXPath(element) {"
-                "if (element.id !== '') return '//*[@id=\"' + element.id + '\"]';"
-                "if (element === document.body) return '/html/body';"
-                "var ix = 0;"
-                "var siblings = element.parentNode.childNodes;"
-                "for (var i = 0; i < siblings.length; i++) {"
-                "var sibling = siblings[i];"
-                "if (sibling === element) return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';"
-                "if (sibling.nodeType === 1 && sibling.tagName === element.tagName) ix++;"
-                "}"
-                "}"
-                "return getXPath(arguments[0]);", element
-            )
-        except:
-            return "xpath_unavailable"
-    
     def _create_unique_id(self, element_info):
-        """Create a unique identifier for an element"""
-        components = [
-            element_info['tag_name'],
-            element_info['id'],
-            element_info['class_names'],
-            element_info['text'][:50],
-            str(element_info['location']),
-        ]
-        return hash('|'.join(str(c) for c in components))
+        """
+        Create a unique identifier for an element from its stable fields
+        
+        href and onclick are left out on purpose: the xpath already tells
+        apart elements that share a tag, classes and text.
+        """
+        return self._hash_key((element_info.tag_name, element_info.xpath,
+                               element_info.class_names, element_info.text[:32]))
+
+    def _hash_key(self, parts):
+        """Short, process-stable hex digest of string fields"""
+        return hashlib.blake2b('|'.join(parts).encode(), digest_size=8).hexdigest()
     
     # def is_dead_click_by_href(self, element_info):
     #     """ Returns True if the element is a dead click based on href and onclick.
@@ -995,15 +1528,22 @@ class ClickableElementTester:
     
     def is_dead_click_by_href(self, element_info):
                         """Returns True if the element is a dead click based on href."""
-                        href = (element_info.get('href') or '').replace(' ', '').lower()
+                        href = (element_info.href or '').replace(' ', '').lower()
                         return href in ['javascript:void(0)', 'javascript::void(0)','#',' ']
     
+    def _count_displayed_ui(self):
+        """Number of modals and dropdowns currently showing"""
+        try:
+            return self.driver.execute_script(JS_COUNT_DISPLAYED, MODAL_CSS + ', ' + DROPDOWN_CSS)
+        except WebDriverException:
+            return 0
+
     def test_element_click(self, element_info):
         """
         Test if an element click is functional or dead - with carousel support
         
         Args:
-            element_info (dict): Element information
+            element_info (ElementInfo): Element information
             
         Returns:
             dict: Test result
@@ -1026,9 +1566,16 @@ class ClickableElementTester:
             initial_title = self.driver.title
             result['url_before'] = initial_url
             
+            # A javascript:void(0) or '#' href is dead by definition, no need to click it
+            if self.is_dead_click_by_href(element_info):
+                result['url_after'] = initial_url
+                result['click_status'] = 'dead_click'
+                result['error_message'] = 'Dead click: href is javascript:void(0) or #'
+                return result
+            
             # Try to find the element again (to avoid stale references)
             # Special handling for carousel elements
-            if element_info.get('is_carousel_element', False):
+            if element_info.is_carousel_element:
                 element = self._find_and_prepare_carousel_element(element_info)
             else:
                 element = self._find_element_by_info(element_info)
@@ -1040,14 +1587,17 @@ class ClickableElementTester:
             
             
             # For carousel elements, ensure they're visible before clicking
-            if element_info.get('is_carousel_element', False):
+            if element_info.is_carousel_element:
                 self._make_carousel_element_clickable(element)
             
             # Scroll element into view
             # self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
             # time.sleep(0.5)
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            time.sleep(1)
+            try:
+                WebDriverWait(self.driver, CLICK_EFFECT_TIMEOUT).until(EC.element_to_be_clickable(element))
+            except TimeoutException:
+                pass  # Reported as not_clickable below
             
             # Check if element is still clickable
             if not (element.is_displayed() and element.is_enabled()):
@@ -1055,6 +1605,8 @@ class ClickableElementTester:
                 result['error_message'] = 'Element is not displayed or enabled'
                 return result
             
+            initial_ui = self._count_displayed_ui()
+            
             # Attempt to click the element
             try:
                 # Try regular click first
@@ -1070,8 +1622,16 @@ class ClickableElementTester:
                     result['error_message'] = f'Click intercepted: {str(js_error)}'
                     return result
             
-            # Wait a moment for any changes to occur
-            time.sleep(2)
+            # Wait until the click navigates, retitles the page or shows a new
+            # modal/dropdown, giving up after CLICK_EFFECT_TIMEOUT seconds
+            try:
+                WebDriverWait(self.driver, CLICK_EFFECT_TIMEOUT).until(EC.any_of(
+                    EC.url_changes(initial_url),
+                    lambda driver: driver.title != initial_title,
+                    lambda driver: self._count_displayed_ui() > initial_ui
+                ))
+            except TimeoutException:
+                pass
             
             # Check for changes after click
             current_url = self.driver.current_url
@@ -1080,33 +1640,18 @@ class ClickableElementTester:
             
             # Determine if click was active or dead
             
-            if self.is_dead_click_by_href(element_info):
-                result['click_status'] = 'dead_click'
-                result['error_message'] = 'Dead click: href is javascript:void(0)'
-            elif current_url != initial_url:
+            if current_url != initial_url:
                 result['click_status'] = 'active_navigation'
                 result['page_changed'] = True
             elif current_title != initial_title:
                 result['click_status'] = 'active_title_change'
                 result['page_changed'] = True
+            elif self._count_displayed_ui() > initial_ui:
+                # A modal or dropdown opened; hidden ones already in the markup don't count
+                result['click_status'] = 'active_ui_change'
+                result['new_elements_appeared'] = True
             else:
-                # Check for new elements or modals
-                try:
-                    # Look for common indicators of dynamic content
-                    modals = self.driver.find_elements(By.CSS_SELECTOR, 
-                        '.modal, .popup, .overlay, .dialog, [role="dialog"], [role="alertdialog"]')
-                    
-                    dropdowns = self.driver.find_elements(By.CSS_SELECTOR,
-                        '.dropdown-menu, .menu-open, [aria-expanded="true"]')
-                    
-                    if modals or dropdowns:
-                        result['click_status'] = 'active_ui_change'
-                        result['new_elements_appeared'] = True
-                    else:
-                        result['click_status'] = 'dead_click'
-                        
-                except Exception:
-                    result['click_status'] = 'dead_click'
+                result['click_status'] = 'dead_click'
             
         except TimeoutException:
             result['click_status'] = 'timeout'
@@ -1148,82 +1693,38 @@ class ClickableElementTester:
             return None
             
         except Exception as e:
-            print(f"Error finding carousel element: {e}")
+            logger.error(f"Error finding carousel element: {e}")
             return None
 
     def _find_element_by_info_in_container(self, element_info, container):
         """Find element within a specific container"""
-        strategies = [
-            (By.ID, element_info['id']) if element_info['id'] else None,
-            (By.XPATH, element_info['xpath']) if element_info['xpath'] != 'xpath_unavailable' else None,
-            (By.CSS_SELECTOR, f".{element_info['class_names'].replace(' ', '.')}") if element_info['class_names'] else None,
-        ]
-        
-        for strategy in strategies:
-            if strategy:
-                try:
-                    elements = container.find_elements(*strategy)
-                    for element in elements:
-                        if (element.tag_name == element_info['tag_name'] and
-                            element.text.strip()[:100] == element_info['text']):
-                            return element
-                except Exception:
-                    continue
-        
-        return None
+        try:
+            return self.driver.execute_script(JS_FIND_BY_INFO, container, self._lookup_info(element_info), False)
+        except Exception:
+            return None
+
+    def _lookup_info(self, element_info):
+        """Fields JS_FIND_BY_INFO needs to re-locate an element"""
+        return {key: getattr(element_info, key) or '' for key in ('id', 'xpath', 'class_names', 'tag_name', 'text')}
 
     def _make_carousel_element_clickable(self, element):
         """Make a carousel element visible and clickable"""
         try:
-            # Make element and its parents visible
-            self.driver.execute_script("""
-                var element = arguments[0];
-                var current = element;
-                
-                while (current && current !== document.body) {
-                    current.style.display = 'block';
-                    current.style.visibility = 'visible';
-                    current.style.opacity = '1';
-                    current.style.position = 'relative';
-                    current.style.zIndex = 'auto';
-                    
-                    // Remove transforms that might hide the element
-                    current.style.transform = 'none';
-                    current.style.webkitTransform = 'none';
-                    
-                    current = current.parentElement;
-                }
-            """, element)
-            
-            time.sleep(0.5)  # Allow styles to apply
+            # Make element and its parents visible; the rule applies on the next style pass
+            self.driver.execute_script(JS_SHOW_CAROUSEL_ANCESTORS, element)
             
         except Exception as e:
-            print(f"Error making carousel element clickable: {e}")
+            logger.error(f"Error making carousel element clickable: {e}")
 
 
     
     
     def _find_element_by_info(self, element_info):
         """Find element using stored information"""
-        strategies = [
-            (By.ID, element_info['id']) if element_info['id'] else None,
-            (By.XPATH, element_info['xpath']) if element_info['xpath'] != 'xpath_unavailable' else None,
-            (By.CSS_SELECTOR, f".{element_info['class_names'].replace(' ', '.')}") if element_info['class_names'] else None,
-        ]
-        
-        for strategy in strategies:
-            if strategy:
-                try:
-                    elements = self.driver.find_elements(*strategy)
-                    for element in elements:
-                        if (element.is_displayed() and 
-                            element.tag_name == element_info['tag_name'] and
-                            element.text.strip()[:100] == element_info['text']):
-                            return element
-                except Exception:
-                    continue
-        
-        return None
+        try:
+            return self.driver.execute_script(JS_FIND_BY_INFO, None, self._lookup_info(element_info), True)
+        except Exception:
+            return None
     
 #   from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException
 
@@ -1269,22 +1770,24 @@ class ClickableElementTester:
     #             continue
  
  
-    def run_comprehensive_test(self, url, max_elements=50):
+    def run_comprehensive_test(self, url, max_elements=50, results_path=None):
         """
         Run comprehensive test on all clickable elements
         
         Args:
             url (str): URL to test
             max_elements (int): Maximum number of elements to test
+            results_path (str): Stream each click result to this NDJSON file as it
+                is produced instead of keeping them all in 'results'
             
         Returns:
             dict: Complete test results
         """
-        print(f"\n{'='*60}")
-        print(f"Starting Comprehensive Clickability Test")
-        print(f"URL: {url}")
-        print(f"Timestamp: {datetime.now()}")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Starting Comprehensive Clickability Test")
+        logger.info(f"URL: {url}")
+        logger.info(f"Timestamp: {datetime.now()}")
+        logger.info(f"{'='*60}\n")
         
         try:
             # Find all clickable elements
@@ -1307,162 +1810,251 @@ class ClickableElementTester:
                 'timestamp': datetime.now().isoformat()
             }
             
-            # Test each element
-            for i, element_info in enumerate(clickable_elements, 1):
-                print(f"\nTesting element {i}/{len(clickable_elements)}")
-                print(f"Tag: {element_info['tag_name']}, "
-                      f"Class: {element_info['class_names'][:50]}{'...' if len(element_info['class_names']) > 50 else ''}, "
-                      f"Text: {element_info['text'][:30]}{'...' if len(element_info['text']) > 30 else ''}")
-                # self.close_popups()
-                self.driver.get(url)  # Ensure we're on the correct page
-                time.sleep(2)  # Allow page to load        
-                  # Always refresh the page before each test to avoid popups
-             # Allow page to reload
-                
-                # Go back to original page if we navigated away
-                if self.driver.current_url != url:
-                    print("Returning to original page...")
-                    self.driver.get(url)
-                    time.sleep(2)
-                # self.close_popups()
-                result = self.test_element_click(element_info)
-                test_results['results'].append(result)
-                test_results['elements_tested'] += 1
-                
-                # Update counters
-                if result['click_status'].startswith('active'):
-                    test_results['active_clicks'] += 1
-                    print(f"✅ ACTIVE: {result['click_status']}")
-                elif result['click_status'] == 'dead_click':
-                    test_results['dead_clicks'] += 1
-                    print(f"❌ DEAD CLICK")
-                else:
-                    test_results['errors'] += 1
-                    print(f"⚠️  ERROR: {result['click_status']} - {result['error_message']}")
+            # URL the page settled on, after any redirects
+            page_url = self.driver.current_url
+            
+            # Running tallies, so the summary does not need the full results list
+            class_counts = Counter()
+            status_counts = Counter()
+            if results_path:
+                test_results['results_file'] = results_path
+            
+            results_file = open(results_path, 'wb') if results_path else None
+            try:
+                # Test each element
+                for i, element_info in enumerate(clickable_elements, 1):
+                    logger.info(f"\nTesting element {i}/{len(clickable_elements)}")
+                    logger.info(f"Tag: {element_info.tag_name}, "
+                          f"Class: {element_info.class_names[:50]}{'...' if len(element_info.class_names) > 50 else ''}, "
+                          f"Text: {element_info.text[:30]}{'...' if len(element_info.text) > 30 else ''}")
+                    # self.close_popups()
+                    # Go back to original page if we navigated away; a page that
+                    # stayed put is reused as is instead of being reloaded
+                    if self.driver.current_url != page_url:
+                        logger.info("Returning to original page...")
+                        self.driver.get(url)
+                        self._wait_ready(JS_DOCUMENT_COMPLETE)
+                    # self.close_popups()
+                    result = self.test_element_click(element_info)
+                    
+                    # Close any modal or dropdown the click opened rather than reloading
+                    if result['click_status'] == 'active_ui_change':
+                        try:
+                            ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+                        except Exception as e:
+                            logger.warning(f"Could not dismiss opened UI: {e}")
+                    if results_file:
+                        results_file.write(_dump_json(result, compact=True) + b'\n')
+                        results_file.flush()
+                    else:
+                        test_results['results'].append(result)
+                    self._tally_result(result, class_counts, status_counts)
+                    test_results['elements_tested'] += 1
+                    
+                    # Update counters
+                    if result['click_status'].startswith('active'):
+                        test_results['active_clicks'] += 1
+                        logger.info(f"✅ ACTIVE: {result['click_status']}")
+                    elif result['click_status'] == 'dead_click':
+                        test_results['dead_clicks'] += 1
+                        logger.info(f"❌ DEAD CLICK")
+                    else:
+                        test_results['errors'] += 1
+                        logger.warning(f"⚠️  ERROR: {result['click_status']} - {result['error_message']}")
+            finally:
+                if results_file:
+                    results_file.close()
             
             # Generate summary
-            test_results['summary'] = self._generate_summary(test_results)
+            test_results['summary'] = self._generate_summary(test_results, class_counts, status_counts)
             
             return test_results
             
         except Exception as e:
-            print(f"Error during comprehensive test: {e}")
+            logger.error(f"Error during comprehensive test: {e}")
             return {'error': str(e)}
     
-    def _generate_summary(self, test_results):
-        """Generate test summary statistics"""
+    def _generate_summary(self, test_results, class_counts=None, status_counts=None):
+        """
+        Generate test summary statistics
+        
+        Args:
+            test_results (dict): Results of run_comprehensive_test
+            class_counts (Counter): Class name tally kept while testing
+            status_counts (Counter): Click status tally kept while testing;
+                both are rebuilt from test_results['results'] when omitted
+        """
+        tested = test_results['elements_tested']
+        scale = 100 / tested if tested > 0 else 0
+        if class_counts is None or status_counts is None:
+            class_counts, status_counts = self._aggregate_results(test_results['results'])
+        most_common_classes = class_counts.most_common(10)
+        click_status_breakdown = dict(status_counts)
         summary = {
-            'total_tested': test_results['elements_tested'],
-            'active_percentage': round((test_results['active_clicks'] / test_results['elements_tested']) * 100, 2) if test_results['elements_tested'] > 0 else 0,
-            'dead_percentage': round((test_results['dead_clicks'] / test_results['elements_tested']) * 100, 2) if test_results['elements_tested'] > 0 else 0,
-            'error_percentage': round((test_results['errors'] / test_results['elements_tested']) * 100, 2) if test_results['elements_tested'] > 0 else 0,
-            'most_common_classes': self._get_most_common_classes(test_results['results']),
-            'click_status_breakdown': self._get_click_status_breakdown(test_results['results'])
+            'total_tested': tested,
+            # Kept at full precision; the report rounds them for display
+            'active_percentage': test_results['active_clicks'] * scale,
+            'dead_percentage': test_results['dead_clicks'] * scale,
+            'error_percentage': test_results['errors'] * scale,
+            'most_common_classes': most_common_classes,
+            'click_status_breakdown': click_status_breakdown
         }
         return summary
     
-    def _get_most_common_classes(self, results):
-        """Get most common class names from tested elements"""
-        class_counts = {}
-        for result in results:
-            classes = result['element_info']['class_names']
-            if classes:
-                for class_name in classes.split():
-                    class_counts[class_name] = class_counts.get(class_name, 0) + 1
+    def _aggregate_results(self, results):
+        """
+        Tally class names and click statuses of the tested elements
         
-        return sorted(class_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-    
-    def _get_click_status_breakdown(self, results):
-        """Get breakdown of click statuses"""
-        status_counts = {}
-        for result in results:
-            status = result['click_status']
-            status_counts[status] = status_counts.get(status, 0) + 1
+        Returns:
+            tuple: (Counter of class names, Counter of click statuses)
+        """
+        # Each tally is fed from an iterator, so the counting loop runs in C
+        class_counts = Counter(itertools.chain.from_iterable(
+            _class_tokens(result['element_info'].class_names) for result in results))
+        status_counts = Counter(map(itemgetter('click_status'), results))
         
-        return status_counts
+        return class_counts, status_counts
+
+    def _tally_result(self, result, class_counts, status_counts):
+        """Add one click result to the class name and click status tallies"""
+        # Interned tokens hash once and compare by identity in the Counter
+        class_counts.update(_class_tokens(result['element_info'].class_names))
+        status_counts[result['click_status']] += 1
     
     def print_detailed_report(self, test_results):
         """Print detailed test report"""
-        print(f"\n{'='*80}")
-        print(f"DETAILED TEST REPORT")
-        print(f"{'='*80}")
+        # Collect the whole report and write it at once instead of line by line
+        lines = []
+        append = lines.append
+        summary = test_results['summary']
+        results = test_results['results']
+        append(f"\n{'='*80}")
+        append(f"DETAILED TEST REPORT")
+        append(f"{'='*80}")
         
-        print(f"\n📊 SUMMARY STATISTICS:")
-        print(f"   Total Elements Found: {test_results['total_elements_found']}")
-        print(f"   Elements Tested: {test_results['elements_tested']}")
-        print(f"   Active Clicks: {test_results['active_clicks']} ({test_results['summary']['active_percentage']}%)")
-        print(f"   Dead Clicks: {test_results['dead_clicks']} ({test_results['summary']['dead_percentage']}%)")
-        print(f"   Errors: {test_results['errors']} ({test_results['summary']['error_percentage']}%)")
+        append(f"\n📊 SUMMARY STATISTICS:")
+        append(f"   Total Elements Found: {test_results['total_elements_found']}")
+        append(f"   Elements Tested: {test_results['elements_tested']}")
+        append(f"   Active Clicks: {test_results['active_clicks']} ({summary['active_percentage']:.2f}%)")
+        append(f"   Dead Clicks: {test_results['dead_clicks']} ({summary['dead_percentage']:.2f}%)")
+        append(f"   Errors: {test_results['errors']} ({summary['error_percentage']:.2f}%)")
         
-        print(f"\n🏷️  MOST COMMON CLASSES:")
-        for class_name, count in test_results['summary']['most_common_classes'][:5]:
-            print(f"   {class_name}: {count}")
+        append(f"\n🏷️  MOST COMMON CLASSES:")
+        for class_name, count in itertools.islice(summary['most_common_classes'], 5):
+            append(f"   {class_name}: {count}")
         
-        print(f"\n📈 CLICK STATUS BREAKDOWN:")
-        for status, count in test_results['summary']['click_status_breakdown'].items():
-            print(f"   {status}: {count}")
+        append(f"\n📈 CLICK STATUS BREAKDOWN:")
+        for status, count in summary['click_status_breakdown'].items():
+            append(f"   {status}: {count}")
         
-        print(f"\n🔍 DETAILED RESULTS:")
-        for i, result in enumerate(test_results['results'][:10], 1):  # Show first 10 detailed results
+        append(f"\n🔍 DETAILED RESULTS:")
+        for i, result in enumerate(itertools.islice(results, 10), 1):  # Show first 10 detailed results
             element = result['element_info']
-            print(f"\n   [{i}] {element['tag_name'].upper()}")
-            print(f"       Class: {element['class_names'][:80]}")
-            print(f"       Text: {element['text'][:80]}")
-            print(f"       Status: {result['click_status']}")
-            if result['error_message']:
-                print(f"       Error: {result['error_message']}")
+            append(f"\n   [{i}] {element.tag_name.upper()}")
+            append(f"       Class: {element.class_names[:80]}")
+            append(f"       Text: {element.text[:80]}")
+            append(f"       Status: {result['click_status']}")
+            error_message = result['error_message']
+            if error_message:
+                append(f"       Error: {error_message}")
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     
-    def save_results_to_file(self, test_results, filename=None):
-        """Save test results to JSON file"""
-        if not filename:
-            # timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            name = self.url.split('/')
-            print(name[-1])
-            filename = f"clickability_test_results_{name[-1]}.json"
+    def save_results_to_file(self, test_results, filename=None, compact=False, ndjson=False):
+        """
+        Save test results to JSON file
+        
+        Args:
+            test_results (dict): Results of run_comprehensive_test
+            filename (str): Output file, named after the tested URL by default
+            compact (bool): Write JSON without indentation, for machine consumers
+            ndjson (bool): Write one result per line, with the remaining fields
+                in a '.summary.json' file next to it
+        """
+        # timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        extension = 'ndjson' if ndjson else 'json'
+        filename = filename or f"clickability_test_results_{getattr(self._local, 'url_slug', 'root')}.{extension}"
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(test_results, f, indent=2, ensure_ascii=False)
-            print(f"\n💾 Results saved to: {filename}")
+            with open(filename, 'wb') as f:
+                if ndjson:
+                    # Consumers can stream the results without loading the whole file
+                    for result in test_results.get('results', []):
+                        f.write(_dump_json(result, compact=True) + b'\n')
+                else:
+                    f.write(_dump_json(test_results, compact))
+            if ndjson:
+                header = {key: value for key, value in test_results.items() if key != 'results'}
+                with open(os.path.splitext(filename)[0] + '.summary.json', 'wb') as f:
+                    f.write(_dump_json(header, compact))
+            logger.info(f"\n💾 Results saved to: {filename}")
         except Exception as e:
-            print(f"Error saving results: {e}")
-    
+            logger.error(f"Error saving results: {e}")
+
     def close(self):
-        """Close the browser driver"""
-        if self.driver:
-            self.driver.quit()
-            print("Browser closed.")
-
-def run_script_separate_drivers(url, test_name):
-        """Run script with separate driver instance for each thread"""
-        print(f"\n🚀 Starting test for {test_name}: {url}")
+        """Close every browser started by this tester"""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            driver.quit()
+        self._http.close()
+        with self._page_cache_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+                self._disk_cache = None
+        if drivers:
+            logger.debug("Browser closed.")
+
+def run_script_separate_drivers(url, test_name, save_file=True):
+        """Run script with separate driver instance for each thread; save_file=False leaves saving to the caller"""
+        logger.info(f"\n🚀 Starting test for {test_name}: {url}")
         tester = None
         try:
             tester = ClickableElementTester(headless=False, timeout=10)
             results = tester.run_comprehensive_test(url)
             
             # Print detailed report
-            print(f"\n{'='*60}")
-            print(f"REPORT FOR {test_name.upper()}")
-            print(f"{'='*60}")
+            logger.info(f"\n{'='*60}")
+            logger.info(f"REPORT FOR {test_name.upper()}")
+            logger.info(f"{'='*60}")
             tester.print_detailed_report(results)
             
             # Save results to file with unique name
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"clickability_test_{test_name}_{timestamp}.json"
-            tester.save_results_to_file(results, filename)
+            if save_file:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"clickability_test_{test_name}_{timestamp}.json"
+                tester.save_results_to_file(results, filename)
             
             return results
             
         except Exception as e:
-            print(f"❌ Test failed for {test_name}: {e}")
+            logger.error(f"❌ Test failed for {test_name}: {e}")
             return None
         finally:
             if tester:
                 tester.close()
 
-def run_concurrent_tests_with_process_pool():
+def _init_worker_logging(log_queue, level):
+    """Route a pool worker's log records to the parent's queue listener"""
+    import logging.handlers
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+def run_concurrent_tests_with_process_pool(use_processes=False, save_per_worker=False, results_path=None):
+    """
+    Test several URLs concurrently, each with its own tester and driver
+    
+    Args:
+        use_processes (bool): Use worker processes instead of threads. The work
+            is spent waiting on browsers, so threads are the default
+        save_per_worker (bool): Let every worker write its own JSON file instead
+            of collecting all results into one NDJSON file here
+        results_path (str): Combined NDJSON file, one {'name', 'result'} line per URL
+    """
     from concurrent.futures import ProcessPoolExecutor, as_completed
+    import logging.handlers
     import multiprocessing
     
     # Define test URLs
@@ -1472,36 +2064,63 @@ def run_concurrent_tests_with_process_pool():
         ("https://www.bajajfinserv.in/gold-loan", "Gold-loan")
     ]
     
-    print("🔄 Running concurrent tests with process pool...")
-    
-    # Limit the number of processes to avoid overwhelming the system
-    max_workers = min(len(test_urls), multiprocessing.cpu_count())
+    listener = None
+    if use_processes:
+        logger.info("🔄 Running concurrent tests with process pool...")
+        # Workers send their log records back through a queue, so one listener
+        # writes them and lines from different processes do not interleave
+        log_queue = multiprocessing.Manager().Queue()
+        handlers = logging.getLogger().handlers or [logging.StreamHandler()]
+        listener = logging.handlers.QueueListener(log_queue, *handlers)
+        listener.start()
+        # Limit the number of processes to avoid overwhelming the system
+        max_workers = min(len(test_urls), multiprocessing.cpu_count())
+        pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker_logging,
+                                   initargs=(log_queue, logging.getLogger().level))
+    else:
+        logger.info("🔄 Running concurrent tests with thread pool...")
+        # Threads only wait on their browsers, so one per URL
+        pool = ThreadPoolExecutor(max_workers=len(test_urls))
     
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+    with pool as executor:
         # Submit all tasks
         future_to_name = {
-            executor.submit(run_script_separate_drivers, url, name): name 
+            executor.submit(run_script_separate_drivers, url, name, save_per_worker): name 
             for url, name in test_urls
         }
         
         results = {}
+        if not save_per_worker:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            results_path = results_path or f"clickability_test_batch_{timestamp}.ndjson"
+        out = open(results_path, 'wb') if not save_per_worker else None
         
         # Process completed tasks
-        for future in as_completed(future_to_name):
-            name = future_to_name[future]
-            try:
-                result = future.result()
-                results[name] = result
-                print(f"✅ Completed test for {name}")
-            except Exception as e:
-                print(f"❌ Test failed for {name}: {e}")
-                results[name] = None
+        try:
+            for future in as_completed(future_to_name):
+                name = future_to_name[future]
+                try:
+                    result = future.result()
+                    results[name] = result
+                    logger.info(f"✅ Completed test for {name}")
+                except Exception as e:
+                    logger.error(f"❌ Test failed for {name}: {e}")
+                    results[name] = None
+                if out:
+                    out.write(_dump_json({'name': name, 'result': results[name]}, compact=True) + b'\n')
+        finally:
+            if out:
+                out.close()
+                logger.info(f"\n💾 Results saved to: {results_path}")
     
-    print(f"\n✅ All concurrent tests completed!")
+    if listener:
+        listener.stop()
+    logger.info(f"\n✅ All concurrent tests completed!")
     return results
 
 def main():
     """Main function to run the clickable element tester"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     # Test URL - Bajaj Finserv Personal Loan Page
     # test_url = "https://bajajfinserv.in/personal-loan"
     # test_url = "https://www.bajajfinserv.in/gold-loan"
@@ -1533,7 +2152,7 @@ def main():
         # print("⏳ You have 30 second to complete login/signup in the browser window...")
         # time.sleep(120)  # Wait 1 minute for manual login
 
-        print("🔍 Starting clickable element detection and dead click testing...")
+        logger.info("🔍 Starting clickable element detection and dead click testing...")
         results = tester.run_comprehensive_test(test_url)
         # print("⏳ You have 1 minute to complete login/signup in the browser window...")
         # time.sleep(60)  # Wait 1 minute for manual login
@@ -1559,9 +2178,9 @@ def main():
         # results = run_concurrent_tests_with_process_pool()
 
     except KeyboardInterrupt:
-        print("\nTest interrupted by user.")
+        logger.info("\nTest interrupted by user.")
     except Exception as e:
-        print(f"Test failed with error: {e}")
+        logger.error(f"Test failed with error: {e}")
     # finally:
     #     # Clean up
     #     tester.close()
@@ -1,9 +1,23 @@
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 import json
-from datetime import datetime
+import math
+import functools
 import hashlib
+import logging
+from dataclasses import dataclass, asdict
+import multiprocessing
+from multiprocessing.util import Finalize
+from datetime import datetime
+import queue
+import random
+import re
+import socket
+import sys
+import threading
 import requests
+import urllib3
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -18,13 +32,620 @@ from selenium.common.exceptions import (
     ElementNotInteractableException
 )
 from selenium.webdriver.chrome.options import Options
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 from typing import Dict, List, Optional, Union, Set
 
-class ClickableElementTester:
+logger = logging.getLogger(__name__)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """text cut to limit characters, with an ellipsis when anything was cut"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+# Number of distinct class attribute strings whose split tokens are remembered
+CLASS_TOKEN_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=CLASS_TOKEN_CACHE_SIZE)
+def _class_tokens(class_names: str) -> tuple:
+    """Interned class tokens of a class attribute; elements sharing a class list split it once"""
+    return tuple(map(sys.intern, class_names.split()))
+
+# dataclass(slots=True) needs Python 3.10; earlier versions get a plain dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ElementInfo:
+    """Everything recorded about one clickable element; slots keep thousands of them compact"""
+    tag_name: str
+    text: str
+    class_names: str
+    id: str
+    href: str
+    onclick: str
+    role: str
+    type: str
+    data_testid: str
+    aria_label: str
+    xpath: str
+    location: dict
+    size: dict
+    is_displayed: bool
+    is_enabled: bool
+    unique_id: Optional[str] = None
+    status_code: Optional[List[int]] = None  # Filled in by _resolve_status_codes
+    title: Optional[str] = None
+    name: Optional[str] = None
+    value: Optional[str] = None
+    src: Optional[str] = None
+    alt: Optional[str] = None
+    css_selector: Optional[str] = None
+    is_carousel_element: bool = False
+    detection_method: Optional[str] = None
+
+
+class _ClickableDiscovery:
+    """Selectors, page scripts and the discovery and status-check steps that need
+    nothing but execute_script, shared by the WebDriver and Playwright testers.
+    
+    Subclasses provide self.driver and call _setup_discovery_state() on init.
+    """
+    
+    # Selectors for the main content area, in order of preference
+    MAIN_CONTENT_SELECTORS = (
+        'main',
+        '[role="main"]',
+        '#main',
+        '#content',
+        '#main-content',
+        '.main-content',
+        '.content',
+        '.page-content',
+        '.site-content'
+    )
+    
+    # Sections a clickable must not sit in
+    HEADER_FOOTER_SELECTORS = (
+        'header', 'nav', 'footer',
+        '.header', '.nav', '.footer', '.navigation',
+        '#header', '#nav', '#footer', '#navigation',
+        '[role="banner"]', '[role="navigation"]', '[role="contentinfo"]',
+        '.site-header', '.site-footer', '.page-header', '.page-footer',
+        '.main-header', '.main-footer', '.top-nav', '.bottom-nav',
+        '.navbar', '.nav-bar', '.site-nav', '.primary-nav'
+    )
+    
+    # Regular clickable elements
+    CLICKABLE_SELECTORS = (
+        'a', 'button', 
+        'input[type="button"]', 'input[type="submit"]', 'input[type="reset"]',
+        '[onclick]', '[onmousedown]', '[onmouseup]', '[ondblclick]',
+        '[role="button"]', '[role="link"]', '[role="tab"]', '[role="menuitem"]',
+        '[role="option"]', '[role="treeitem"]', '[role="gridcell"]',
+        '[tabindex="0"]', '[tabindex="-1"]', 'div[tabindex]', 'span[tabindex]',
+        'li[tabindex]', 'td[tabindex]', 'th[tabindex]',
+        '.btn', '.button', '.link', '.clickable', '.click',
+        '.cta', '.call-to-action', '.action', '.trigger',
+        '.menu-item', '.nav-item', '.tab', '.accordion',
+        '.dropdown', '.select', '.picker', '.toggle',
+        '.card', '.tile', '.item', '.option',
+        '.close', '.cancel', '.submit', '.save', '.edit', '.delete',
+        '.expand', '.collapse', '.show', '.hide',
+        '.play', '.pause', '.stop', '.next', '.prev', '.previous',
+        '.like', '.share', '.favorite', '.bookmark',
+        '.download', '.upload', '.search', '.filter', '.sort',
+        '[data-action]', '[data-click]', '[data-href]', '[data-url]',
+        '[data-toggle]', '[data-target]', '[data-dismiss]',
+        '[data-testid*="button"]', '[data-testid*="link"]', '[data-testid*="click"]',
+        '[data-cy*="button"]', '[data-cy*="link"]', '[data-cy*="click"]',
+        'select', 'input[type="checkbox"]', 'input[type="radio"]',
+        'input[type="file"]', 'input[type="image"]',
+        '[class*="btn"]', '[class*="button"]', '[class*="link"]',
+        '[class*="click"]', '[class*="action"]', '[class*="cta"]',
+        '[id*="btn"]', '[id*="button"]', '[id*="link"]',
+        'video[controls]', 'audio[controls]',
+        'li[onclick]', 'td[onclick]', 'tr[onclick]',
+        'li[role="button"]', 'td[role="button"]', 'tr[role="button"]',
+        'svg[onclick]', 'svg[role="button"]',
+        'area', 'img[onclick]', 'img[role="button"]',
+        'div[role="button"]', 'span[role="button"]',
+        'p[role="button"]', 'section[role="button"]',
+        '.thumbnail__overlay'
+    )
+    CLICKABLE_CSS = ', '.join(CLICKABLE_SELECTORS)
+    
+    # Carousel containers
+    CAROUSEL_SELECTORS = (
+        '.carousel', '.slider', '.banner-slider', '.swiper', '.slick',
+        '[data-ride="carousel"]', '.owl-carousel', '.hero-banner',
+        '.banner-container', '.slideshow', '.image-slider',
+        '.swiper-container', '.swiper-wrapper', '.glide', '.splide',
+        '.flickity', '.keen-slider', '.embla', '.tiny-slider',
+        '[data-carousel]', '[data-slider]', '[data-swiper]',
+        '.slide-container', '.carousel-container', '.slider-wrapper',
+        '.hero-slider', '.product-slider', '.testimonial-slider',
+        '.gallery-slider', '.content-slider', '.banner-carousel',
+        '.thumbnail__overlay'
+    )
+    CAROUSEL_CSS = ', '.join(CAROUSEL_SELECTORS)
+    
+    # Slides inside a carousel; the first selector that matches wins
+    SLIDE_SELECTORS = (
+        '.carousel-item', '.slide', '.slider-item', '.swiper-slide',
+        '.slick-slide', '.banner-slide', '.owl-item', '[data-slide]',
+        '.glide__slide', '.splide__slide', '.flickity-cell',
+        '.keen-slider__slide', '.embla__slide', '.tns-item',
+        '.carousel-cell', '.slider-slide', '.slide-item',
+        '[class*="slide"]', '[data-slide-index]', '[data-slide-id]'
+    )
+    
+    # Clickable elements inside a slide
+    SLIDE_CLICKABLE_SELECTORS = (
+        'a', 'button', '[onclick]', '[role="button"]', 'input[type="button"]',
+        'input[type="submit"]', '.btn', '.button', '.link', '.cta', '.call-to-action',
+        '[data-action]', '[data-click]', '[data-href]',
+        '.carousel-control', '.slider-nav', '.slide-nav',
+        '.prev', '.next', '.slide-btn', '.carousel-btn',
+        '.thumbnail__overlay'
+    )
+    SLIDE_CLICKABLE_CSS = ','.join(SLIDE_CLICKABLE_SELECTORS)
+    
+    # Header/footer and carousel class-or-id keywords, reduced to the fragments
+    # every longer keyword contains ('site-header', 'navbar', 'owl-carousel', ...)
+    _SECTION_PATTERN = 'header|nav|footer'
+    _ELEMENT_SECTION_PATTERN = 'breadcrumb'  # Only for the element itself
+    _CAROUSEL_PATTERN = 'carousel|slider|swiper|slick|hero-banner|banner-container|slideshow'
+    
+    # The same rules as selectors for Element.closest()/matches(), so the ancestor
+    # walk runs in the browser's selector engine; body and html never count
+    _SECTION_CSS = (':is(header, nav, footer, [role="banner"], [role="navigation"], [role="contentinfo"], '
+                    '%s):not(body, html)') % (
+        ', '.join('[class*="%s" i], [id*="%s" i]' % (keyword, keyword) for keyword in _SECTION_PATTERN.split('|')))
+    _ELEMENT_SECTION_CSS = ':is(%s):not(body, html)' % (
+        ', '.join('[class*="%s" i], [id*="%s" i]' % (keyword, keyword) for keyword in _ELEMENT_SECTION_PATTERN.split('|')))
+    _CAROUSEL_ANCESTOR_CSS = ':is(%s):not(body, html)' % (
+        ', '.join('[class*="%s"]' % keyword for keyword in _CAROUSEL_PATTERN.split('|')))
+    
+    # In-page stand-in for WebElement.is_displayed(), shared by the batched scans
+    _JS_IS_DISPLAYED = """
+                function isDisplayed(el) {
+                    var rect = el.getBoundingClientRect();
+                    if (!(rect.width > 0 && rect.height > 0)) return false;
+                    var style = window.getComputedStyle(el);
+                    return style.visibility !== 'hidden' && style.display !== 'none' &&
+                           parseFloat(style.opacity) !== 0;
+                }
+    """
+    
+    # Number of elements matching arguments[0] that are showing
+    _JS_COUNT_DISPLAYED = _JS_IS_DISPLAYED + """
+                return Array.prototype.filter.call(document.querySelectorAll(arguments[0]), isDisplayed).length;
+    """
+
+    # elementInfos(elements): one raw info object per element, with XPath and CSS
+    # paths, or null when it failed or repeats an earlier element's dedup key.
+    # Prepended to any script that needs element infos.
+    _JS_ELEMENT_INFOS = """
+                // Paths are memoized per element and sibling indices per parent, so
+                // elements sharing ancestors reuse the ancestors' path strings
+                var xpathCache = new Map(), cssCache = new Map(), indexCache = new Map();
+                var extractedKeys = new Set();
+            
+                // 1-based position among the element's same-tag siblings
+                function sameTagIndex(element) {
+                    var parent = element.parentNode;
+                    var indices = indexCache.get(parent);
+                    if (!indices) {
+                        indices = new Map();
+                        var counts = {};
+                        var siblings = parent.childNodes;
+                        for (var i = 0; i < siblings.length; i++) {
+                            var sibling = siblings[i];
+                            if (sibling.nodeType === 1) {
+                                counts[sibling.tagName] = (counts[sibling.tagName] || 0) + 1;
+                                indices.set(sibling, counts[sibling.tagName]);
+                            }
+                        }
+                        indexCache.set(parent, indices);
+                    }
+                    return indices.get(element);
+                }
+                function getXPath(element) {
+                    if (xpathCache.has(element)) return xpathCache.get(element);
+                    var path;
+                    if (element.id !== '') path = '//*[@id="' + element.id + '"]';
+                    else if (element === document.body) path = '/html/body';
+                    else path = getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + sameTagIndex(element) + ']';
+                    xpathCache.set(element, path);
+                    return path;
+                }
+                function getCssSelector(el) {
+                    if (cssCache.has(el)) return cssCache.get(el);
+                    var selector = el.nodeName.toLowerCase(), path;
+                    if (el.id) {
+                        path = selector + '#' + el.id;
+                    } else {
+                        var nth = sameTagIndex(el);
+                        if (nth != 1)
+                            selector += ":nth-of-type(" + nth + ")";
+                        var parent = el.parentNode;
+                        path = parent && parent.nodeType === Node.ELEMENT_NODE
+                            ? getCssSelector(parent) + " > " + selector
+                            : selector;
+                    }
+                    cssCache.set(el, path);
+                    return path;
+                }
+            
+                function elementInfos(elements) {
+                    return elements.map(function(el) {
+                        try {
+                            // Mirror WebElement.get_attribute: prefer the DOM property when it is a string
+                            function attr(name) {
+                                var value = el[name];
+                                return (typeof value === 'string' ? value : el.getAttribute(name)) || '';
+                            }
+                            // The dedup key fields first: a repeat of an element already
+                            // extracted by this script skips paths, geometry and styles
+                            var tagName = el.tagName.toLowerCase();
+                            var text = (el.innerText || '').trim().slice(0, 100);
+                            var classNames = el.getAttribute('class') || '';
+                            var id = el.id || '';
+                            var href = attr('href');
+                            var key = JSON.stringify([tagName, text, href, classNames, id]);
+                            if (extractedKeys.has(key)) return null;
+                            extractedKeys.add(key);
+                            
+                            var rect = el.getBoundingClientRect();
+                            var style = window.getComputedStyle(el);
+                            return {
+                                tag_name: tagName,
+                                text: text,
+                                class_names: classNames,
+                                id: id,
+                                href: href,
+                                onclick: el.getAttribute('onclick') || '',
+                                role: el.getAttribute('role') || '',
+                                type: attr('type'),
+                                data_testid: el.getAttribute('data-testid') || '',
+                                aria_label: el.getAttribute('aria-label') || '',
+                                title: attr('title'),
+                                name: attr('name'),
+                                value: attr('value'),
+                                src: attr('src'),
+                                alt: attr('alt'),
+                                xpath: getXPath(el) || 'xpath_unavailable',
+                                css_selector: getCssSelector(el),
+                                location: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)},
+                                size: {height: Math.round(rect.height), width: Math.round(rect.width)},
+                                is_displayed: rect.width > 0 && rect.height > 0 &&
+                                              style.visibility !== 'hidden' && style.display !== 'none',
+                                is_enabled: !el.disabled
+                            };
+                        } catch (e) {
+                            return null;
+                        }
+                    });
+                }
+    """
+    
+    # [element, selector] for the first displayed match of the selectors in arguments[0]
+    _JS_MAIN_CONTENT_AREA = _JS_IS_DISPLAYED + """
+                var selectors = arguments[0];
+                for (var i = 0; i < selectors.length; i++) {
+                    var element = document.querySelector(selectors[i]);
+                    if (element && isDisplayed(element)) return [element, selectors[i]];
+                }
+                return null;
+    """
+    
+    # Scripts assembled from the shared pieces once, when the class is defined,
+    # so every call sends the identical source and V8 can reuse its compiled code
+    _JS_EXTRACT_ELEMENT_INFOS = _JS_ELEMENT_INFOS + """
+                return elementInfos(arguments[0]);
+    """
+    
+    # Info for one possibly hidden element in arguments[0], read while it is
+    # forced visible, with the same XPath and CSS paths as elementInfos()
+    _JS_HIDDEN_ELEMENT_INFO = _JS_ELEMENT_INFOS + """
+                var el = arguments[0];
+                var original = {
+                    display: el.style.display,
+                    visibility: el.style.visibility,
+                    opacity: el.style.opacity
+                };
+                el.style.display = 'block';
+                el.style.visibility = 'visible';
+                el.style.opacity = '1';
+                
+                // Mirror WebElement.get_attribute: prefer the DOM property when it is a string
+                function attr(name) {
+                    var value = el[name];
+                    return (typeof value === 'string' ? value : el.getAttribute(name)) || '';
+                }
+                
+                var rect = el.getBoundingClientRect();
+                var info = {
+                    tag_name: el.tagName.toLowerCase(),
+                    text: (el.innerText || '').trim().slice(0, 100),
+                    class_names: el.getAttribute('class') || '',
+                    id: el.id || '',
+                    href: attr('href'),
+                    onclick: el.getAttribute('onclick') || '',
+                    role: el.getAttribute('role') || '',
+                    type: attr('type'),
+                    data_testid: el.getAttribute('data-testid') || '',
+                    aria_label: el.getAttribute('aria-label') || '',
+                    xpath: getXPath(el) || 'xpath_unavailable',
+                    css_selector: getCssSelector(el),
+                    location: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)},
+                    size: {height: Math.round(rect.height), width: Math.round(rect.width)},
+                    is_enabled: !el.disabled
+                };
+                
+                // Restore original styles
+                el.style.display = original.display;
+                el.style.visibility = original.visibility;
+                el.style.opacity = original.opacity;
+                return info;
+    """
+    
+    # Displayed matches of the selector in arguments[1], under arguments[0]
+    _JS_FIND_CAROUSELS = _JS_IS_DISPLAYED + """
+                var root = arguments[0] || document;
+                return Array.from(root.querySelectorAll(arguments[1])).filter(isDisplayed);
+    """
+    
+    # Candidate infos per detection method, filtered and extracted in the page
+    _JS_FIND_REGULAR_CLICKABLES = """
+                var root = arguments[0] || document, selector = arguments[1];
+                var sectionCss = arguments[2], elementSectionCss = arguments[3], carouselCss = arguments[4];
+    """ + _JS_IS_DISPLAYED + _JS_ELEMENT_INFOS + """
+                function isInHeaderOrFooter(el) {
+                    return el.matches(elementSectionCss) || el.closest(sectionCss) !== null;
+                }
+                
+                function isInCarousel(el) {
+                    return el.closest(carouselCss) !== null;
+                }
+                
+                function keep(el) {
+                    return isDisplayed(el) && !el.disabled && !isInHeaderOrFooter(el) && !isInCarousel(el);
+                }
+                
+                // Pointer-cursor candidates: elements matched by a stylesheet rule or
+                // inline style that sets cursor: pointer, so computed style is only
+                // resolved for those. A stylesheet we may not read (cross-origin)
+                // means falling back to checking every element.
+                function pointerCandidates() {
+                    var selectors = [], readable = true;
+                    function collect(rules) {
+                        for (var i = 0; i < rules.length; i++) {
+                            var rule = rules[i];
+                            if (rule.style && rule.style.cursor === 'pointer' && rule.selectorText) {
+                                selectors.push(rule.selectorText);
+                            }
+                            if (rule.cssRules) collect(rule.cssRules);
+                        }
+                    }
+                    for (var i = 0; i < document.styleSheets.length; i++) {
+                        try {
+                            collect(document.styleSheets[i].cssRules);
+                        } catch (e) {
+                            readable = false;
+                            break;
+                        }
+                    }
+                    if (!readable) return Array.from(document.querySelectorAll('*'));
+                    
+                    var found = new Set(document.querySelectorAll('[style*="cursor"]'));
+                    selectors.forEach(function(sel) {
+                        try {
+                            document.querySelectorAll(sel).forEach(el => found.add(el));
+                        } catch (e) {
+                            // Selectors with pseudo-elements never match an element
+                        }
+                    });
+                    return Array.from(found);
+                }
+                
+                // Handlers set as DOM properties have no attribute to select on,
+                // so only those need a pass over every element; it reads no styles
+                var listeners = new Set(document.querySelectorAll(
+                    '[onclick], [onmousedown], [onmouseup], [data-action], [data-click], [data-href]'));
+                var all = document.getElementsByTagName('*');
+                for (var i = 0; i < all.length; i++) {
+                    var el = all[i];
+                    if (el.onclick || el.onmousedown || el.onmouseup) listeners.add(el);
+                }
+                
+                // Extracted in the same call, so discovery is a single round-trip
+                return {
+                    selector: elementInfos(Array.from(root.querySelectorAll(selector)).filter(keep)),
+                    pointer: elementInfos(pointerCandidates().filter(el => {
+                        return el.offsetWidth > 0 && 
+                               el.offsetHeight > 0 &&
+                               window.getComputedStyle(el).cursor === 'pointer';
+                    }).filter(keep)),
+                    listener: elementInfos(Array.from(listeners).filter(keep))
+                };
+                """
+    
+    # Concurrent HEAD requests overall, and to any one host
+    STATUS_CHECK_WORKERS = 50
+    STATUS_CHECKS_PER_HOST = 8
+    
+    # Hrefs with no HTTP status to check: in-page anchors and script URLs
+    _NO_STATUS_HREF_RE = re.compile(r'\s*(?:#|javascript:)', re.IGNORECASE)
+
+    def set_url(self, url: str) -> None:
+        """Point the tester at a new page, keeping its browsers but dropping per-page state"""
+        self.url = url
+        self.seen_elements.clear()
+
+    def _setup_discovery_state(self) -> None:
+        """Per-page state and the status-check session that element discovery works with"""
+        self.results: List[Dict] = []
+        self.url: str = ""
+        self.seen_elements: Set[tuple] = set()  # Content keys of elements already extracted
+        self._setup_status_session()
+
+    def _setup_status_session(self) -> None:
+        """Status codes per resolved href, fetched over one pooled session"""
+        self._status_cache: Dict[str, Optional[List[int]]] = {}
+        self._session = requests.Session()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        adapter = requests.adapters.HTTPAdapter(pool_connections=self.STATUS_CHECK_WORKERS,
+                                                pool_maxsize=self.STATUS_CHECK_WORKERS)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # Started with the first page's links and kept for every later page
+        self._status_executor: Optional[ThreadPoolExecutor] = None
+
+    def _wait_for_dom_quiet(self, driver: webdriver.Chrome, quiet_ms: int = 500, max_wait: float = 5) -> None:
+        """Wait until the DOM has gone quiet_ms without mutations, up to max_wait seconds"""
+        try:
+            driver.execute_script("""
+                window.__clkLastMutation = Date.now();
+                if (!window.__clkMutationObserver) {
+                    window.__clkMutationObserver = new MutationObserver(function() {
+                        window.__clkLastMutation = Date.now();
+                    });
+                    window.__clkMutationObserver.observe(document.documentElement,
+                        {childList: true, subtree: true, attributes: true, characterData: true});
+                }
+            """)
+            WebDriverWait(driver, max_wait, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return Date.now() - window.__clkLastMutation >= arguments[0]", quiet_ms)
+            )
+        except TimeoutException:
+            pass  # Still animating (e.g. an auto-playing carousel); scan what is there
+        except WebDriverException as e:
+            logger.error(f"Error waiting for the page to settle: {e}")
+
+    def _find_regular_clickables(self, main_content_area, header_footer_selectors) -> List[ElementInfo]:
+        """Find regular clickable elements (non-carousel)"""
+        # Discover and filter every candidate in the browser, in one script call
+        try:
+            discovered = self.driver.execute_script(
+                self._JS_FIND_REGULAR_CLICKABLES, main_content_area, self.CLICKABLE_CSS,
+                self._SECTION_CSS, self._ELEMENT_SECTION_CSS, self._CAROUSEL_ANCESTOR_CSS)
+        except Exception as e:
+            logger.error(f"Error finding clickable elements: {e}")
+            return []
+        
+        unique_ids = set()
+        clickable_elements = []
+        for element_info in self._build_element_infos(discovered['selector']):
+            if element_info and element_info.unique_id not in unique_ids:
+                unique_ids.add(element_info.unique_id)
+                clickable_elements.append(element_info)
+        
+        # Additional detection methods
+        for method, candidates in (('pointer_cursor', discovered['pointer']),
+                                   ('event_listener', discovered['listener'])):
+            for element_info in self._build_element_infos(candidates):
+                if element_info:
+                    element_info.detection_method = method
+                    clickable_elements.append(element_info)
+        
+        return clickable_elements
+
+    def _build_element_infos(self, raw_infos: List[Optional[Dict]]) -> List[Optional[ElementInfo]]:
+        """Turn raw infos from elementInfos() into element info dicts, deduplicating on content signature"""
+        element_infos = []
+        for info in raw_infos:
+            if not info:
+                element_infos.append(None)
+                continue
+            
+            # Deduplicate on the key tuple itself, so a hash collision can never drop an element
+            dedup_key = (info['tag_name'], info['text'], info['href'], info['class_names'], info['id'])
+            if dedup_key in self.seen_elements:
+                element_infos.append(None)
+                continue
+            self.seen_elements.add(dedup_key)
+            unique_id = self._hash_key(dedup_key)
+            
+            # Final full element info; the script's field names are ElementInfo's
+            element_infos.append(ElementInfo(**info, unique_id=unique_id))
+        
+        return element_infos
+
+    def _hash_key(self, parts) -> str:
+        """Short hex digest of string fields, the same in every process and run"""
+        return hashlib.blake2b('|'.join(parts).encode(), digest_size=8).hexdigest()
+
+    def get_status_code(self, href: str) -> Optional[List[int]]:
+        """Return HTTP status code for the given href, or None if not applicable."""
+        if not href or self._NO_STATUS_HREF_RE.match(href):
+            return None
+            
+        # Handle relative URLs
+        if href.startswith('/'):
+            href = urljoin(self.url, href)
+        if href in self._status_cache:
+            return self._status_cache[href]
+            
+        # Cap concurrent requests per host so one site's links don't all hit it at once
+        slots = self._host_slots.setdefault(
+            urlparse(href).netloc, threading.BoundedSemaphore(self.STATUS_CHECKS_PER_HOST))
+        try:
+            with slots:
+                response = self._session.head(href, allow_redirects=True, timeout=5)
+            codes = [r.status_code for r in response.history] + [response.status_code]
+        except Exception:
+            codes = None
+        self._status_cache[href] = codes
+        return codes
+
+    def _resolve_status_codes(self, elements: List[ElementInfo]) -> None:
+        """Fill in status codes for all elements, requesting each distinct href once and concurrently"""
+        hrefs = list({element.href for element in elements if element.href})
+        if not hrefs:
+            return
+        if self._status_executor is None:
+            # Threads start only as needed, so small pages never spawn all of them
+            self._status_executor = ThreadPoolExecutor(max_workers=self.STATUS_CHECK_WORKERS,
+                                                       thread_name_prefix='status')
+        codes = dict(zip(hrefs, self._status_executor.map(self.get_status_code, hrefs)))
+        for element in elements:
+            element.status_code = codes.get(element.href)
+
+    def _shutdown_executors(self) -> None:
+        """Stop the worker threads kept between runs"""
+        for name in ('_batch_executor', '_status_executor'):
+            executor = getattr(self, name, None)
+            if executor:
+                setattr(self, name, None)
+                executor.shutdown(wait=True)
+
+
+class ClickableElementTester(_ClickableDiscovery):
+    
+    # Pool drivers are recycled after testing this many elements
+    MAX_USES_PER_DRIVER = 50
+    
+    # UI that a click on an otherwise inert element may reveal, and how long to wait for it
+    MODAL_CSS = '.modal, .popup, .overlay, .dialog, [role="dialog"], [role="alertdialog"]'
+    DROPDOWN_CSS = '.dropdown-menu, .menu-open, [aria-expanded="true"]'
+    CLICK_EFFECT_TIMEOUT = 2
     
+    # Common action words in an element's own text, matched anywhere in it
+    _ACTION_RE = re.compile(
+        'WATCH VIDEO|PLAY|SUBMIT|APPLY|START|LEARN MORE|READ MORE|VIEW|SEE MORE|'
+        'CLICK HERE|DOWNLOAD|UPLOAD|NEXT|PREV|PREVIOUS',
+        re.IGNORECASE
+    )
     
-    def __init__(self, headless: bool = False, timeout: int = 10, max_workers: int = 3):
+    # Hrefs that go nowhere when clicked ('#', 'javascript:void(0)'), in any case and spacing
+    _DEAD_HREF_RE = re.compile(r'\s*(?:#|javascript\s*::?\s*void\s*\(\s*0\s*\)\s*;?)\s*', re.IGNORECASE)
+    
+    def __init__(self, headless: bool = False, timeout: int = 10, max_workers: int = 3,
+                 share_browser: bool = False, block_resources: bool = False,
+                 max_samples: Optional[int] = None):
         """
         Initialize the clickable element tester
         
@@ -32,95 +653,205 @@ class ClickableElementTester:
             headless: Run browser in headless mode
             timeout: Default timeout for operations
             max_workers: Number of concurrent drivers (default: 3)
+            share_browser: Run the concurrent workers as tabs of one Chrome
+                instead of one Chrome process each
+            block_resources: Skip loading images, web fonts and common analytics/ad
+                scripts, and return from page loads at DOMContentLoaded; faster, but
+                image-only elements may lay out differently
+            max_samples: Click-test at most this many elements per page, picked at
+                random, and report the rates with a margin of error (default: all)
         """
         self.timeout = timeout
         self.max_workers = max_workers
-        self.results: List[Dict] = []
-        self.driver = self._setup_driver(headless)  # Main driver for finding elements
-        self.url: str = ""
-        self.seen_elements: Set[str] = set()
+        self.share_browser = share_browser
+        self.block_resources = block_resources
+        self.max_samples = max_samples
         self.headless = headless
-        self.driver_pool = []
-
+        self.driver = self._setup_driver(headless)  # Main driver for finding elements
+        self.driver_pool: List[webdriver.Chrome] = []  # Kept alive across concurrent runs
+        self._driver_uses: List[int] = []
+        self._batch_executor: Optional[ThreadPoolExecutor] = None  # Threads driving the pool, likewise
+        self._setup_discovery_state()
 
     def _setup_driver_pool(self) -> List[webdriver.Chrome]:
         """Setup a pool of Chrome WebDriver instances for concurrent testing"""
+        if self.share_browser:
+            return self._setup_shared_browser_pool()
+        
         driver_pool = []
         for i in range(self.max_workers):
             try:
                 driver = self._setup_driver(self.headless)
                 driver_pool.append(driver)
-                print(f"Driver {i+1} initialized successfully")
+                logger.info(f"Driver {i+1} initialized successfully")
             except Exception as e:
-                print(f"Failed to initialize driver {i+1}: {e}")
+                logger.error(f"Failed to initialize driver {i+1}: {e}")
         return driver_pool
     
 
     
 
+    def _setup_shared_browser_pool(self) -> List[webdriver.Chrome]:
+        """One Chrome with a tab per worker, each tab driven by its own session attached over the debugging port"""
+        driver_pool = []
+        try:
+            # Any free local port for the DevTools endpoint
+            with socket.socket() as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            
+            owner = self._setup_driver(self.headless, debugging_port=port)
+            driver_pool.append(owner)
+            logger.info("Driver 1 initialized successfully (shared browser)")
+            
+            # Open the other workers' tabs from the owning session
+            first_tab = owner.current_window_handle
+            tabs = []
+            for _ in range(self.max_workers - 1):
+                owner.switch_to.new_window('tab')
+                tabs.append(owner.current_window_handle)
+            owner.switch_to.window(first_tab)
+            
+            for i, tab in enumerate(tabs, 2):
+                try:
+                    options = Options()
+                    options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+                    driver = webdriver.Chrome(options=options)
+                    driver.implicitly_wait(0)
+                    driver.set_page_load_timeout(self.timeout)
+                    driver.set_script_timeout(self.timeout)
+                    self._widen_connection_pool(driver)
+                    self._block_third_party_requests(driver)
+                    driver.switch_to.window(tab)
+                    driver_pool.append(driver)
+                    logger.info(f"Driver {i} attached to shared browser tab")
+                except Exception as e:
+                    logger.error(f"Failed to attach driver {i} to shared browser: {e}")
+        except Exception as e:
+            logger.error(f"Failed to start shared browser: {e}")
+        return driver_pool
+
     def _close_driver_pool(self, driver_pool: List[webdriver.Chrome]) -> None:
         """Close all drivers in the pool"""
+        # Attached tab sessions go first, the session owning the browser last
+        if self.share_browser:
+            driver_pool = driver_pool[1:] + driver_pool[:1]
         for i, driver in enumerate(driver_pool):
             try:
                 driver.quit()
-                print(f"Driver {i+1} closed")
+                logger.debug(f"Driver {i+1} closed")
             except Exception as e:
-                print(f"Error closing driver {i+1}: {e}")
-        
+                logger.error(f"Error closing driver {i+1}: {e}")
+                self._kill_driver_processes(driver)
     
-    def _divide_elements_into_batches(self, elements: List[Dict], num_batches: int = 3) -> List[List[Dict]]:
-        """Divide elements into specified number of batches for concurrent processing"""
-        batch_size = len(elements) // num_batches
-        remainder = len(elements) % num_batches
-        
-        batches = []
-        start_idx = 0
+    def _kill_driver_processes(self, driver: webdriver.Chrome) -> None:
+        """Kill a driver's chromedriver and the browsers under it when quit() could not"""
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        if not process or process.poll() is not None:
+            return
+        try:
+            import psutil  # Optional; without it only chromedriver itself is killed
+            for child in psutil.Process(process.pid).children(recursive=True):
+                try:
+                    child.kill()
+                except psutil.Error:
+                    pass
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.error(f"Error killing browser processes: {e}")
+        try:
+            process.kill()
+        except Exception:
+            pass
+    
+    def _count_driver_use(self, index: int, driver: webdriver.Chrome) -> webdriver.Chrome:
+        """Count one element tested on a pool driver, swapping in a fresh driver once it hits MAX_USES_PER_DRIVER"""
+        self._driver_uses[index] += 1
+        # Tabs of a shared browser are not recycled; quitting the owner would take every tab with it
+        if self.share_browser or self._driver_uses[index] < self.MAX_USES_PER_DRIVER:
+            return driver
         
-        for i in range(num_batches):
-            # Add one extra element to first 'remainder' batches
-            current_batch_size = batch_size + (1 if i < remainder else 0)
-            end_idx = start_idx + current_batch_size
-            
-            batch = elements[start_idx:end_idx]
-            if batch:  # Only add non-empty batches
-                batches.append(batch)
-            
-            start_idx = end_idx
+        try:
+            fresh = self._setup_driver(self.headless)
+        except Exception as e:
+            logger.error(f"Failed to recycle driver {index+1}: {e}")
+            return driver
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self.driver_pool[index] = fresh
+        self._driver_uses[index] = 0
+        logger.info(f"Driver {index+1} recycled")
+        return fresh
         
-        return batches
-
-    def _test_element_batch(self, batch: List[Dict], driver: webdriver.Chrome, 
+    
+    def _test_element_batch(self, work: queue.Queue, driver: webdriver.Chrome, 
                        batch_id: int, url: str) -> List[Dict]:
-        """Test a batch of elements using a specific driver"""
+        """Test elements pulled one at a time from the shared work queue using a specific driver"""
         batch_results = []
+        pool_index = self.driver_pool.index(driver) if driver in self.driver_pool else None
+        
+        logger.info(f"\n🔄 Batch {batch_id} starting - {work.qsize()} elements queued")
         
-        print(f"\n🔄 Batch {batch_id} starting - {len(batch)} elements")
+        # Load the page once; elements reuse it unless a click leaves it
+        base_url = url
+        carousels_ready = False  # Carousel overrides are lost whenever the page reloads
+        try:
+            self._load_page(driver, url)
+            self._wait_for_document_ready(driver)
+            base_url = driver.current_url
+        except Exception as e:
+            logger.error(f"  Error loading page for batch {batch_id}: {e}")
         
-        for i, element_info in enumerate(batch, 1):
+        i = 0
+        while True:
+            # Workers that finish early keep taking elements instead of idling
+            try:
+                element_info = work.get_nowait()
+            except queue.Empty:
+                break
+            i += 1
             try:
                 # Ensure we're on the correct page
-                if driver.current_url != url:
-                    driver.get(url)
-                    time.sleep(2)
+                if driver.current_url != base_url:
+                    self._load_page(driver, url)
+                    self._wait_for_document_ready(driver)
+                    carousels_ready = False
+                
+                # Reveal all carousels at once, the first time this page load needs it
+                if element_info.is_carousel_element and not carousels_ready:
+                    self._make_carousels_clickable_with_driver(driver)
+                    carousels_ready = True
                 
-                print(f"Batch {batch_id} - Testing element {i}/{len(batch)}")
-                print(f"  Tag: {element_info['tag_name']}, "
-                    f"Class: {element_info['class_names'][:30]}{'...' if len(element_info['class_names']) > 30 else ''}")
+                logger.info(f"Batch {batch_id} - Testing element {i} ({work.qsize()} left in queue)\n"
+                            f"  Tag: {element_info.tag_name}, "
+                            f"Class: {_truncate(element_info.class_names, 30)}")
                 
                 # Test the element using the batch driver
                 result = self._test_element_click_with_driver(element_info, driver, url)
                 batch_results.append(result)
+                status = result['click_status']
+                
+                # Step back through history instead of reloading the page
+                if result['page_changed'] and driver.current_url != base_url:
+                    self._return_to_page(driver, url, base_url)
+                    carousels_ready = False
+                elif status == 'active_ui_change':
+                    # Close what the click opened rather than reloading the page
+                    self._dismiss_ui_changes(driver)
                 
                 # Log result
-                if result['click_status'].startswith('active'):
-                    print(f"  ✅ ACTIVE: {result['click_status']}")
-                elif result['click_status'] == 'dead_click':
-                    print(f"  ❌ DEAD CLICK")
+                if status.startswith('active'):
+                    logger.info(f"  ✅ ACTIVE: {status}")
+                elif status == 'dead_click':
+                    logger.info(f"  ❌ DEAD CLICK")
                 else:
-                    print(f"  ⚠️  ERROR: {result['click_status']}")
+                    logger.info(f"  ⚠️  ERROR: {status}")
                     
             except Exception as e:
-                print(f"  Error testing element in batch {batch_id}: {e}")
+                logger.error(f"  Error testing element in batch {batch_id}: {e}")
                 error_result = {
                     'element_info': element_info,
                     'click_status': 'batch_error',
@@ -132,12 +863,92 @@ class ClickableElementTester:
                     'timestamp': datetime.now().isoformat()
                 }
                 batch_results.append(error_result)
+            
+            if pool_index is not None:
+                fresh = self._count_driver_use(pool_index, driver)
+                if fresh is not driver:
+                    driver = fresh
+                    carousels_ready = False
+                    try:
+                        self._load_page(driver, url)
+                        self._wait_for_document_ready(driver)
+                        base_url = driver.current_url
+                    except Exception as e:
+                        logger.error(f"  Error loading page for batch {batch_id}: {e}")
         
-        print(f"✅ Batch {batch_id} completed - {len(batch_results)} results")
+        logger.info(f"✅ Batch {batch_id} completed - {len(batch_results)} results")
         return batch_results
+
+    def _load_page(self, driver: webdriver.Chrome, url: str) -> None:
+        """Load a page, keeping whatever has arrived once the page-load timeout hits"""
+        try:
+            driver.get(url)
+        except TimeoutException:
+            logger.warning(f"⚠️ Page load timeout for {url} - proceeding with available elements")
+            driver.execute_script("window.stop()")
+
+    def _wait_for_document_ready(self, driver: webdriver.Chrome) -> None:
+        """Wait until the driver's current document has finished loading"""
+        try:
+            WebDriverWait(driver, self.timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            logger.warning("⚠️ Page load timeout - proceeding with available elements")
+
+    def _return_to_page(self, driver: webdriver.Chrome, url: str, base_url: str) -> None:
+        """Go back to the page under test after a click navigated away, reloading it only if history fails"""
+        try:
+            driver.execute_script("window.history.back()")
+            WebDriverWait(driver, self.timeout).until(EC.url_to_be(base_url))
+            self._wait_for_document_ready(driver)
+        except (TimeoutException, WebDriverException):
+            self._load_page(driver, url)
+            self._wait_for_document_ready(driver)
         
 
-    def _test_element_click_with_driver(self, element_info: Dict, driver: webdriver.Chrome, 
+    def _dismiss_ui_changes(self, driver: webdriver.Chrome) -> None:
+        """Close modals and dropdowns left open by a click so they don't leak into the next element's check"""
+        try:
+            driver.execute_script("""
+                var target = document.activeElement || document.body;
+                target.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', keyCode: 27, bubbles: true}));
+                
+                // Hide only what is showing; closed modals already in the markup may hold elements still to test
+                document.querySelectorAll(arguments[0]).forEach(function(el) {
+                    var rect = el.getBoundingClientRect();
+                    if (rect.width > 0 && rect.height > 0) el.style.display = 'none';
+                });
+                document.querySelectorAll('.menu-open').forEach(function(el) {
+                    el.classList.remove('menu-open');
+                });
+                document.querySelectorAll('[aria-expanded="true"]').forEach(function(el) {
+                    el.setAttribute('aria-expanded', 'false');
+                });
+            """, self.MODAL_CSS)
+        except Exception as e:
+            logger.error(f"  Error dismissing opened UI: {e}")
+
+    def _count_displayed_ui(self, driver: webdriver.Chrome) -> int:
+        """Number of modals and dropdowns showing; hidden ones already in the markup don't count"""
+        try:
+            return driver.execute_script(self._JS_COUNT_DISPLAYED, self.MODAL_CSS + ', ' + self.DROPDOWN_CSS)
+        except WebDriverException:
+            return 0
+
+    def _wait_for_click_effect(self, driver: webdriver.Chrome, initial_url: str, initial_title: str,
+                               initial_ui: int) -> None:
+        """Wait until a click navigates, retitles the page or shows a new modal/dropdown"""
+        try:
+            WebDriverWait(driver, self.CLICK_EFFECT_TIMEOUT).until(EC.any_of(
+                EC.url_changes(initial_url),
+                lambda d: d.title != initial_title,
+                lambda d: self._count_displayed_ui(d) > initial_ui
+            ))
+        except TimeoutException:
+            pass
+
+    def _test_element_click_with_driver(self, element_info: ElementInfo, driver: webdriver.Chrome, 
                                   original_url: str) -> Dict:
         """Test element click using a specific driver instance"""
         result = {
@@ -165,13 +976,12 @@ class ClickableElementTester:
                 result['error_message'] = 'Element could not be located for clicking'
                 return result
             
-            # For carousel elements, ensure they're visible before clicking
-            if element_info.get('is_carousel_element', False):
-                self._make_carousel_element_clickable_with_driver(element, driver)
-            
             # Scroll element into view
             driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            time.sleep(1)
+            try:
+                WebDriverWait(driver, 2).until(EC.element_to_be_clickable(element))
+            except TimeoutException:
+                pass  # Reported as not_clickable below
             
             # Check if element is still clickable
             if not (element.is_displayed() and element.is_enabled()):
@@ -179,21 +989,33 @@ class ClickableElementTester:
                 result['error_message'] = 'Element is not displayed or enabled'
                 return result
             
-            # Attempt to click the element
+            initial_ui = self._count_displayed_ui(driver)
+            
+            # Attempt to click the element; a navigation slower than the
+            # page-load timeout is stopped and reported instead of hanging the worker
             try:
-                element.click()
-                click_successful = True
-            except ElementClickInterceptedException:
                 try:
-                    driver.execute_script("arguments[0].click();", element)
+                    element.click()
                     click_successful = True
-                except Exception as js_error:
-                    result['click_status'] = 'click_intercepted'
-                    result['error_message'] = f'Click intercepted: {str(js_error)}'
-                    return result
+                except ElementClickInterceptedException:
+                    try:
+                        driver.execute_script("arguments[0].click();", element)
+                        click_successful = True
+                    except TimeoutException:
+                        raise
+                    except Exception as js_error:
+                        result['click_status'] = 'click_intercepted'
+                        result['error_message'] = f'Click intercepted: {str(js_error)}'
+                        return result
+            except TimeoutException:
+                driver.execute_script("window.stop()")
+                result['click_status'] = 'navigation_timeout'
+                result['error_message'] = f'Navigation did not finish within {self.timeout}s'
+                result['url_after'] = driver.current_url
+                result['page_changed'] = result['url_after'] != initial_url
+                return result
             
-            # Wait for changes
-            time.sleep(2)
+            self._wait_for_click_effect(driver, initial_url, initial_title, initial_ui)
             
             # Check for changes after click
             current_url = driver.current_url
@@ -210,22 +1032,11 @@ class ClickableElementTester:
             elif current_title != initial_title:
                 result['click_status'] = 'active_title_change'
                 result['page_changed'] = True
+            elif self._count_displayed_ui(driver) > initial_ui:
+                result['click_status'] = 'active_ui_change'
+                result['new_elements_appeared'] = True
             else:
-                # Check for new elements or modals
-                try:
-                    modals = driver.find_elements(By.CSS_SELECTOR, 
-                        '.modal, .popup, .overlay, .dialog, [role="dialog"], [role="alertdialog"]')
-                    
-                    dropdowns = driver.find_elements(By.CSS_SELECTOR,
-                        '.dropdown-menu, .menu-open, [aria-expanded="true"]')
-                    
-                    if modals or dropdowns:
-                        result['click_status'] = 'active_ui_change'
-                        result['new_elements_appeared'] = True
-                    else:
-                        result['click_status'] = 'dead_click'
-                except Exception:
-                    result['click_status'] = 'dead_click'
+                result['click_status'] = 'dead_click'
             
         except Exception as e:
             result['click_status'] = 'error'
@@ -234,83 +1045,143 @@ class ClickableElementTester:
         return result
         
 
-    def _find_element_by_info_with_driver(self, element_info: Dict, driver: webdriver.Chrome) -> Optional[webdriver.remote.webelement.WebElement]:
+    def _find_element_by_info_with_driver(self, element_info: ElementInfo, driver: webdriver.Chrome) -> Optional[webdriver.remote.webelement.WebElement]:
         """Find element using stored information with a specific driver"""
-        strategies = [
-            (By.ID, element_info['id']) if element_info['id'] else None,
-            (By.XPATH, element_info['xpath']) if element_info['xpath'] != 'xpath_unavailable' else None,
-            (By.CSS_SELECTOR, f".{element_info['class_names'].replace(' ', '.')}") if element_info['class_names'] else None,
-        ]
-        
-        for strategy in strategies:
-            if strategy:
-                try:
-                    elements = driver.find_elements(*strategy)
-                    for element in elements:
-                        if (element.is_displayed() and 
-                            element.tag_name == element_info['tag_name'] and
-                            element.text.strip()[:100] == element_info['text']):
-                            return element
-                except Exception:
-                    continue
+        return self._lookup_element(driver, element_info)
+
+    def _lookup_element(self, driver: webdriver.Chrome, element_info: ElementInfo, root=None,
+                        require_displayed: bool = True) -> Optional[webdriver.remote.webelement.WebElement]:
+        """Find the element matching stored info under root (default: the document) in one script call.
         
-        return None
+        Tries id, then the CSS path recorded at discovery, then xpath, then class names, with the
+        browser's native getElementById / querySelector / getElementsByClassName lookups, and
+        returns the first candidate with the same tag and text."""
+        try:
+            return driver.execute_script("""
+                var info = arguments[0], root = arguments[1] || document, requireDisplayed = arguments[2];
+                
+                function matches(el) {
+                    if (!el || el.nodeType !== 1) return false;
+                    if (root !== document && !root.contains(el)) return false;
+                    if (requireDisplayed) {
+                        var rect = el.getBoundingClientRect();
+                        var style = window.getComputedStyle(el);
+                        if (!(rect.width > 0 && rect.height > 0 &&
+                              style.visibility !== 'hidden' && style.display !== 'none')) return false;
+                    }
+                    return el.tagName.toLowerCase() === info.tag_name &&
+                           (el.innerText || '').trim().slice(0, 100) === info.text;
+                }
+                
+                if (info.id) {
+                    var byId = document.getElementById(info.id);
+                    if (matches(byId)) return byId;
+                }
+                if (info.css_selector) {
+                    try {
+                        var bySelector = root.querySelector(info.css_selector);
+                        if (matches(bySelector)) return bySelector;
+                    } catch (e) {}
+                }
+                if (info.xpath && info.xpath !== 'xpath_unavailable') {
+                    try {
+                        var snapshot = document.evaluate(info.xpath, root, null,
+                            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                        for (var i = 0; i < snapshot.snapshotLength; i++) {
+                            if (matches(snapshot.snapshotItem(i))) return snapshot.snapshotItem(i);
+                        }
+                    } catch (e) {}
+                }
+                if (info.class_names) {
+                    var byClass = root.getElementsByClassName(info.class_names);
+                    for (var j = 0; j < byClass.length; j++) {
+                        if (matches(byClass[j])) return byClass[j];
+                    }
+                }
+                return null;
+            """, {key: getattr(element_info, key) or '' for key in ('id', 'css_selector', 'xpath', 'class_names', 'tag_name', 'text')},
+                root, require_displayed)
+        except Exception:
+            return None
     
-    def _make_carousel_element_clickable_with_driver(self, element, driver: webdriver.Chrome) -> None:
-        """Make a carousel element visible and clickable using specific driver"""
+    def _make_carousels_clickable_with_driver(self, driver: webdriver.Chrome) -> None:
+        """Make every carousel on the driver's page visible and clickable in one pass over their trees"""
         try:
             driver.execute_script("""
-                var element = arguments[0];
-                var current = element;
-                
-                while (current && current !== document.body) {
+                var touched = new Set();
+                function reveal(current) {
                     current.style.display = 'block';
                     current.style.visibility = 'visible';
                     current.style.opacity = '1';
                     current.style.position = 'relative';
                     current.style.zIndex = 'auto';
                     current.style.transform = current.style.webkitTransform = 'none';
-                    current = current.parentElement;
                 }
-            """, element)
-            
-            time.sleep(0.5)
+                
+                document.querySelectorAll('[class*="carousel"], [class*="slider"], [class*="swiper"]').forEach(function(root) {
+                    if (touched.has(root)) return;
+                    
+                    // The carousel's own subtree...
+                    var walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+                    for (var node = root; node; node = walker.nextNode()) {
+                        if (!touched.has(node)) {
+                            touched.add(node);
+                            reveal(node);
+                        }
+                    }
+                    
+                    // ...and the ancestors it hangs from, up to the body
+                    var current = root.parentElement;
+                    while (current && current !== document.body && !touched.has(current)) {
+                        touched.add(current);
+                        reveal(current);
+                        current = current.parentElement;
+                    }
+                });
+            """)
         except Exception as e:
-            print(f"Error making carousel element clickable: {e}")
+            logger.error(f"Error making carousel elements clickable: {e}")
 
     
     def run_comprehensive_test_concurrent(self, url: str) -> Dict:
         """Run comprehensive test on all clickable elements using concurrent processing"""
-        print(f"\n{'='*60}")
-        print(f"Starting Concurrent Comprehensive Clickability Test")
-        print(f"URL: {url}")
-        print(f"Max Workers: {self.max_workers}")
-        print(f"Timestamp: {datetime.now()}")
-        print(f"{'='*60}\n")
+        started_at = datetime.now()  # The run's one wall-clock reading; durations use perf_counter
+        logger.info(f"\n{'='*60}\n"
+                    f"Starting Concurrent Comprehensive Clickability Test\n"
+                    f"URL: {url}\n"
+                    f"Max Workers: {self.max_workers}\n"
+                    f"Timestamp: {started_at}\n"
+                    f"{'='*60}\n")
         
         try:
             # Find all clickable elements using main driver
-            print("🔍 Finding all clickable elements...")
+            logger.info("🔍 Finding all clickable elements...")
             clickable_elements = self.find_clickable_elements(url)
-            print(f"Found {len(clickable_elements)} clickable elements")
+            logger.info(f"Found {len(clickable_elements)} clickable elements")
+            total_found = len(clickable_elements)
+            clickable_elements = self._sample_elements(clickable_elements)
             
-            # Setup driver pool
-            print(f"\n🚀 Setting up {self.max_workers} concurrent drivers...")
-            driver_pool = self._setup_driver_pool()
+            # Setup the driver pool on the first run; later runs reuse it
+            if not self.driver_pool:
+                logger.info(f"\n🚀 Setting up {self.max_workers} concurrent drivers...")
+                self.driver_pool = self._setup_driver_pool()
+                self._driver_uses = [0] * len(self.driver_pool)
+            driver_pool = self.driver_pool
             
             if not driver_pool:
                 raise Exception("Failed to initialize driver pool")
             
-            # Divide elements into batches
-            batches = self._divide_elements_into_batches(clickable_elements, len(driver_pool))
-            print(f"Elements divided into {len(batches)} batches")
-            for i, batch in enumerate(batches):
-                print(f"  Batch {i+1}: {len(batch)} elements")
+            # Queue the elements; each driver's batch is whatever it pulls off the queue
+            work = queue.Queue()
+            for element_info in clickable_elements:
+                work.put(element_info)
+            logger.info(f"{len(clickable_elements)} elements queued for {len(driver_pool)} drivers")
             
             # Initialize test results
             test_results = {
                 'url': url,
-                'total_elements_found': len(clickable_elements),
+                'total_elements_found': total_found,
+                'sampled': len(clickable_elements) < total_found,
                 'elements_tested': 0,
                 'active_clicks': 0,
                 'dead_clicks': 0,
@@ -318,82 +1189,87 @@ class ClickableElementTester:
                 'results': [],
                 'concurrent_info': {
                     'max_workers': self.max_workers,
-                    'batches_created': len(batches),
-                    'batch_sizes': [len(batch) for batch in batches]
+                    'batches_created': len(driver_pool),
+                    'batch_sizes': [0] * len(driver_pool)
                 },
                 'summary': {},
-                'timestamp': datetime.now().isoformat()
+                'timestamp': started_at.isoformat()
             }
             
             # Process batches concurrently
-            print(f"\n🏃‍♂️ Starting concurrent testing...")
-            start_time = time.time()
-            
-            with ThreadPoolExecutor(max_workers=len(driver_pool)) as executor:
-                # Submit batch processing tasks
-                future_to_batch = {
-                    executor.submit(self._test_element_batch, batch, driver_pool[i], i+1, url): i
-                    for i, batch in enumerate(batches)
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_batch):
-                    batch_id = future_to_batch[future]
-                    try:
-                        batch_results = future.result()
-                        test_results['results'].extend(batch_results)
-                        test_results['elements_tested'] += len(batch_results)
-                        print(f"✅ Batch {batch_id + 1} results collected")
-                    except Exception as e:
-                        print(f"❌ Batch {batch_id + 1} failed: {e}")
+            logger.info(f"\n🏃‍♂️ Starting concurrent testing...")
+            start_time = time.perf_counter()
+            
+            # Like the drivers, the threads driving them outlive the run
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(max_workers=len(driver_pool),
+                                                          thread_name_prefix='batch')
+            executor = self._batch_executor
+            
+            # Submit batch processing tasks
+            future_to_batch = {
+                executor.submit(self._test_element_batch, work, driver, i+1, url): i
+                for i, driver in enumerate(driver_pool)
+            }
             
-            end_time = time.time()
+            # Collect results as they complete
+            for future in as_completed(future_to_batch):
+                batch_id = future_to_batch[future]
+                try:
+                    batch_results = future.result()
+                    test_results['results'].extend(batch_results)
+                    test_results['elements_tested'] += len(batch_results)
+                    test_results['concurrent_info']['batch_sizes'][batch_id] = len(batch_results)
+                    logger.info(f"✅ Batch {batch_id + 1} results collected")
+                except Exception as e:
+                    logger.error(f"❌ Batch {batch_id + 1} failed: {e}")
+            
+            end_time = time.perf_counter()
             test_results['concurrent_info']['total_time'] = round(end_time - start_time, 2)
             
-            # Count results
-            for result in test_results['results']:
-                if result['click_status'].startswith('active'):
-                    test_results['active_clicks'] += 1
-                elif result['click_status'] == 'dead_click':
-                    test_results['dead_clicks'] += 1
-                else:
-                    test_results['errors'] += 1
-            
-            # Generate summary
+            # Generate summary, which also counts the results
             test_results['summary'] = self._generate_summary(test_results)
             
-            # Cleanup
-            self._close_driver_pool(driver_pool)
-            
-            print(f"\n🎉 Concurrent testing completed in {test_results['concurrent_info']['total_time']} seconds")
-            print(f"Total elements tested: {test_results['elements_tested']}")
-            print(f"Active clicks: {test_results['active_clicks']}")
-            print(f"Dead clicks: {test_results['dead_clicks']}")
-            print(f"Errors: {test_results['errors']}")
+            logger.info(f"\n🎉 Concurrent testing completed in {test_results['concurrent_info']['total_time']} seconds\n"
+                        f"Total elements tested: {test_results['elements_tested']}\n"
+                        f"Active clicks: {test_results['active_clicks']}\n"
+                        f"Dead clicks: {test_results['dead_clicks']}\n"
+                        f"Errors: {test_results['errors']}")
             
             return test_results
             
         except Exception as e:
-            print(f"Error during concurrent comprehensive test: {e}")
-            # Cleanup on error
-            if 'driver_pool' in locals():
-                self._close_driver_pool(driver_pool)
+            logger.error(f"Error during concurrent comprehensive test: {e}")
             return {'error': str(e)}
 
-    def close(self) -> None:
-        """Close the main browser driver"""
-        if self.driver:
-            self.driver.quit()
-            print("Main browser closed.")
-
     
             
-    def _setup_driver(self, headless: bool) -> webdriver.Chrome:
+    def _setup_driver(self, headless: bool, debugging_port: Optional[int] = None) -> webdriver.Chrome:
         """Setup Chrome WebDriver with appropriate options"""
         chrome_options = Options()
         
         if headless:
-            chrome_options.add_argument("--headless")
+            # The new headless mode is the full browser without a window, so pages
+            # lay out as they do headed; nothing is drawn, so skip the GPU too
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+        
+        # Lets further sessions attach to this browser's tabs
+        if debugging_port:
+            chrome_options.add_argument(f"--remote-debugging-port={debugging_port}")
+        
+        # Nothing the clickability checks look at needs these
+        prefs = {
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.managed_default_content_settings.notifications": 2
+        }
+        chrome_options.add_argument("--disable-extensions")
+        
+        if self.block_resources:
+            prefs["profile.managed_default_content_settings.images"] = 2
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_experimental_option("prefs", prefs)
         
         # Additional options for better compatibility
         chrome_options.add_argument("--no-sandbox")
@@ -407,14 +1283,46 @@ class ClickableElementTester:
         
         try:
             driver = webdriver.Chrome(options=chrome_options)
+            # Presence is only ever awaited through WebDriverWait, so lookups that
+            # miss return at once instead of adding an implicit wait on top
+            driver.implicitly_wait(0)
+            # Bound how long one slow navigation or script can hold a worker
+            driver.set_page_load_timeout(self.timeout)
+            driver.set_script_timeout(self.timeout)
+            self._widen_connection_pool(driver)
+            self._block_third_party_requests(driver)
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             return driver
         except Exception as e:
-            print(f"Error setting up Chrome driver: {e}")
-            print("Make sure ChromeDriver is installed and in PATH")
+            logger.error(f"Error setting up Chrome driver: {e}")
+            logger.error("Make sure ChromeDriver is installed and in PATH")
             raise
 
-    def _handle_carousel_banner(self, element) -> List[Dict]:
+    def _block_third_party_requests(self, driver: webdriver.Chrome) -> None:
+        """Block analytics, ad and web-font requests over CDP when resource blocking is on"""
+        if not self.block_resources:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+                "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                "*facebook.net*", "*hotjar.com*", "*segment.io*", "*.woff2", "*.woff"
+            ]})
+        except Exception as e:
+            logger.warning(f"Could not set blocked URLs: {e}")
+
+    def _widen_connection_pool(self, driver: webdriver.Chrome) -> None:
+        """Give the driver's keep-alive HTTP pool room for every worker thread instead of urllib3's single connection"""
+        executor = driver.command_executor
+        if not hasattr(executor, '_conn'):
+            return
+        executor._conn.clear()
+        executor._conn = urllib3.PoolManager(
+            maxsize=max(20, self.max_workers * 4),
+            timeout=executor._client_config.timeout
+        )
+
+    def _handle_carousel_banner(self, element) -> List[ElementInfo]:
         """Handle auto-scrolling carousels and banners by pausing them and collecting all slides"""
         carousel_elements = []
         
@@ -442,7 +1350,7 @@ class ClickableElementTester:
             """, element)
             
             if carousel_container:
-                print("Found carousel container, attempting to pause auto-scroll")
+                logger.info("Found carousel container, attempting to pause auto-scroll")
                 self._pause_carousel(carousel_container)
                 
                 slides = self._get_all_carousel_slides(carousel_container)
@@ -450,7 +1358,7 @@ class ClickableElementTester:
                     carousel_elements.extend(self._extract_clickables_from_slide(slide))
                     
         except Exception as e:
-            print(f"Error handling carousel: {e}")
+            logger.error(f"Error handling carousel: {e}")
             
         return carousel_elements
 
@@ -481,24 +1389,14 @@ class ClickableElementTester:
                 if (carousel.swiper) carousel.swiper.autoplay.stop();
                 if (carousel.slick) jQuery(carousel).slick('slickPause');
             """, carousel_container)
-            
-            time.sleep(1)  # Allow pause to take effect
+            # The plugin pause calls and style writes apply synchronously, no settle delay needed
         except Exception as e:
-            print(f"Could not pause carousel: {e}")
+            logger.warning(f"Could not pause carousel: {e}")
 
     def _get_all_carousel_slides(self, carousel_container) -> List[webdriver.remote.webelement.WebElement]:
         """Get all slides from a carousel, including hidden ones"""
-        slide_selectors = [
-            '.carousel-item', '.slide', '.slider-item', '.swiper-slide',
-            '.slick-slide', '.banner-slide', '.owl-item', '[data-slide]',
-            '.glide__slide', '.splide__slide', '.flickity-cell',
-            '.keen-slider__slide', '.embla__slide', '.tns-item',
-            '.carousel-cell', '.slider-slide', '.slide-item',
-            '[class*="slide"]', '[data-slide-index]', '[data-slide-id]'
-        ]
-        
         slides = []
-        for selector in slide_selectors:
+        for selector in self.SLIDE_SELECTORS:
             try:
                 found_slides = carousel_container.find_elements(By.CSS_SELECTOR, selector)
                 if found_slides:
@@ -510,7 +1408,7 @@ class ClickableElementTester:
         if not slides:
             try:
                 potential_slides = carousel_container.find_elements(By.CSS_SELECTOR, 'div, section, article, li')
-                slides = [slide for slide in potential_slides if self._looks_like_slide(slide)]
+                slides = self._filter_slide_like(potential_slides)
             except Exception:
                 pass
 
@@ -520,55 +1418,52 @@ class ClickableElementTester:
                     '.swiper-wrapper, .slider-wrapper, .carousel-inner, .slides')
                 for container in nested_containers:
                     nested_slides = container.find_elements(By.CSS_SELECTOR, 'div, li')
-                    slides.extend(slide for slide in nested_slides if self._looks_like_slide(slide))
+                    slides.extend(self._filter_slide_like(nested_slides))
             except Exception:
                 pass
         
-        print(f"Found {len(slides)} carousel slides")
+        logger.info(f"Found {len(slides)} carousel slides")
         return slides
 
-    def _looks_like_slide(self, element) -> bool:
-        """Check if an element looks like a carousel slide"""
+    def _filter_slide_like(self, elements: List) -> List[webdriver.remote.webelement.WebElement]:
+        """Keep the elements that look like carousel slides, checking all of them in one script call"""
+        if not elements:
+            return []
         try:
-            # Check for typical slide content
-            has_content = (
-                len(element.find_elements(By.TAG_NAME, 'img')) > 0 or
-                len(element.text.strip()) > 20 or
-                len(element.find_elements(By.TAG_NAME, 'a')) > 0 or
-                len(element.find_elements(By.TAG_NAME, 'button')) > 0
-            )
-            
-            if has_content:
-                return True
-                
-            # Check for slide-like styling or class names
-            style = element.get_attribute('style') or ''
-            class_names = element.get_attribute('class') or ''
-            
-            computed_style = self.driver.execute_script("""
-                var style = window.getComputedStyle(arguments[0]);
-                return {
-                    position: style.position,
-                    float: style.float,
-                    display: style.display
-                };
-            """, element)
-            
-            has_slide_styling = (
-                'width:' in style.lower() or 
-                computed_style.get('position') in ['absolute', 'relative'] or
-                computed_style.get('float') in ['left', 'right'] or
-                computed_style.get('display') in ['flex', 'inline-block']
-            )
-            
-            has_slide_class = any(keyword in class_names.lower() for keyword in 
-                                ['slide', 'item', 'cell', 'panel', 'tab'])
-            
-            return has_slide_styling or has_slide_class
+            indices = self.driver.execute_script("""
+                var keep = [];
+                arguments[0].forEach(function(element, i) {
+                    // Typical slide content
+                    if (element.getElementsByTagName('img').length > 0 ||
+                        (element.innerText || '').trim().length > 20 ||
+                        element.getElementsByTagName('a').length > 0 ||
+                        element.getElementsByTagName('button').length > 0) {
+                        keep.push(i);
+                        return;
+                    }
+                    
+                    // Slide-like styling or class names
+                    var style = (element.getAttribute('style') || '').toLowerCase();
+                    var classNames = (element.getAttribute('class') || '').toLowerCase();
+                    var computed = window.getComputedStyle(element);
+                    var hasSlideStyling = (
+                        style.indexOf('width:') !== -1 ||
+                        computed.position === 'absolute' || computed.position === 'relative' ||
+                        computed.float === 'left' || computed.float === 'right' ||
+                        computed.display === 'flex' || computed.display === 'inline-block'
+                    );
+                    var hasSlideClass = ['slide', 'item', 'cell', 'panel', 'tab'].some(function(keyword) {
+                        return classNames.indexOf(keyword) !== -1;
+                    });
+                    if (hasSlideStyling || hasSlideClass) keep.push(i);
+                });
+                return keep;
+            """, elements)
+            return [elements[i] for i in indices]
         except Exception:
-            return False
+            return []
 
-    def _extract_clickables_from_slide(self, slide) -> List[Dict]:
+    def _extract_clickables_from_slide(self, slide) -> List[ElementInfo]:
         """Extract clickable elements from a single slide"""
         clickables = []
         
@@ -584,569 +1479,175 @@ class ClickableElementTester:
                 slide.style.zIndex = '1000';
             """, slide)
             
-            time.sleep(1)
-
-            # Find clickable elements in this slide
-            clickable_selectors = [
-                'a', 'button', '[onclick]', '[role="button"]', 'input[type="button"]',
-                'input[type="submit"]', '.btn', '.button', '.link', '.cta', '.call-to-action',
-                '[data-action]', '[data-click]', '[data-href]',
-                '.carousel-control', '.slider-nav', '.slide-nav',
-                '.prev', '.next', '.slide-btn', '.carousel-btn',
-                '.thumbnail__overlay'
-            ]
-            
-            for selector in clickable_selectors:
-                try:
-                    elements = slide.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_enabled():
-                            element_info = self._extract_element_info_for_hidden(element)
-                            if element_info:
-                                clickables.append(element_info)
-                except Exception:
-                    continue
-
-            # Find elements by common action words in their text
-            action_words = [
-                'WATCH VIDEO', 'PLAY', 'SUBMIT', 'APPLY', 'START', 'LEARN MORE', 'READ MORE',
-                'VIEW', 'SEE MORE', 'CLICK HERE', 'DOWNLOAD', 'UPLOAD', 'NEXT', 'PREV', 'PREVIOUS'
-            ]
-            
-            for word in action_words:
-                try:
-                    xpath = f".//*[contains(translate(text(), 'abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'), '{word}')]"
-                    elements = slide.find_elements(By.XPATH, xpath)
-                    for element in elements:
-                        if element.is_enabled():
-                            element_info = self._extract_element_info_for_hidden(element)
-                            if element_info:
-                                clickables.append(element_info)
-                except Exception:
-                    continue
+            try:
+                WebDriverWait(self.driver, 1).until(lambda d: slide.is_displayed())
+            except TimeoutException:
+                pass  # Hidden slides are still scanned, as before
+
+            # One query for both: enabled selector matches, plus the first own text
+            # of every other enabled element for the action-word check below
+            matched, texted = self.driver.execute_script("""
+                var slide = arguments[0], selector = arguments[1];
+                var seen = new Set(), matched = [], texted = [];
+                slide.querySelectorAll(selector).forEach(function(el) {
+                    seen.add(el);
+                    if (!el.disabled) matched.push(el);
+                });
+                slide.querySelectorAll('*').forEach(function(el) {
+                    if (seen.has(el) || el.disabled) return;
+                    var node = el.firstChild;
+                    while (node && node.nodeType !== Node.TEXT_NODE) node = node.nextSibling;
+                    if (node && node.nodeValue.trim()) texted.push([el, node.nodeValue]);
+                });
+                return [matched, texted];
+            """, slide, self.SLIDE_CLICKABLE_CSS)
+            
+            elements = matched + [el for el, text in texted if self._ACTION_RE.search(text)]
+            for element in elements:
+                element_info = self._extract_element_info_for_hidden(element)
+                if element_info:
+                    clickables.append(element_info)
 
         except Exception as e:
-            print(f"Error extracting clickables from slide: {e}")
+            logger.error(f"Error extracting clickables from slide: {e}")
 
         return clickables
 
-    def _extract_element_info_for_hidden(self, element) -> Optional[Dict]:
+    def _extract_element_info_for_hidden(self, element) -> Optional[ElementInfo]:
         """Extract element info even if element is not currently displayed"""
         try:
-            # Temporarily make element visible for info extraction
-            original_style = self.driver.execute_script("""
-                var el = arguments[0];
-                var style = {
-                    display: el.style.display,
-                    visibility: el.style.visibility,
-                    opacity: el.style.opacity
-                };
-                el.style.display = 'block';
-                el.style.visibility = 'visible';
-                el.style.opacity = '1';
-                return style;
-            """, element)
+            # Make the element visible, read every field and restore its
+            # styles in a single round-trip
+            info = self.driver.execute_script(self._JS_HIDDEN_ELEMENT_INFO, element)
             
-            href = element.get_attribute('href') or ''
-            element_info = {
-                'tag_name': element.tag_name,
-                'text': element.text.strip()[:100] if element.text else '',
-                'class_names': element.get_attribute('class') or '',
-                'id': element.get_attribute('id') or '',
-                'href': href,
-                'status_code': self.get_status_code(href),
-                'onclick': element.get_attribute('onclick') or '',
-                'role': element.get_attribute('role') or '',
-                'type': element.get_attribute('type') or '',
-                'data_testid': element.get_attribute('data-testid') or '',
-                'aria_label': element.get_attribute('aria-label') or '',
-                'xpath': self._get_element_xpath(element),
-                'location': element.location,
-                'size': element.size,
-                'is_displayed': True,
-                'is_enabled': element.is_enabled(),
-                'is_carousel_element': True
-            }
-            
-            # Restore original styles
-            self.driver.execute_script("""
-                var el = arguments[0];
-                var style = arguments[1];
-                el.style.display = style.display;
-                el.style.visibility = style.visibility;
-                el.style.opacity = style.opacity;
-            """, element, original_style)
-            
-            element_info['unique_id'] = self._create_unique_id(element_info)
+            # Hidden slides are made visible while scanned, so record them as displayed
+            element_info = ElementInfo(**info, is_displayed=True, is_carousel_element=True)
+            element_info.unique_id = self._create_unique_id(element_info)
             return element_info
             
         except Exception as e:
-            print(f"Error extracting hidden element info: {e}")
+            logger.error(f"Error extracting hidden element info: {e}")
             return None
 
-    def _is_duplicate_element(self, element_info: Dict, existing_elements: List[Dict]) -> bool:
-        """Check for duplicate elements more accurately"""
-        for existing in existing_elements:
-            if (existing['xpath'] == element_info['xpath'] or
-                (existing['unique_id'] == element_info['unique_id'] and
-                existing['tag_name'] == element_info['tag_name'] and
-                existing['text'] == element_info['text'])):
-                return True
+    def _is_duplicate_element(self, element_info: ElementInfo, seen_keys: Set[tuple]) -> bool:
+        """Check for duplicate elements more accurately, recording the element's keys when it is new"""
+        xpath_key = ('xpath', element_info.xpath)
+        content_key = (element_info.unique_id, element_info.tag_name, element_info.text)
+        if xpath_key in seen_keys or content_key in seen_keys:
+            return True
+        seen_keys.add(xpath_key)
+        seen_keys.add(content_key)
         return False
 
-    def find_clickable_elements(self, url: str) -> List[Dict]:
+    def find_clickable_elements(self, url: str) -> List[ElementInfo]:
         """Find all potentially clickable elements on the page"""
-        self.url = url
-        print(f"Loading URL: {url}")
-        self.driver.get(url)
-        
-        try:
-            WebDriverWait(self.driver, self.timeout).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-        except TimeoutException:
-            print("⚠️ Page load timeout - proceeding with available elements")
-        
-        time.sleep(5)  # Allow additional time for dynamic content
-
-        header_footer_selectors = [
-            'header', 'nav', 'footer',
-            '.header', '.nav', '.footer', '.navigation',
-            '#header', '#nav', '#footer', '#navigation',
-            '[role="banner"]', '[role="navigation"]', '[role="contentinfo"]',
-            '.site-header', '.site-footer', '.page-header', '.page-footer',
-            '.main-header', '.main-footer', '.top-nav', '.bottom-nav',
-            '.navbar', '.nav-bar', '.site-nav', '.primary-nav'
-        ]
+        self.set_url(url)
+        logger.info(f"Loading URL: {url}")
+        self._load_page(self.driver, url)
         
+        # Wait for the load, then for dynamic content to stop changing the DOM
+        self._wait_for_document_ready(self.driver)
+        self._wait_for_dom_quiet(self.driver)
+
         main_content_area = self._get_main_content_area()
-        carousel_elements = self._find_carousel_elements(main_content_area, header_footer_selectors)
-        clickable_elements = self._find_regular_clickables(main_content_area, header_footer_selectors)
+        carousel_elements = self._find_carousel_elements(main_content_area, self.HEADER_FOOTER_SELECTORS)
+        clickable_elements = self._find_regular_clickables(main_content_area, self.HEADER_FOOTER_SELECTORS)
         
         clickable_elements.extend(carousel_elements)
-        print(f"Found {len(clickable_elements)} potentially clickable elements")
+        self._resolve_status_codes(clickable_elements)
+        logger.info(f"Found {len(clickable_elements)} potentially clickable elements")
         return clickable_elements
 
-    def _find_carousel_elements(self, main_content_area, header_footer_selectors) -> List[Dict]:
+    def _find_carousel_elements(self, main_content_area, header_footer_selectors) -> List[ElementInfo]:
         """Find and process carousel elements"""
         carousel_elements = []
-        carousel_selectors = [
-            '.carousel', '.slider', '.banner-slider', '.swiper', '.slick',
-            '[data-ride="carousel"]', '.owl-carousel', '.hero-banner',
-            '.banner-container', '.slideshow', '.image-slider',
-            '.swiper-container', '.swiper-wrapper', '.glide', '.splide',
-            '.flickity', '.keen-slider', '.embla', '.tiny-slider',
-            '[data-carousel]', '[data-slider]', '[data-swiper]',
-            '.slide-container', '.carousel-container', '.slider-wrapper',
-            '.hero-slider', '.product-slider', '.testimonial-slider',
-            '.gallery-slider', '.content-slider', '.banner-carousel',
-            '.thumbnail__overlay'
-        ]
+        seen_keys: Set[tuple] = set()
+        # One query for every selector, keeping the displayed matches in the same call
+        try:
+            carousels = self.driver.execute_script(self._JS_FIND_CAROUSELS, main_content_area, self.CAROUSEL_CSS)
+        except Exception as e:
+            logger.error(f"Error finding carousel elements: {e}")
+            return carousel_elements
         
-        for selector in carousel_selectors:
+        for i, carousel in enumerate(carousels, 1):
             try:
-                carousels = (main_content_area.find_elements(By.CSS_SELECTOR, selector) 
-                            if main_content_area 
-                            else self.driver.find_elements(By.CSS_SELECTOR, selector))
-                
-                for carousel in carousels:
-                    try:
-                        if carousel.is_displayed() and not self._is_in_header_or_footer(carousel, header_footer_selectors):
-                            print(f"Processing carousel with selector: {selector}")
-                            carousel_elements.extend(self._handle_carousel_banner(carousel))
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception as e:
-                        print(f"Error processing carousel element: {e}")
+                if not self._is_in_header_or_footer(carousel, header_footer_selectors):
+                    logger.info(f"Processing carousel {i}/{len(carousels)}")
+                    # Nested carousel containers find the same slides again
+                    carousel_elements.extend(
+                        info for info in self._handle_carousel_banner(carousel)
+                        if not self._is_duplicate_element(info, seen_keys)
+                    )
+            except StaleElementReferenceException:
+                continue
             except Exception as e:
-                print(f"Error processing carousel selector '{selector}': {e}")
+                logger.error(f"Error processing carousel element: {e}")
         
         return carousel_elements
 
-    def _find_regular_clickables(self, main_content_area, header_footer_selectors) -> List[Dict]:
-        """Find regular clickable elements (non-carousel)"""
-        clickable_selectors = [
-            'a', 'button', 
-            'input[type="button"]', 'input[type="submit"]', 'input[type="reset"]',
-            '[onclick]', '[onmousedown]', '[onmouseup]', '[ondblclick]',
-            '[role="button"]', '[role="link"]', '[role="tab"]', '[role="menuitem"]',
-            '[role="option"]', '[role="treeitem"]', '[role="gridcell"]',
-            '[tabindex="0"]', '[tabindex="-1"]', 'div[tabindex]', 'span[tabindex]',
-            'li[tabindex]', 'td[tabindex]', 'th[tabindex]',
-            '.btn', '.button', '.link', '.clickable', '.click',
-            '.cta', '.call-to-action', '.action', '.trigger',
-            '.menu-item', '.nav-item', '.tab', '.accordion',
-            '.dropdown', '.select', '.picker', '.toggle',
-            '.card', '.tile', '.item', '.option',
-            '.close', '.cancel', '.submit', '.save', '.edit', '.delete',
-            '.expand', '.collapse', '.show', '.hide',
-            '.play', '.pause', '.stop', '.next', '.prev', '.previous',
-            '.like', '.share', '.favorite', '.bookmark',
-            '.download', '.upload', '.search', '.filter', '.sort',
-            '[data-action]', '[data-click]', '[data-href]', '[data-url]',
-            '[data-toggle]', '[data-target]', '[data-dismiss]',
-            '[data-testid*="button"]', '[data-testid*="link"]', '[data-testid*="click"]',
-            '[data-cy*="button"]', '[data-cy*="link"]', '[data-cy*="click"]',
-            'select', 'input[type="checkbox"]', 'input[type="radio"]',
-            'input[type="file"]', 'input[type="image"]',
-            '[class*="btn"]', '[class*="button"]', '[class*="link"]',
-            '[class*="click"]', '[class*="action"]', '[class*="cta"]',
-            '[id*="btn"]', '[id*="button"]', '[id*="link"]',
-            'video[controls]', 'audio[controls]',
-            'li[onclick]', 'td[onclick]', 'tr[onclick]',
-            'li[role="button"]', 'td[role="button"]', 'tr[role="button"]',
-            'svg[onclick]', 'svg[role="button"]',
-            'area', 'img[onclick]', 'img[role="button"]',
-            'div[role="button"]', 'span[role="button"]',
-            'p[role="button"]', 'section[role="button"]',
-            '.thumbnail__overlay'
-        ]
-        
-        unique_ids = set()
-        clickable_elements = []
-        
-        for selector in clickable_selectors:
-            try:
-                elements = (main_content_area.find_elements(By.CSS_SELECTOR, selector) 
-                          if main_content_area 
-                          else self.driver.find_elements(By.CSS_SELECTOR, selector))
-                
-                for element in elements:
-                    try:
-                        if (element.is_displayed() and element.is_enabled() and
-                            not self._is_in_header_or_footer(element, header_footer_selectors) and
-                            not self._is_carousel_element(element)):
-                                
-                            element_info = self._extract_element_info(element)
-                            if element_info and element_info['unique_id'] not in unique_ids:
-                                unique_ids.add(element_info['unique_id'])
-                                clickable_elements.append(element_info)
-                    except StaleElementReferenceException:
-                        continue
-                    except Exception as e:
-                        print(f"Error processing element: {e}")
-            except Exception as e:
-                print(f"Error finding elements with selector '{selector}': {e}")
-        
-        # Additional detection methods
-        clickable_elements.extend(self._find_elements_by_pointer_cursor(header_footer_selectors))
-        clickable_elements.extend(self._find_elements_by_event_listeners(header_footer_selectors))
-        
-        return clickable_elements
-
-    def _find_elements_by_pointer_cursor(self, header_footer_selectors) -> List[Dict]:
-        """Find elements with pointer cursor styling"""
-        elements = []
-        try:
-            pointer_elements = self.driver.execute_script("""
-                return Array.from(document.querySelectorAll('*')).filter(el => {
-                    return window.getComputedStyle(el).cursor === 'pointer' && 
-                           el.offsetWidth > 0 && 
-                           el.offsetHeight > 0;
-                });
-            """)
-            
-            for element in pointer_elements:
-                try:
-                    if (element.is_displayed() and element.is_enabled() and
-                        not self._is_in_header_or_footer(element, header_footer_selectors) and
-                        not self._is_carousel_element(element)):
-                            
-                        element_info = self._extract_element_info(element)
-                        if element_info:
-                            element_info['detection_method'] = 'pointer_cursor'
-                            elements.append(element_info)
-                except Exception:
-                    continue
-                    
-        except Exception as e:
-            print(f"Error finding pointer cursor elements: {e}")
-            
-        return elements
-
-    def _find_elements_by_event_listeners(self, header_footer_selectors) -> List[Dict]:
-        """Find elements with click event listeners"""
-        elements = []
-        try:
-            listener_elements = self.driver.execute_script("""
-                return Array.from(document.querySelectorAll('*')).filter(el => {
-                    return el.onclick || 
-                           el.onmousedown || 
-                           el.onmouseup ||
-                           el.getAttribute('onclick') ||
-                           el.hasAttribute('data-action') ||
-                           el.hasAttribute('data-click') ||
-                           el.hasAttribute('data-href');
-                });
-            """)
-            
-            for element in listener_elements:
-                try:
-                    if (element.is_displayed() and element.is_enabled() and
-                        not self._is_in_header_or_footer(element, header_footer_selectors) and
-                        not self._is_carousel_element(element)):
-                            
-                        element_info = self._extract_element_info(element)
-                        if element_info:
-                            element_info['detection_method'] = 'event_listener'
-                            elements.append(element_info)
-                except Exception:
-                    continue
-                    
-        except Exception as e:
-            print(f"Error finding event listener elements: {e}")
-            
-        return elements
-
     def _get_main_content_area(self) -> Optional[webdriver.remote.webelement.WebElement]:
         """Identify and return the main content area of the page"""
-        main_content_selectors = [
-            'main',
-            '[role="main"]',
-            '#main',
-            '#content',
-            '#main-content',
-            '.main-content',
-            '.content',
-            '.page-content',
-            '.site-content'
-        ]
+        # First displayed match, trying the selectors in order within one script call
+        try:
+            found = self.driver.execute_script(self._JS_MAIN_CONTENT_AREA, list(self.MAIN_CONTENT_SELECTORS))
+        except Exception:
+            found = None
         
-        for selector in main_content_selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if element.is_displayed():
-                    print(f"Found main content area using selector: {selector}")
-                    return element
-            except Exception:
-                continue
+        if found:
+            element, selector = found
+            logger.info(f"Found main content area using selector: {selector}")
+            return element
         
-        print("No specific main content area found, will use exclusion method")
+        logger.info("No specific main content area found, will use exclusion method")
         return None
     
     def _is_in_header_or_footer(self, element, header_footer_selectors) -> bool:
         """Check if an element is within header or footer sections"""
         try:
-            # Check element itself
-            element_tag = element.tag_name.lower()
-            if element_tag in ['header', 'nav', 'footer']:
-                return True
-            
-            # Check element attributes
-            element_class = element.get_attribute('class') or ''
-            element_id = element.get_attribute('id') or ''
-            element_role = element.get_attribute('role') or ''
-            
-            # Check for header/footer indicators
-            header_footer_keywords = [
-                'header', 'nav', 'navigation', 'navbar', 'nav-bar', 'footer',
-                'site-header', 'site-footer', 'page-header', 'page-footer',
-                'main-header', 'main-footer', 'top-nav', 'bottom-nav',
-                'primary-nav', 'secondary-nav', 'breadcrumb'
-            ]
-            
-            element_attributes = f"{element_class} {element_id}".lower()
-            if any(keyword in element_attributes for keyword in header_footer_keywords):
-                return True
-            
-            # Check ARIA roles
-            if element_role in ['banner', 'navigation', 'contentinfo']:
-                return True
-            
-            # Check parent elements
+            # The element and its ancestors, checked by the browser's selector engine
             return self.driver.execute_script("""
                 var element = arguments[0];
-                var current = element;
-                var keywords = ['header', 'nav', 'navigation', 'navbar', 'nav-belt', 
-                               'footer', 'navfooter', 'site-header', 'site-footer',
-                               'page-header', 'page-footer', 'main-header', 'main-footer'];
-                
-                while (current && current !== document.body) {
-                    var tagName = current.tagName ? current.tagName.toLowerCase() : '';
-                    var className = current.className || '';
-                    var id = current.id || '';
-                    var role = current.getAttribute('role') || '';
-                    
-                    // Check tag names
-                    if (['header', 'nav', 'footer'].includes(tagName)) return true;
-                    
-                    // Check roles
-                    if (['banner', 'navigation', 'contentinfo'].includes(role)) return true;
-                    
-                    // Check class names and IDs
-                    var attributes = (className + ' ' + id).toLowerCase();
-                    if (keywords.some(k => attributes.includes(k))) return true;
-                    
-                    current = current.parentElement;
-                }
-                
-                return false;
-            """, element)
+                return element.matches(arguments[2]) || element.closest(arguments[1]) !== null;
+            """, element, self._SECTION_CSS, self._ELEMENT_SECTION_CSS)
                 
         except Exception as e:
-            print(f"Error checking if element is in header/footer: {e}")
+            logger.error(f"Error checking if element is in header/footer: {e}")
             return False
     
-    def _is_carousel_element(self, element) -> bool:
-        """Check if element is part of a carousel that we've already processed"""
-        try:
-            return self.driver.execute_script("""
-                var element = arguments[0];
-                var current = element;
-                var carouselSelectors = [
-                    'carousel', 'slider', 'banner-slider', 'swiper', 'slick',
-                    'owl-carousel', 'hero-banner', 'banner-container', 'slideshow'
-                ];
-                
-                while (current && current !== document.body) {
-                    var className = current.className || '';
-                    if (carouselSelectors.some(sel => className.includes(sel)))) {
-                        return true;
-                    }
-                    current = current.parentElement;
-                }
-                return false;
-            """, element)
-        except Exception:
-            return False
-
-    def get_status_code(self, href: str) -> Optional[List[int]]:
-        """Return HTTP status code for the given href, or None if not applicable."""
-        if not href or href.startswith(('#', 'javascript:')):
-            return None
-            
-        try:
-            # Handle relative URLs
-            if href.startswith('/'):
-                href = urljoin(self.url, href)
-                
-            response = requests.head(href, allow_redirects=True, timeout=5)
-            return [r.status_code for r in response.history] + [response.status_code]
-        except Exception:
-            return None
-        
-    def _extract_element_info(self, element) -> Optional[Dict]:
+    def _extract_element_info(self, element) -> Optional[ElementInfo]:
         """Extract and deduplicate element info based on unique content signature."""
-        try:
-            # Extract key info
-            tag_name = element.tag_name
-            text = element.text.strip()[:100] if element.text else ''
-            class_names = element.get_attribute('class') or ''
-            href = element.get_attribute('href') or ''
-            onclick = element.get_attribute('onclick') or ''
-            element_id = element.get_attribute('id') or ''
-
-            # Create deduplication key
-            dedup_key = f"{tag_name}|{text}|{href}|{class_names}|{element_id}"
-            unique_id = hashlib.md5(dedup_key.encode()).hexdigest()
-
-            # Deduplication
-            if unique_id in self.seen_elements:
-                return None
-            self.seen_elements.add(unique_id)
-
-            # Final full element info
-            element_info = {
-                'tag_name': tag_name,
-                'text': text,
-                'class_names': class_names,
-                'id': element_id,
-                'href': href,
-                'onclick': onclick,
-                'status_code': self.get_status_code(href),
-                'role': element.get_attribute('role') or '',
-                'type': element.get_attribute('type') or '',
-                'data_testid': element.get_attribute('data-testid') or '',
-                'aria_label': element.get_attribute('aria-label') or '',
-                'title': element.get_attribute('title') or '',
-                'name': element.get_attribute('name') or '',
-                'value': element.get_attribute('value') or '',
-                'src': element.get_attribute('src') or '',
-                'alt': element.get_attribute('alt') or '',
-                'xpath': self._get_element_xpath(element),
-                'css_selector': self._get_element_css_selector(element),
-                'location': element.location,
-                'size': element.size,
-                'is_displayed': element.is_displayed(),
-                'is_enabled': element.is_enabled(),
-                'unique_id': unique_id
-            }
-
-            return element_info
+        return self._extract_element_infos([element])[0]
 
-        except Exception as e:
-            print(f"Error extracting element info: {e}")
-            return None
+    def _extract_element_infos(self, elements: List) -> List[Optional[ElementInfo]]:
+        """Extract info for many elements in one script call, deduplicating on content signature.
         
-    def _get_element_xpath(self, element) -> str:
-        """Generate XPath for an element"""
-        try:
-            return self.driver.execute_script("""
-                function getXPath(element) {
-                    if (element.id !== '') return '//*[@id=\"' + element.id + '\"]';
-                    if (element === document.body) return '/html/body';
-                    var ix = 0;
-                    var siblings = element.parentNode.childNodes;
-                    for (var i = 0; i < siblings.length; i++) {
-                        var sibling = siblings[i];
-                        if (sibling === element) return getXPath(element.parentNode) + '/' + element.tagName.toLowerCase() + '[' + (ix + 1) + ']';
-                        if (sibling.nodeType === 1 && sibling.tagName === element.tagName) ix++;
-                    }
-                }
-                return getXPath(arguments[0]);
-            """, element)
-        except Exception:
-            return "xpath_unavailable"
-    
-    def _get_element_css_selector(self, element) -> str:
-        """Generate a CSS selector for the element"""
+        Returns one entry per element, None for elements that failed or were already seen."""
+        if not elements:
+            return []
         try:
-            return self.driver.execute_script("""
-                function getCssSelector(el) {
-                    if (!(el instanceof Element)) return '';
-                    var path = [];
-                    while (el.nodeType === Node.ELEMENT_NODE) {
-                        var selector = el.nodeName.toLowerCase();
-                        if (el.id) {
-                            selector += '#' + el.id;
-                            path.unshift(selector);
-                            break;
-                        } else {
-                            var sib = el, nth = 1;
-                            while (sib = sib.previousElementSibling) {
-                                if (sib.nodeName.toLowerCase() == selector)
-                                    nth++;
-                            }
-                            if (nth != 1)
-                                selector += ":nth-of-type(" + nth + ")";
-                        }
-                        path.unshift(selector);
-                        el = el.parentNode;
-                    }
-                    return path.join(" > ");
-                }
-                return getCssSelector(arguments[0]);
-            """, element)
-        except Exception:
-            return "css_selector_unavailable"
-    
-    def _create_unique_id(self, element_info: Dict) -> int:
+            raw_infos = self.driver.execute_script(self._JS_EXTRACT_ELEMENT_INFOS, elements)
+        except Exception as e:
+            logger.error(f"Error extracting element info: {e}")
+            return [None] * len(elements)
+        return self._build_element_infos(raw_infos)
+
+    def _create_unique_id(self, element_info: ElementInfo) -> str:
         """Create a unique identifier for an element"""
-        components = [
-            element_info['tag_name'],
-            element_info['id'],
-            element_info['class_names'],
-            element_info['text'][:50],
-            str(element_info['location']),
-        ]
-        return hash('|'.join(str(c) for c in components))
+        location = element_info.location
+        return self._hash_key((
+            element_info.tag_name,
+            element_info.id,
+            element_info.class_names,
+            element_info.text[:50],
+            str(location['x']),
+            str(location['y']),
+        ))
     
-    def is_dead_click_by_href(self, element_info: Dict) -> bool:
+    def is_dead_click_by_href(self, element_info: ElementInfo) -> bool:
         """Returns True if the element is a dead click based on href."""
-        href = (element_info.get('href') or '').replace(' ', '').lower()
-        return href in ['javascript:void(0)', 'javascript::void(0)', '#', ' ']
+        return self._DEAD_HREF_RE.fullmatch(element_info.href) is not None
     
-    def test_element_click(self, element_info: Dict) -> Dict:
+    def test_element_click(self, element_info: ElementInfo) -> Dict:
         """Test if an element click is functional or dead - with carousel support"""
         result = {
             'element_info': element_info,
@@ -1167,7 +1668,7 @@ class ClickableElementTester:
             
             # Find the element
             element = (self._find_and_prepare_carousel_element(element_info) 
-                      if element_info.get('is_carousel_element', False) 
+                      if element_info.is_carousel_element 
                       else self._find_element_by_info(element_info))
             
             if not element:
@@ -1176,12 +1677,15 @@ class ClickableElementTester:
                 return result
             
             # For carousel elements, ensure they're visible before clicking
-            if element_info.get('is_carousel_element', False):
+            if element_info.is_carousel_element:
                 self._make_carousel_element_clickable(element)
             
             # Scroll element into view
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            time.sleep(1)
+            try:
+                WebDriverWait(self.driver, 2).until(EC.element_to_be_clickable(element))
+            except TimeoutException:
+                pass  # Reported as not_clickable below
             
             # Check if element is still clickable
             if not (element.is_displayed() and element.is_enabled()):
@@ -1189,6 +1693,8 @@ class ClickableElementTester:
                 result['error_message'] = 'Element is not displayed or enabled'
                 return result
             
+            initial_ui = self._count_displayed_ui(self.driver)
+            
             # Attempt to click the element
             try:
                 element.click()
@@ -1202,8 +1708,7 @@ class ClickableElementTester:
                     result['error_message'] = f'Click intercepted: {str(js_error)}'
                     return result
             
-            # Wait for changes
-            time.sleep(2)
+            self._wait_for_click_effect(self.driver, initial_url, initial_title, initial_ui)
             
             # Check for changes after click
             current_url = self.driver.current_url
@@ -1220,22 +1725,11 @@ class ClickableElementTester:
             elif current_title != initial_title:
                 result['click_status'] = 'active_title_change'
                 result['page_changed'] = True
+            elif self._count_displayed_ui(self.driver) > initial_ui:
+                result['click_status'] = 'active_ui_change'
+                result['new_elements_appeared'] = True
             else:
-                # Check for new elements or modals
-                try:
-                    modals = self.driver.find_elements(By.CSS_SELECTOR, 
-                        '.modal, .popup, .overlay, .dialog, [role="dialog"], [role="alertdialog"]')
-                    
-                    dropdowns = self.driver.find_elements(By.CSS_SELECTOR,
-                        '.dropdown-menu, .menu-open, [aria-expanded="true"]')
-                    
-                    if modals or dropdowns:
-                        result['click_status'] = 'active_ui_change'
-                        result['new_elements_appeared'] = True
-                    else:
-                        result['click_status'] = 'dead_click'
-                except Exception:
-                    result['click_status'] = 'dead_click'
+                result['click_status'] = 'dead_click'
             
         except TimeoutException:
             result['click_status'] = 'timeout'
@@ -1249,7 +1743,7 @@ class ClickableElementTester:
         
         return result
 
-    def _find_and_prepare_carousel_element(self, element_info: Dict) -> Optional[webdriver.remote.webelement.WebElement]:
+    def _find_and_prepare_carousel_element(self, element_info: ElementInfo) -> Optional[webdriver.remote.webelement.WebElement]:
         """Find carousel element and make it ready for clicking"""
         try:
             carousel_containers = self.driver.find_elements(By.CSS_SELECTOR, 
@@ -1266,29 +1760,12 @@ class ClickableElementTester:
             
             return None
         except Exception as e:
-            print(f"Error finding carousel element: {e}")
+            logger.error(f"Error finding carousel element: {e}")
             return None
 
-    def _find_element_by_info_in_container(self, element_info: Dict, container) -> Optional[webdriver.remote.webelement.WebElement]:
+    def _find_element_by_info_in_container(self, element_info: ElementInfo, container) -> Optional[webdriver.remote.webelement.WebElement]:
         """Find element within a specific container"""
-        strategies = [
-            (By.ID, element_info['id']) if element_info['id'] else None,
-            (By.XPATH, element_info['xpath']) if element_info['xpath'] != 'xpath_unavailable' else None,
-            (By.CSS_SELECTOR, f".{element_info['class_names'].replace(' ', '.')}") if element_info['class_names'] else None,
-        ]
-        
-        for strategy in strategies:
-            if strategy:
-                try:
-                    elements = container.find_elements(*strategy)
-                    for element in elements:
-                        if (element.tag_name == element_info['tag_name'] and
-                            element.text.strip()[:100] == element_info['text']):
-                            return element
-                except Exception:
-                    continue
-        
-        return None
+        return self._lookup_element(self.driver, element_info, root=container, require_displayed=False)
 
     def _make_carousel_element_clickable(self, element) -> None:
         """Make a carousel element visible and clickable"""
@@ -1308,156 +1785,176 @@ class ClickableElementTester:
                 }
             """, element)
             
-            time.sleep(0.5)  # Allow styles to apply
+            try:
+                WebDriverWait(self.driver, 1).until(lambda d: element.is_displayed())
+            except TimeoutException:
+                pass  # Reported as not_clickable by the caller
         except Exception as e:
-            print(f"Error making carousel element clickable: {e}")
+            logger.error(f"Error making carousel element clickable: {e}")
 
-    def _find_element_by_info(self, element_info: Dict) -> Optional[webdriver.remote.webelement.WebElement]:
+    def _find_element_by_info(self, element_info: ElementInfo) -> Optional[webdriver.remote.webelement.WebElement]:
         """Find element using stored information"""
-        strategies = [
-            (By.ID, element_info['id']) if element_info['id'] else None,
-            (By.XPATH, element_info['xpath']) if element_info['xpath'] != 'xpath_unavailable' else None,
-            (By.CSS_SELECTOR, f".{element_info['class_names'].replace(' ', '.')}") if element_info['class_names'] else None,
-        ]
-        
-        for strategy in strategies:
-            if strategy:
-                try:
-                    elements = self.driver.find_elements(*strategy)
-                    for element in elements:
-                        if (element.is_displayed() and 
-                            element.tag_name == element_info['tag_name'] and
-                            element.text.strip()[:100] == element_info['text']):
-                            return element
-                except Exception:
-                    continue
-        
-        return None
+        return self._lookup_element(self.driver, element_info)
 
     def run_comprehensive_test(self, url: str) -> Dict:
-        """Run comprehensive test on all clickable elements"""
-        print(f"\n{'='*60}")
-        print(f"Starting Comprehensive Clickability Test")
-        print(f"URL: {url}")
-        print(f"Timestamp: {datetime.now()}")
-        print(f"{'='*60}\n")
+        """Run comprehensive test on all clickable elements
+        
+        With more than one worker the elements are spread over the driver pool,
+        as in run_comprehensive_test_concurrent; otherwise they are tested in turn
+        on the main driver.
+        """
+        if self.max_workers > 1:
+            return self.run_comprehensive_test_concurrent(url)
+        
+        started_at = datetime.now()
+        logger.info(f"\n{'='*60}\n"
+                    f"Starting Comprehensive Clickability Test\n"
+                    f"URL: {url}\n"
+                    f"Timestamp: {started_at}\n"
+                    f"{'='*60}\n")
         
         try:
             clickable_elements = self.find_clickable_elements(url)
+            total_found = len(clickable_elements)
+            clickable_elements = self._sample_elements(clickable_elements)
             
             test_results = {
                 'url': url,
-                'total_elements_found': len(clickable_elements),
+                'total_elements_found': total_found,
+                'sampled': len(clickable_elements) < total_found,
                 'elements_tested': 0,
                 'active_clicks': 0,
                 'dead_clicks': 0,
                 'errors': 0,
                 'results': [],
                 'summary': {},
-                'timestamp': datetime.now().isoformat()
+                'timestamp': started_at.isoformat()
             }
             
+            # find_clickable_elements left the page loaded; elements reuse it
+            # unless a click leaves it
+            base_url = self.driver.current_url
             for i, element_info in enumerate(clickable_elements, 1):
-                print(f"\nTesting element {i}/{len(clickable_elements)}")
-                print(f"Tag: {element_info['tag_name']}, "
-                      f"Class: {element_info['class_names'][:50]}{'...' if len(element_info['class_names']) > 50 else ''}, "
-                      f"Text: {element_info['text'][:30]}{'...' if len(element_info['text']) > 30 else ''}")
-                
-                self.driver.get(url)  # Ensure we're on the correct page
-                time.sleep(2)  # Allow page to load        
+                logger.info(f"\nTesting element {i}/{len(clickable_elements)}\n"
+                            f"Tag: {element_info.tag_name}, "
+                            f"Class: {_truncate(element_info.class_names, 50)}, "
+                            f"Text: {_truncate(element_info.text, 30)}")
                 
                 # Go back to original page if we navigated away
-                if self.driver.current_url != url:
-                    print("Returning to original page...")
-                    self.driver.get(url)
-                    time.sleep(2)
+                if self.driver.current_url != base_url:
+                    logger.info("Returning to original page...")
+                    self._load_page(self.driver, url)
+                    self._wait_for_document_ready(self.driver)
                 
                 result = self.test_element_click(element_info)
+                status = result['click_status']
+                # Step back through history instead of reloading the page
+                if result['page_changed'] and self.driver.current_url != base_url:
+                    self._return_to_page(self.driver, url, base_url)
+                elif status == 'active_ui_change':
+                    # Close what the click opened rather than reloading the page
+                    self._dismiss_ui_changes(self.driver)
                 test_results['results'].append(result)
                 test_results['elements_tested'] += 1
                 
-                # Update counters
-                if result['click_status'].startswith('active'):
-                    test_results['active_clicks'] += 1
-                    print(f"✅ ACTIVE: {result['click_status']}")
-                elif result['click_status'] == 'dead_click':
-                    test_results['dead_clicks'] += 1
-                    print(f"❌ DEAD CLICK")
+                # Log result
+                if status.startswith('active'):
+                    logger.info(f"✅ ACTIVE: {status}")
+                elif status == 'dead_click':
+                    logger.info(f"❌ DEAD CLICK")
                 else:
-                    test_results['errors'] += 1
-                    print(f"⚠️  ERROR: {result['click_status']} - {result['error_message']}")
+                    logger.info(f"⚠️  ERROR: {status} - {result['error_message']}")
             
-            # Generate summary
+            # Generate summary, which also counts the results
             test_results['summary'] = self._generate_summary(test_results)
             
             return test_results
             
         except Exception as e:
-            print(f"Error during comprehensive test: {e}")
+            logger.error(f"Error during comprehensive test: {e}")
             return {'error': str(e)}
     
+    def _sample_elements(self, elements: List[ElementInfo]) -> List[ElementInfo]:
+        """A random sample of max_samples elements, kept in page order, or all of them"""
+        if self.max_samples is None or len(elements) <= self.max_samples:
+            return elements
+        logger.info(f"Sampling {self.max_samples} of {len(elements)} elements for click testing")
+        return [elements[i] for i in sorted(random.sample(range(len(elements)), self.max_samples))]
+    
     def _generate_summary(self, test_results: Dict) -> Dict:
-        """Generate test summary statistics"""
+        """Generate test summary statistics, filling in the run's active/dead/error counts"""
+        # Class and status tallies gathered in one walk over the results
+        class_counts = Counter()
+        status_counts = Counter()
+        for result in test_results['results']:
+            status_counts[result['click_status']] += 1
+            class_counts.update(_class_tokens(result['element_info'].class_names))
+        
+        # Derived from the few distinct statuses rather than tallied per element
         total = test_results['elements_tested']
-        return {
+        test_results['active_clicks'] = sum(count for status, count in status_counts.items()
+                                            if status.startswith('active'))
+        test_results['dead_clicks'] = status_counts['dead_click']
+        test_results['errors'] = total - test_results['active_clicks'] - test_results['dead_clicks']
+        summary = {
             'total_tested': total,
             'active_percentage': round((test_results['active_clicks'] / total) * 100, 2) if total > 0 else 0,
             'dead_percentage': round((test_results['dead_clicks'] / total) * 100, 2) if total > 0 else 0,
             'error_percentage': round((test_results['errors'] / total) * 100, 2) if total > 0 else 0,
-            'most_common_classes': self._get_most_common_classes(test_results['results']),
-            'click_status_breakdown': self._get_click_status_breakdown(test_results['results'])
+            # most_common(10) picks the top ten with a heap instead of sorting every class
+            'most_common_classes': class_counts.most_common(10),
+            'click_status_breakdown': dict(status_counts)
         }
-    
-    def _get_most_common_classes(self, results: List[Dict]) -> List[tuple]:
-        """Get most common class names from tested elements"""
-        class_counts = {}
-        for result in results:
-            classes = result['element_info']['class_names']
-            if classes:
-                for class_name in classes.split():
-                    class_counts[class_name] = class_counts.get(class_name, 0) + 1
-        
-        return sorted(class_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-    
-    def _get_click_status_breakdown(self, results: List[Dict]) -> Dict:
-        """Get breakdown of click statuses"""
-        status_counts = {}
-        for result in results:
-            status = result['click_status']
-            status_counts[status] = status_counts.get(status, 0) + 1
         
-        return status_counts
+        # A sample's active rate is an estimate; report its 95% margin of error,
+        # narrowed by the finite-population correction for the elements found
+        found = test_results['total_elements_found']
+        if test_results.get('sampled') and total > 0 and found > 1:
+            active = test_results['active_clicks'] / total
+            margin = 1.96 * math.sqrt(active * (1 - active) / total) * math.sqrt((found - total) / (found - 1))
+            summary['sample_margin_of_error'] = round(margin * 100, 2)
+        return summary
     
     def print_detailed_report(self, test_results: Dict) -> None:
         """Print detailed test report"""
-        print(f"\n{'='*80}")
-        print(f"DETAILED TEST REPORT")
-        print(f"{'='*80}")
+        # Collect the whole report and write it at once instead of line by line
+        lines = []
+        append = lines.append
+        summary = test_results['summary']
+        append(f"\n{'='*80}")
+        append(f"DETAILED TEST REPORT")
+        append(f"{'='*80}")
         
-        print(f"\n📊 SUMMARY STATISTICS:")
-        print(f"   Total Elements Found: {test_results['total_elements_found']}")
-        print(f"   Elements Tested: {test_results['elements_tested']}")
-        print(f"   Active Clicks: {test_results['active_clicks']} ({test_results['summary']['active_percentage']}%)")
-        print(f"   Dead Clicks: {test_results['dead_clicks']} ({test_results['summary']['dead_percentage']}%)")
-        print(f"   Errors: {test_results['errors']} ({test_results['summary']['error_percentage']}%)")
+        append(f"\n📊 SUMMARY STATISTICS:")
+        append(f"   Total Elements Found: {test_results['total_elements_found']}")
+        append(f"   Elements Tested: {test_results['elements_tested']}")
+        if 'sample_margin_of_error' in summary:
+            append(f"   Sampled: {test_results['elements_tested']} of {test_results['total_elements_found']} "
+                   f"(active rate ±{summary['sample_margin_of_error']}% at 95% confidence)")
+        append(f"   Active Clicks: {test_results['active_clicks']} ({summary['active_percentage']}%)")
+        append(f"   Dead Clicks: {test_results['dead_clicks']} ({summary['dead_percentage']}%)")
+        append(f"   Errors: {test_results['errors']} ({summary['error_percentage']}%)")
         
-        print(f"\n🏷️  MOST COMMON CLASSES:")
-        for class_name, count in test_results['summary']['most_common_classes'][:5]:
-            print(f"   {class_name}: {count}")
+        append(f"\n🏷️  MOST COMMON CLASSES:")
+        for class_name, count in summary['most_common_classes'][:5]:
+            append(f"   {class_name}: {count}")
         
-        print(f"\n📈 CLICK STATUS BREAKDOWN:")
-        for status, count in test_results['summary']['click_status_breakdown'].items():
-            print(f"   {status}: {count}")
+        append(f"\n📈 CLICK STATUS BREAKDOWN:")
+        for status, count in summary['click_status_breakdown'].items():
+            append(f"   {status}: {count}")
         
-        print(f"\n🔍 DETAILED RESULTS:")
+        append(f"\n🔍 DETAILED RESULTS:")
         for i, result in enumerate(test_results['results'][:10], 1):
             element = result['element_info']
-            print(f"\n   [{i}] {element['tag_name'].upper()}")
-            print(f"       Class: {element['class_names'][:80]}")
-            print(f"       Text: {element['text'][:80]}")
-            print(f"       Status: {result['click_status']}")
+            append(f"\n   [{i}] {element.tag_name.upper()}")
+            append(f"       Class: {element.class_names[:80]}")
+            append(f"       Text: {element.text[:80]}")
+            append(f"       Status: {result['click_status']}")
             if result['error_message']:
-                print(f"       Error: {result['error_message']}")
+                append(f"       Error: {result['error_message']}")
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     
     def save_results_to_file(self, test_results: Dict, filename: str = None) -> None:
         """Save test results to JSON file"""
@@ -1466,40 +1963,224 @@ class ClickableElementTester:
             filename = f"clickability_test_results_{name}.json"
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(test_results, f, indent=2, ensure_ascii=False)
-            print(f"\n💾 Results saved to: {filename}")
+            try:
+                import orjson  # Optional; serialises ElementInfo dataclasses natively, straight to UTF-8
+                data = orjson.dumps(test_results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except ImportError:
+                data = json.dumps(test_results, indent=2, ensure_ascii=False, default=asdict).encode('utf-8')
+            with open(filename, 'wb') as f:
+                f.write(data)
+            logger.info(f"\n💾 Results saved to: {filename}")
         except Exception as e:
-            print(f"Error saving results: {e}")
+            logger.error(f"Error saving results: {e}")
     
     def close(self) -> None:
-        """Close the browser driver"""
-        if self.driver:
-            self.driver.quit()
-            print("Browser closed.")
+        """Close the browser driver, the concurrent driver pool and the worker threads"""
+        self._shutdown_executors()
+        if getattr(self, 'driver_pool', None):
+            self._close_driver_pool(self.driver_pool)
+            self.driver_pool = []
+            self._driver_uses = []
+        driver = getattr(self, 'driver', None)
+        if driver:
+            self.driver = None
+            try:
+                driver.quit()
+                logger.debug("Browser closed.")
+            except Exception as e:
+                logger.error(f"Error closing browser: {e}")
+                self._kill_driver_processes(driver)
+    
+    def __enter__(self) -> 'ClickableElementTester':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __del__(self):
+        # Last resort for testers that were never closed; close() is a no-op once it has run
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class _PlaywrightDriver:
+    """The part of the WebDriver API the discovery helpers use, over a Playwright page"""
+    
+    # Wraps a WebDriver-style script body, so `arguments` and `return` mean the same
+    # thing. The wrapper is built here rather than with new Function() in the page,
+    # which a Content-Security-Policy without 'unsafe-eval' would refuse.
+    _RUN_SCRIPT = "args => (function() {\n%s\n}).apply(null, args)"
+    
+    def __init__(self, page, error_type: type):
+        self.page = page
+        self._error_type = error_type
+    
+    def execute_script(self, script: str, *args):
+        try:
+            return self.page.evaluate(self._RUN_SCRIPT % script, list(args))
+        except self._error_type as e:
+            # Keep the callers' WebDriverException handling working unchanged
+            raise WebDriverException(str(e)) from e
+    
+    def evaluate_handle(self, script: str, *args):
+        return self.page.evaluate_handle(self._RUN_SCRIPT % script, list(args))
+
+
+class PlaywrightClickableTester(_ClickableDiscovery):
+    """Clickable element discovery on Playwright instead of WebDriver
+    
+    Playwright talks to the browser over one pipe rather than an HTTP request per
+    command, and discovery is already a handful of page scripts, so this runs the
+    same _ClickableDiscovery steps. It only finds elements: the carousel scan and
+    the click tests hold WebElements across many calls and stay on
+    ClickableElementTester. Requires the optional playwright package.
+    """
+    
+    def __init__(self, headless: bool = True, timeout: int = 10, block_resources: bool = False):
+        from playwright.sync_api import sync_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+        
+        self.timeout = timeout
+        self.block_resources = block_resources
+        self.headless = headless
+        self._setup_discovery_state()
+        
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(headless=headless)
+        page = self._browser.new_page(viewport={'width': 1920, 'height': 1080})
+        page.set_default_timeout(timeout * 1000)
+        if block_resources:
+            page.route("**/*", lambda route: route.abort()
+                       if route.request.resource_type in ('image', 'font', 'media')
+                       else route.continue_())
+        self._timeout_error = PlaywrightTimeout
+        self.driver = _PlaywrightDriver(page, PlaywrightError)
+    
+    def find_clickable_elements(self, url: str) -> List[ElementInfo]:
+        """Find the potentially clickable elements on the page, outside carousels"""
+        self.set_url(url)
+        logger.info(f"Loading URL: {url}")
+        try:
+            self.driver.page.goto(url, wait_until='domcontentloaded' if self.block_resources else 'load')
+        except self._timeout_error:
+            logger.warning(f"⚠️ Page load timeout for {url} - proceeding with available elements")
+            self.driver.execute_script("window.stop()")
+        self._wait_for_dom_quiet(self.driver)
+        
+        clickable_elements = self._find_regular_clickables(
+            self._get_main_content_area(), self.HEADER_FOOTER_SELECTORS)
+        self._resolve_status_codes(clickable_elements)
+        logger.info(f"Found {len(clickable_elements)} potentially clickable elements")
+        return clickable_elements
+    
+    def _get_main_content_area(self):
+        """Identify the main content area, as an element handle the page scripts accept"""
+        try:
+            found = self.driver.evaluate_handle(self._JS_MAIN_CONTENT_AREA, list(self.MAIN_CONTENT_SELECTORS))
+            selector = found.evaluate("found => found && found[1]")
+        except Exception:
+            selector = None
+        
+        if selector:
+            logger.info(f"Found main content area using selector: {selector}")
+            return found.evaluate_handle("found => found[0]").as_element()
+        
+        logger.info("No specific main content area found, will use exclusion method")
+        return None
+    
+    def close(self) -> None:
+        """Close the browser and stop Playwright"""
+        self._shutdown_executors()
+        playwright = getattr(self, '_playwright', None)
+        if playwright:
+            self._playwright = None
+            self.driver = None
+            try:
+                self._browser.close()
+                logger.debug("Browser closed.")
+            except Exception as e:
+                logger.error(f"Error closing browser: {e}")
+            playwright.stop()
+    
+    def __enter__(self) -> 'PlaywrightClickableTester':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Each scan_urls worker process keeps one tester (and Chrome) for all its URLs
+_worker_tester: Optional[ClickableElementTester] = None
+
+
+def _init_scan_worker(headless: bool, timeout: int) -> None:
+    """Start the worker process's tester, closed again when the worker exits"""
+    global _worker_tester
+    _worker_tester = ClickableElementTester(headless=headless, timeout=timeout, max_workers=1)
+    Finalize(_worker_tester, _worker_tester.close, exitpriority=10)
+
+
+def _scan_one(url: str) -> List[ElementInfo]:
+    """Find the clickable elements of one URL with the worker's tester"""
+    try:
+        return _worker_tester.find_clickable_elements(url)
+    except Exception as e:
+        logger.error(f"Error scanning {url}: {e}")
+        return []
+
+
+def scan_urls(urls: List[str], processes: Optional[int] = None, headless: bool = True,
+              timeout: int = 10) -> Dict[str, List[ElementInfo]]:
+    """
+    Find the clickable elements of many URLs in parallel, one Chrome per worker process
+    
+    Args:
+        urls: Pages to scan
+        processes: Number of worker processes (default: CPU count)
+        headless: Run the worker browsers in headless mode
+        timeout: Default timeout for operations
+    """
+    pool = multiprocessing.Pool(processes=processes, initializer=_init_scan_worker,
+                                initargs=(headless, timeout))
+    try:
+        results = pool.map(_scan_one, urls)
+    finally:
+        # close/join rather than terminate, so each worker's Finalize quits its browser
+        pool.close()
+        pool.join()
+    return dict(zip(urls, results))
+
 
 def main():
     """Main function to run the concurrent clickable element tester"""
-    test_url = "https://www.bajajfinserv.in/gold-loan"
-    # test_url = "https://cont-sites.bajajfinserv.in/personal-loan"
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    test_urls = [
+        "https://www.bajajfinserv.in/gold-loan",
+        # "https://cont-sites.bajajfinserv.in/personal-loan",
+    ]
     
     try:
-        # Initialize with 3 concurrent workers
-        tester = ClickableElementTester(headless=False, timeout=10, max_workers=3)
-        
-        # Run concurrent test
-        results = tester.run_comprehensive_test_concurrent(test_url)
-        
-        # Print and save results
-        tester.print_detailed_report(results)
-        tester.save_results_to_file(results)
+        # Initialize with 3 concurrent headless workers that skip images, fonts and
+        # trackers; leaving the block closes every browser
+        with ClickableElementTester(headless=True, timeout=10, max_workers=3,
+                                    block_resources=True) as tester:
+            # One tester for every URL, so its browsers and threads start only once
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix='save') as writer:
+                for test_url in test_urls:
+                    # Run concurrent test
+                    results = tester.run_comprehensive_test_concurrent(test_url)
+                    
+                    # Save in the background while the report prints; they share no
+                    # state, but the save must finish before the next URL changes tester.url
+                    saving = writer.submit(tester.save_results_to_file, results)
+                    tester.print_detailed_report(results)
+                    saving.result()
         
     except KeyboardInterrupt:
-        print("\nTest interrupted by user.")
+        logger.info("\nTest interrupted by user.")
     except Exception as e:
-        print(f"Test failed with error: {e}")
-    finally:
-        tester.close()
+        logger.error(f"Test failed with error: {e}")
 
 if __name__ == "__main__":
     main()